@@ -0,0 +1,130 @@
+"""実績（マイルストーン）の判定を管理するモジュール"""
+
+import json
+from bisect import bisect_right
+
+# 実績の判定に使うイベント（値はいずれも「これまでの到達値」）
+EVENT_ENGLISH_POWER = "english_power"  # 現在の English Power
+EVENT_LEVEL = "level"                  # プレイヤーレベル
+EVENT_KEYSTROKES = "keystrokes"        # 正しい入力の累計
+EVENT_SENTENCES = "sentences"          # 完了した文章の累計
+EVENT_CLEAN_STREAK = "clean_streak"    # ミスなしで完了した文章の連続数
+EVENT_PURCHASES = "purchases"          # アップグレード購入の累計
+EVENT_TYPES = (
+    EVENT_ENGLISH_POWER, EVENT_LEVEL, EVENT_KEYSTROKES,
+    EVENT_SENTENCES, EVENT_CLEAN_STREAK, EVENT_PURCHASES,
+)
+
+
+class EventBus:
+    """ゲーム内イベントの発行と購読を仲介するクラス"""
+
+    def __init__(self):
+        self._subscribers = {}
+
+    def subscribe(self, event, callback):
+        """イベントを購読
+
+        Args:
+            event (str): イベント名
+            callback (Callable[[object], None]): イベントの値を受け取る関数
+        """
+        self._subscribers.setdefault(event, []).append(callback)
+
+    def publish(self, event, value):
+        """イベントを発行（購読者がいなければ何もしない）"""
+        for callback in self._subscribers.get(event, ()):
+            callback(value)
+
+
+class AchievementDef:
+    """実績の定義（data/achievements.json の1項目）"""
+
+    __slots__ = ('id', 'name', 'description', 'event', 'threshold')
+
+    def __init__(self, data):
+        self.id = data['id']
+        self.name = data['name']
+        self.description = data.get('description', "")
+        self.event = data['event']
+        self.threshold = data['threshold']
+        if self.event not in EVENT_TYPES:
+            raise ValueError(f"achievement '{self.id}': unknown event '{self.event}'")
+
+
+class _RuleTable:
+    """1種類のイベントの実績を、しきい値の昇順に並べた表
+
+    これまでに到達した位置（cursor）より先だけを調べる。値がしきい値に
+    届かない大半のイベントは比較1回で終わり、届いた場合も二分探索で範囲を求める。
+    """
+
+    __slots__ = ('thresholds', 'defs', 'cursor', 'tracker')
+
+    def __init__(self, defs, tracker):
+        self.defs = sorted(defs, key=lambda d: d.threshold)
+        self.thresholds = [d.threshold for d in self.defs]
+        self.cursor = 0
+        self.tracker = tracker
+
+    def check(self, value):
+        """イベントの値で解除される実績を判定"""
+        cursor = self.cursor
+        if cursor >= len(self.thresholds) or value < self.thresholds[cursor]:
+            return
+        end = bisect_right(self.thresholds, value, cursor)
+        self.cursor = end
+        for idx in range(cursor, end):
+            self.tracker.unlock(self.defs[idx])
+
+
+class AchievementTracker:
+    """実績の解除状態を管理するクラス
+
+    実績はイベントの種類ごとに _RuleTable へ振り分けておき、
+    EventBus から届いたイベントは該当する表だけで判定する。
+    """
+
+    def __init__(self, defs, unlocked, on_unlock=None):
+        """
+        Args:
+            defs (list[AchievementDef]): 実績の定義
+            unlocked (set[str]): 解除済みの実績ID（GameState と共有し、解除時に追加する）
+            on_unlock (Callable[[AchievementDef], None] | None): 新たに解除されたときの通知先
+        """
+        self.defs = defs
+        self.unlocked = unlocked
+        self.on_unlock = on_unlock
+        by_event = {}
+        for definition in defs:
+            by_event.setdefault(definition.event, []).append(definition)
+        self.tables = {event: _RuleTable(items, self) for event, items in by_event.items()}
+
+    @classmethod
+    def load(cls, path, unlocked, on_unlock=None):
+        """JSONファイルから実績の定義を読み込む
+
+        Args:
+            path (str): achievements.json のパス
+            unlocked (set[str]): 解除済みの実績ID
+            on_unlock (Callable[[AchievementDef], None] | None): 解除時の通知先
+
+        Returns:
+            AchievementTracker: 構築したトラッカー
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls([AchievementDef(entry) for entry in data['achievements']], unlocked, on_unlock)
+
+    def attach(self, bus):
+        """実績があるイベントだけを購読"""
+        for event, table in self.tables.items():
+            bus.subscribe(event, table.check)
+
+    def unlock(self, definition):
+        """実績を解除（解除済みなら何もしない）"""
+        if definition.id in self.unlocked:
+            return
+        self.unlocked.add(definition.id)
+        if self.on_unlock is not None:
+            self.on_unlock(definition)
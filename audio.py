@@ -0,0 +1,162 @@
+"""効果音の読み込みと再生を管理するモジュール"""
+
+import math
+import os
+import random
+from array import array
+
+import pygame
+
+SOUND_NAMES = ("keystroke", "error", "purchase", "level_up")
+
+
+class AudioManager:
+    """効果音を管理するクラス
+
+    効果音は起動時にデコード済みの Sound バッファとして用意し、
+    予約済みのチャンネルを順番に使い回して再生する。再生処理は
+    チャンネルを選んで play を呼ぶだけで、メモリ確保や待機は発生しない。
+    """
+
+    def __init__(self, config):
+        """
+        Args:
+            config (Config): ゲーム設定（pygame.init() より前に pre_init を呼ぶこと）
+        """
+        self.config = config
+        self.enabled = False
+        self.sounds = {}
+        self._keystroke_channels = []
+        self._effect_channels = []
+        self._next_keystroke = 0
+        self._next_effect = 0
+
+    @staticmethod
+    def pre_init(config):
+        """ミキサーを低レイテンシ設定で初期化するよう予約（pygame.init() の前に呼ぶ）"""
+        pygame.mixer.pre_init(
+            frequency=config.AUDIO_FREQUENCY,
+            size=-16,
+            channels=2,
+            buffer=config.AUDIO_BUFFER,
+        )
+
+    def load(self):
+        """ミキサーを開始し、効果音の用意とチャンネルの予約を行う
+
+        オーディオデバイスが使えない環境では無音のまま続行する。
+        """
+        if not self.config.AUDIO_ENABLED:
+            return
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            mixer_format = pygame.mixer.get_init()
+            if mixer_format is None:
+                return
+            self.sounds = self._load_sounds(mixer_format)
+        except pygame.error:
+            return
+
+        keystroke_count = self.config.AUDIO_KEYSTROKE_CHANNELS
+        effect_count = self.config.AUDIO_EFFECT_CHANNELS
+        total = keystroke_count + effect_count
+        pygame.mixer.set_num_channels(max(total, pygame.mixer.get_num_channels()))
+        pygame.mixer.set_reserved(total)
+        channels = [pygame.mixer.Channel(i) for i in range(total)]
+        self._keystroke_channels = channels[:keystroke_count]
+        self._effect_channels = channels[keystroke_count:]
+        self.enabled = bool(self.sounds) and keystroke_count > 0 and effect_count > 0
+
+    def _load_sounds(self, mixer_format):
+        """効果音を用意（assets/sounds/<名前>.wav があればそれを、なければ合成）"""
+        sound_dir = os.path.join(os.path.dirname(__file__), "assets", "sounds")
+        volume = self.config.AUDIO_VOLUME
+        sounds = {}
+        for name in SOUND_NAMES:
+            path = os.path.join(sound_dir, f"{name}.wav")
+            if os.path.exists(path):
+                sound = pygame.mixer.Sound(path)
+            else:
+                sound = _synthesize(name, mixer_format)
+                if sound is None:
+                    continue
+            sound.set_volume(volume)
+            sounds[name] = sound
+        return sounds
+
+    def set_volume(self, volume):
+        """全効果音の音量を変更
+
+        Args:
+            volume (float): 0.0 ~ 1.0
+        """
+        for sound in self.sounds.values():
+            sound.set_volume(volume)
+
+    def play_keystroke(self):
+        """打鍵音を再生"""
+        if not self.enabled:
+            return
+        sound = self.sounds.get("keystroke")
+        if sound is None:
+            return
+        channels = self._keystroke_channels
+        index = self._next_keystroke
+        self._next_keystroke = (index + 1) % len(channels)
+        channels[index].play(sound)
+
+    def play(self, name):
+        """打鍵音以外の効果音を再生
+
+        Args:
+            name (str): "error" / "purchase" / "level_up"
+        """
+        if not self.enabled:
+            return
+        sound = self.sounds.get(name)
+        if sound is None:
+            return
+        channels = self._effect_channels
+        index = self._next_effect
+        self._next_effect = (index + 1) % len(channels)
+        channels[index].play(sound)
+
+
+# 効果音ごとの (周波数Hz | None=ノイズ, 開始秒, 長さ秒, 減衰率) の並び
+_SOUND_NOTES = {
+    "keystroke": ((None, 0.0, 0.03, 160.0),),
+    "error": ((140.0, 0.0, 0.12, 18.0), (147.0, 0.0, 0.12, 18.0)),
+    "purchase": ((880.0, 0.0, 0.08, 25.0), (1320.0, 0.07, 0.12, 20.0)),
+    "level_up": (
+        (523.3, 0.0, 0.12, 12.0), (659.3, 0.1, 0.12, 12.0),
+        (784.0, 0.2, 0.12, 12.0), (1046.5, 0.3, 0.25, 8.0),
+    ),
+}
+
+
+def _synthesize(name, mixer_format):
+    """効果音を合成して Sound を作る（16bit 以外のミキサーでは None）"""
+    frequency, size, channels = mixer_format
+    if size != -16:
+        return None
+    notes = _SOUND_NOTES[name]
+    length = int(frequency * max(start + duration for _, start, duration, _ in notes))
+    mono = [0.0] * length
+    rng = random.Random(name)
+    for note_freq, start, duration, decay in notes:
+        offset = int(frequency * start)
+        for i in range(min(int(frequency * duration), length - offset)):
+            t = i / frequency
+            if note_freq is None:
+                wave = rng.uniform(-1.0, 1.0)
+            else:
+                wave = math.sin(2 * math.pi * note_freq * t)
+            mono[offset + i] += wave * math.exp(-decay * t)
+
+    peak = max(1.0, max(abs(v) for v in mono))
+    samples = array('h')
+    for value in mono:
+        sample = int(value / peak * 32767 * 0.8)
+        samples.extend([sample] * channels)
+    return pygame.mixer.Sound(buffer=samples.tobytes())
@@ -0,0 +1,4 @@
+"""性能計測用スクリプト群
+
+リポジトリ直下から ``python -m benchmarks.<name>`` で実行する。
+"""
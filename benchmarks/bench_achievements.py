@@ -0,0 +1,82 @@
+"""実績判定のコスト計測
+
+実績の数を増やしながら、打鍵・English Power 加算に相当するイベントを
+大量に発行し、イベント1件あたりの判定時間が実績数に依存しないことを確認する。
+比較として、全実績の条件を毎回調べる方法の時間も表示する。
+
+    python -m benchmarks.bench_achievements
+"""
+
+import random
+import time
+
+from achievements import (
+    EVENT_ENGLISH_POWER, EVENT_KEYSTROKES, EVENT_TYPES, AchievementDef, AchievementTracker,
+    EventBus,
+)
+
+RULE_COUNTS = (10, 1000, 100000)
+EVENTS = 200000
+
+
+def _make_defs(count, rng):
+    """しきい値がばらばらな実績を count 件作る"""
+    return [
+        AchievementDef({
+            'id': f"rule_{i}",
+            'name': f"Rule {i}",
+            'event': EVENT_TYPES[i % len(EVENT_TYPES)],
+            'threshold': rng.randrange(1, EVENTS * 50),
+        })
+        for i in range(count)
+    ]
+
+
+def _publish_all(bus):
+    """打鍵ごとに keystrokes と english_power を発行"""
+    power = 0
+    publish = bus.publish
+    for keystrokes in range(1, EVENTS // 2 + 1):
+        power += 37
+        publish(EVENT_KEYSTROKES, keystrokes)
+        publish(EVENT_ENGLISH_POWER, power)
+
+
+def _poll_all(defs, unlocked):
+    """比較用: イベントごとに全実績の条件を調べる"""
+    power = 0
+    for keystrokes in range(1, EVENTS // 2 + 1):
+        power += 37
+        values = {EVENT_KEYSTROKES: keystrokes, EVENT_ENGLISH_POWER: power}
+        for definition in defs:
+            value = values.get(definition.event)
+            if value is not None and value >= definition.threshold:
+                unlocked.add(definition.id)
+
+
+def run():
+    """ベンチマークを実行して結果を表示"""
+    rng = random.Random(0)
+    for count in RULE_COUNTS:
+        defs = _make_defs(count, rng)
+        unlocked = set()
+        tracker = AchievementTracker(defs, unlocked)
+        bus = EventBus()
+        tracker.attach(bus)
+        start = time.perf_counter()
+        _publish_all(bus)
+        per_event = (time.perf_counter() - start) / EVENTS * 1e9
+
+        line = (f"{count:>7} rules: indexed {per_event:7.0f} ns/event, "
+                f"unlocked {len(unlocked)}")
+        if count <= 1000:
+            polled = set()
+            start = time.perf_counter()
+            _poll_all(defs, polled)
+            per_poll = (time.perf_counter() - start) / EVENTS * 1e9
+            line += f" | polling {per_poll:9.0f} ns/event (unlocked {len(polled)})"
+        print(line)
+
+
+if __name__ == "__main__":
+    run()
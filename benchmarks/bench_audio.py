@@ -0,0 +1,64 @@
+"""効果音再生のコスト計測
+
+SDL のダミーオーディオドライバーでミキサーを初期化し、打鍵音の再生処理が
+1打鍵あたりに追加する時間とメモリ確保量を計測する。音声デバイスのない
+CI 環境でもそのまま実行できる。
+
+    python -m benchmarks.bench_audio
+"""
+
+import os
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # pylint: disable=wrong-import-position
+
+from audio import SOUND_NAMES, AudioManager  # pylint: disable=wrong-import-position
+from config import Config  # pylint: disable=wrong-import-position
+
+KEYSTROKES = 20000
+
+
+def _time_calls(func, count):
+    """関数を count 回呼んだときの1回あたりの時間 (µs)"""
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def run():
+    """ベンチマークを実行して結果を表示"""
+    config = Config()
+    start = time.perf_counter()
+    AudioManager.pre_init(config)
+    pygame.init()  # pylint: disable=no-member
+    audio = AudioManager(config)
+    audio.load()
+    load_ms = (time.perf_counter() - start) * 1000
+    if not audio.enabled:
+        print("mixer unavailable; audio disabled")
+        return
+
+    missing = [name for name in SOUND_NAMES if name not in audio.sounds]
+    baseline = _time_calls(lambda: None, KEYSTROKES)
+    per_key = _time_calls(audio.play_keystroke, KEYSTROKES)
+
+    tracemalloc.start()
+    for _ in range(KEYSTROKES):
+        audio.play_keystroke()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"mixer          : {pygame.mixer.get_init()}")
+    print(f"startup [ms]   : {load_ms:.1f} (sounds decoded: {len(audio.sounds)}, missing: {missing})")
+    print(f"per keystroke  : {per_key - baseline:.2f} µs added")
+    print(f"traced peak    : {peak} bytes over {KEYSTROKES} keystrokes")
+    pygame.quit()  # pylint: disable=no-member
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,61 @@
+"""録画中のフレーム時間への影響を計測
+
+実際のゲーム画面を描画しながら、録画なし・PNG・生フレームの各条件で
+1フレームあたりの処理時間と、書き出しが追いつかずに捨てたフレーム数を比較する。
+
+    python -m benchmarks.bench_capture
+"""
+
+import os
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from capture import FORMAT_PNG, FORMAT_RAW, FrameRecorder  # pylint: disable=wrong-import-position
+from main import Game  # pylint: disable=wrong-import-position
+
+FRAMES = 300
+
+
+def _run_frames(game, recorder):
+    """60 FPS でゲーム画面を描画・キャプチャし、フレーム時間の一覧を返す"""
+    samples = []
+    for _ in range(FRAMES):
+        game.clock.tick(game.config.FPS)
+        start = time.perf_counter()
+        game._handle_main_button_click()  # pylint: disable=protected-access
+        game.render()
+        if recorder is not None:
+            recorder.capture(game.screen)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples
+
+
+def run():
+    """ベンチマークを実行して結果を表示"""
+    game = Game()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        game.state.save_path = os.path.join(tmp_dir, "save.json")
+        for label, frame_format in (("off", None), ("png", FORMAT_PNG), ("raw", FORMAT_RAW)):
+            recorder = None
+            if frame_format is not None:
+                recorder = FrameRecorder(tmp_dir, game.config.CAPTURE_BUFFERS, frame_format)
+                recorder.start(game.screen)
+            samples = _run_frames(game, recorder)
+            dropped = written = 0
+            if recorder is not None:
+                recorder.stop()
+                recorder.join()
+                dropped, written = recorder.dropped, recorder.written
+            print(
+                f"{label:>4}: mean {sum(samples) / len(samples) * 1000:.2f} ms, "
+                f"p99 {samples[int(len(samples) * 0.99)] * 1000:.2f} ms, "
+                f"written {written}, dropped {dropped}"
+            )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,119 @@
+"""クリック判定のコスト計測
+
+画面いっぱいに小さな領域を並べ、ランダムな位置のクリックを判定する時間を
+全領域を順に調べる方法と HitTester（グリッド索引）で比較する。グリッドは
+ゲームと同じ既定のセルの大きさ（64px）と、領域の平均の大きさに合わせた
+セルの両方で計測する（既定のセルより小さい領域が多いと1セルの候補が増える）。
+全領域を調べる方法は遅いため、クリック数を LINEAR_CLICKS までに抑える。
+あわせて、キーボード画像の透明な部分へのクリックがマスクで除外される割合を表示する。
+
+    python -m benchmarks.bench_hit_test
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # pylint: disable=wrong-import-position
+
+from config import Config  # pylint: disable=wrong-import-position
+from ui import Button, HitTester  # pylint: disable=wrong-import-position
+
+WIDGET_COUNTS = (10, 1000, 10000)
+CLICKS = 100000
+LINEAR_CLICKS = 5000
+DEFAULT_CELL_SIZE = 64
+IMAGE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "keyboard.png"
+)
+
+
+def _layout(count, width, height):
+    """count 個の矩形を画面に敷き詰める"""
+    columns = max(1, int((count * width / height) ** 0.5))
+    rows = -(-count // columns)
+    cell_w, cell_h = width // columns, height // rows
+    return [
+        pygame.Rect((i % columns) * cell_w + 1, (i // columns) * cell_h + 1,
+                    max(1, cell_w - 2), max(1, cell_h - 2))
+        for i in range(count)
+    ]
+
+
+def _linear_hit(rects, pos):
+    """全領域を手前から順に調べる"""
+    for idx in range(len(rects) - 1, -1, -1):
+        if rects[idx].collidepoint(pos):
+            return idx
+    return None
+
+
+def _cell_size_for(rects):
+    """領域の平均の大きさ（面積の平方根）に合わせたセルの大きさ"""
+    area = sum(rect.width * rect.height for rect in rects) / len(rects)
+    return max(8, int(area ** 0.5))
+
+
+def _build_tester(rects, cell_size):
+    """HitTester を作り、(HitTester, 索引の作成時間 ms) を返す"""
+    tester = HitTester(cell_size)
+    start = time.perf_counter()
+    for idx, rect in enumerate(rects):
+        tester.add(idx, rect)
+    return tester, (time.perf_counter() - start) * 1000
+
+
+def _time_clicks(func, clicks):
+    """1クリックあたりの判定時間 (µs) と当たった回数"""
+    hits = 0
+    start = time.perf_counter()
+    for pos in clicks:
+        if func(pos) is not None:
+            hits += 1
+    return (time.perf_counter() - start) / len(clicks) * 1e6, hits
+
+
+def _mask_report(config):
+    """キーボード画像の矩形内クリックのうち、マスクで除外される割合"""
+    image = pygame.image.load(IMAGE_PATH)
+    button = Button(pygame.Vector2(config.WIDTH // 4, config.HEIGHT // 2), image)
+    rng = random.Random(1)
+    rect = button.rect
+    clicks = [(rng.randrange(rect.left, rect.right), rng.randrange(rect.top, rect.bottom))
+              for _ in range(CLICKS)]
+    hits = sum(1 for pos in clicks if button.is_clicked(pos))
+    print(f"keyboard.png: {CLICKS - hits} of {CLICKS} clicks inside the rect "
+          f"({(CLICKS - hits) / CLICKS:.0%}) fall on transparent pixels and are rejected")
+
+
+def run():
+    """ベンチマークを実行して結果を表示"""
+    pygame.init()  # pylint: disable=no-member
+    config = Config()
+    rng = random.Random(0)
+    clicks = [(rng.randrange(config.WIDTH), rng.randrange(config.HEIGHT))
+              for _ in range(CLICKS)]
+    linear_clicks = clicks[:LINEAR_CLICKS]
+    for count in WIDGET_COUNTS:
+        rects = _layout(count, config.WIDTH, config.HEIGHT)
+        linear_us, linear_hits = _time_clicks(
+            lambda pos, r=rects: _linear_hit(r, pos), linear_clicks
+        )
+        print(f"{count:>6} widgets: linear {linear_us:8.2f} µs/click "
+              f"({len(linear_clicks)} clicks)")
+        for cell_size in (DEFAULT_CELL_SIZE, _cell_size_for(rects)):
+            tester, build_ms = _build_tester(rects, cell_size)
+            grid_us, _ = _time_clicks(tester.hit, clicks)
+            # 全領域を調べる方法と同じクリックで当たった回数が一致するかを確認
+            _, grid_hits = _time_clicks(tester.hit, linear_clicks)
+            print(f"         grid (cell {cell_size:3d}px) {grid_us:5.2f} µs/click "
+                  f"(index build {build_ms:.1f} ms, hits {linear_hits}/{grid_hits})")
+    if os.path.exists(IMAGE_PATH):
+        _mask_report(config)
+    pygame.quit()  # pylint: disable=no-member
+
+
+if __name__ == "__main__":
+    run()
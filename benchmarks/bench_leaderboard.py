@@ -0,0 +1,129 @@
+"""リーダーボードの計測（100万件）
+
+一時ディレクトリに 100 万プロフィール分の記録を登録し、次の時間を計測する。
+
+- 上位10件の取得と「自分の順位」の取得（区間集計あり / 単純な count(*)）
+- セッション終了時の記録の登録（100件を1トランザクションで）
+- 裏で取り直し・登録が走っている間の LeaderboardClient.view（描画側の呼び出し）
+
+    python -m benchmarks.bench_leaderboard
+"""
+
+import os
+import random
+import tempfile
+import time
+
+from leaderboard import METRICS, LeaderboardClient, LeaderboardStore
+from perf_stats import LatencyHistogram
+
+PROFILES = 1_000_000
+INSERT_BATCH = 20_000
+QUERIES = 300
+SUBMIT_BATCH = 100
+BOUNDS_MS = (0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200)
+
+
+def _random_result(rng, profile):
+    """それらしい分布の記録を1件作る（上位ほど少ない）"""
+    level = 1 + int(rng.expovariate(1 / 20))
+    wpm = round(min(rng.lognormvariate(3.7, 0.35), 250.0), 1)
+    power = int(rng.lognormvariate(12, 3))
+    return profile, level, wpm, power
+
+
+def _populate(store, rng):
+    """100万件を登録し、1秒あたりの件数を返す"""
+    start = time.perf_counter()
+    for first in range(0, PROFILES, INSERT_BATCH):
+        store.submit(
+            _random_result(rng, f"profile{i}") for i in range(first, first + INSERT_BATCH)
+        )
+    return PROFILES / (time.perf_counter() - start)
+
+
+def _measure(func, count):
+    """func を count 回呼んだ時間の分布を返す"""
+    histogram = LatencyHistogram(BOUNDS_MS)
+    for _ in range(count):
+        start = time.perf_counter()
+        func()
+        histogram.record_ms((time.perf_counter() - start) * 1000)
+    return histogram
+
+
+def _naive_rank(store, metric, profile):
+    """比較用: 自分より上の記録を索引で数える（順位に比例して遅くなる）"""
+    value = store.connection.execute(
+        f"SELECT {metric} FROM scores WHERE profile = ?", (profile,)
+    ).fetchone()[0]
+    return 1 + store.connection.execute(
+        f"SELECT count(*) FROM scores WHERE {metric} > ?", (value,)
+    ).fetchone()[0]
+
+
+def _bench_queries(store, rng):
+    """上位N件と順位の取得時間"""
+    for metric in METRICS:
+        top = _measure(lambda m=metric: store.top(m, 10), QUERIES)
+        print(f"  top10 {metric:<14} {top.format_summary()}")
+        samples = [f"profile{rng.randrange(PROFILES)}" for _ in range(QUERIES)]
+        it = iter(samples)
+        rank = _measure(lambda m=metric: store.rank(m, next(it)), QUERIES)
+        print(f"  rank  {metric:<14} {rank.format_summary()}")
+        it = iter(samples[:30])
+        naive = _measure(lambda m=metric: _naive_rank(store, m, next(it)), 30)
+        print(f"  rank (count(*))      {naive.format_summary()}")
+
+
+def _bench_submit(store, rng):
+    """セッション終了時の登録（100件を1トランザクションで、専用スレッドが処理する時間）"""
+    histogram = LatencyHistogram(BOUNDS_MS)
+    for _ in range(10):
+        results = [_random_result(rng, f"profile{rng.randrange(PROFILES)}")
+                   for _ in range(SUBMIT_BATCH)]
+        start = time.perf_counter()
+        store.submit(results)
+        histogram.record_ms((time.perf_counter() - start) * 1000)
+    print(f"  submit {SUBMIT_BATCH} results per batch: {histogram.format_summary()}")
+
+
+def _bench_client(path):
+    """裏で取り直しと登録が続く間の view 呼び出し時間（描画側のコスト）"""
+    client = LeaderboardClient(path, "profile0", ttl=0.0)
+    client.start()
+    histogram = LatencyHistogram(BOUNDS_MS)
+    deadline = time.perf_counter() + 3.0
+    frames = 0
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        for metric in METRICS:
+            client.view(metric)
+        if frames % 60 == 0:
+            client.record(frames, 60.0, frames * 10)
+            client.flush()
+        histogram.record_ms((time.perf_counter() - start) * 1000)
+        frames += 1
+        time.sleep(0.001)
+    client.stop()
+    print(f"  client view() per frame while refreshing: {histogram.format_summary()}, "
+          f"refreshes {client.revision}")
+
+
+def run():
+    """ベンチマークを実行して結果を表示"""
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "leaderboard.db")
+        store = LeaderboardStore(path)
+        rate = _populate(store, rng)
+        size = os.path.getsize(path) / (1024 * 1024)
+        print(f"{store.count()} profiles: inserted {rate:,.0f} rows/s, {size:.0f} MiB")
+        _bench_queries(store, rng)
+        _bench_submit(store, rng)
+        store.close()
+        _bench_client(path)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,101 @@
+"""入力照合のコスト計測
+
+収録文すべてを正しく打鍵したときの check_input 1回あたりの時間を、
+従来の1文字比較と照合ルール（表記ゆれ吸収・厳密さ設定）で比較する。
+文章の切り替え時に行う正規化（set_sentence）の時間も表示する。
+
+    python -m benchmarks.bench_matching
+"""
+
+import time
+
+from matching import MatchRules
+from sentences import sentences
+from ui.typing_display import TypingDisplay
+
+ROUNDS = 40
+REPEATS = 7
+
+
+class _LegacyDisplay:
+    """従来の check_input（期待文字との完全一致）"""
+
+    def __init__(self):
+        self.english_text = ""
+        self.current_position = 0
+        self.revision = 0
+
+    def set_sentence(self, english, _japanese):
+        """文章を設定"""
+        self.english_text = english
+        self.current_position = 0
+        self.revision += 1
+
+    def check_input(self, char):
+        """入力文字をチェック"""
+        if self.current_position >= len(self.english_text):
+            return False
+        if self.english_text[self.current_position] == char:
+            self.current_position += 1
+            self.revision += 1
+            return True
+        return False
+
+
+def _time_typing(display, texts):
+    """全文を ROUNDS 回打鍵したときの (打鍵1回あたり ns, 文章設定1回あたり µs, 正解数)"""
+    typed = 0
+    correct = 0
+    key_time = 0.0
+    set_time = 0.0
+    for _ in range(ROUNDS):
+        for english, japanese, keys in texts:
+            start = time.perf_counter()
+            display.set_sentence(english, japanese)
+            middle = time.perf_counter()
+            check = display.check_input
+            for char in keys:
+                correct += check(char)
+            key_time += time.perf_counter() - middle
+            set_time += middle - start
+            typed += len(keys)
+    return key_time / typed * 1e9, set_time / (ROUNDS * len(texts)) * 1e6, correct / ROUNDS
+
+
+def _best_of(factory, texts):
+    """REPEATS 回計測し、最も速かった回の結果を返す（他プロセスの影響を除く）"""
+    results = [_time_typing(factory(), texts) for _ in range(REPEATS)]
+    return min(r[0] for r in results), min(r[1] for r in results), results[0][2]
+
+
+def _variant_keys(english):
+    """IMEの全角入力やスマート引用符を混ぜた打鍵列"""
+    return "".join(
+        chr(ord(c) + 0xFEE0) if c.isalpha() and i % 3 == 0
+        else '’' if c == "'" else c
+        for i, c in enumerate(english)
+    )
+
+
+def run():
+    """ベンチマークを実行して結果を表示"""
+    plain = [(s[1], s[2], s[1]) for s in sentences]
+    variants = [(s[1], s[2], _variant_keys(s[1])) for s in sentences]
+    total = sum(len(s[1]) for s in sentences)
+    cases = (
+        ("legacy", _LegacyDisplay, plain),
+        ("rules strict", lambda: TypingDisplay(None, None, 0, 0), plain),
+        ("rules lenient", lambda: TypingDisplay(
+            None, None, 0, 0, match_rules=MatchRules(False, False)), plain),
+        ("legacy / IME", _LegacyDisplay, variants),
+        ("rules / IME", lambda: TypingDisplay(None, None, 0, 0), variants),
+    )
+    print(f"{len(sentences)} sentences, {total} chars, best of {REPEATS} x {ROUNDS} rounds")
+    for label, factory, texts in cases:
+        per_key, per_set, correct = _best_of(factory, texts)
+        print(f"{label:>14}: {per_key:6.1f} ns/key  set_sentence {per_set:5.2f} µs  "
+              f"accepted {correct:.0f}/{total}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,94 @@
+"""メトリクス公開のコスト計測
+
+フレームループ相当の処理（メトリクス更新 + 一定量の作業）を回しながら、
+別スレッドの HTTP クライアントで ``/metrics`` を連続してスクレイプし、
+スクレイプなしの場合とフレーム時間を比較する。応答の形式も簡単に検証する。
+
+    python -m benchmarks.bench_metrics
+"""
+
+import threading
+import time
+import urllib.request
+
+from metrics import CONTENT_TYPE, PREFIX, GameMetrics, MetricsExporter
+from perf_stats import LatencyHistogram
+
+FRAMES = 20000
+WORK_ITERATIONS = 300  # 1フレームあたりの擬似的なゲーム処理
+
+
+def _frame_loop(metrics, frames):
+    """擬似フレームループを回し、1フレームの処理時間の分布を返す"""
+    histogram = LatencyHistogram((0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10))
+    previous = time.perf_counter()
+    for _ in range(frames):
+        start = time.perf_counter()
+        total = 0
+        for i in range(WORK_ITERATIONS):
+            total += i
+        metrics.keystrokes += 1
+        metrics.record_frame((start - previous) * 1000, 60.0)
+        previous = start
+        histogram.record_ms((time.perf_counter() - start) * 1000)
+    return histogram
+
+
+def _scrape_until(url, stop, results):
+    """stop が立つまで連続でスクレイプし、回数と最後の応答を記録"""
+    while not stop.is_set():
+        with urllib.request.urlopen(url) as response:
+            results['content_type'] = response.headers['Content-Type']
+            results['body'] = response.read().decode('utf-8')
+        results['count'] += 1
+
+
+def _check_body(body):
+    """応答に必要なメトリクスが含まれるか検証し、不足している名前を返す"""
+    required = (
+        'frame_time_seconds_bucket', 'frame_time_seconds_count', 'fps',
+        'keystrokes_total', 'keystrokes_per_second', 'sentences_completed_total',
+        'save_duration_seconds_count', 'english_power', 'level',
+    )
+    names = {line.split('{')[0].split(' ')[0] for line in body.splitlines()
+             if line and not line.startswith('#')}
+    return [name for name in required if PREFIX + name not in names]
+
+
+def run():
+    """ベンチマークを実行して結果を表示"""
+    metrics = GameMetrics()
+    exporter = MetricsExporter(
+        metrics,
+        gauges=(("english_power", "English Power", lambda: 123),
+                ("level", "Level", lambda: 4)),
+        port=0,
+    )
+    exporter.start()
+    url = f"http://127.0.0.1:{exporter.port}/metrics"
+
+    idle = _frame_loop(metrics, FRAMES)
+    stop = threading.Event()
+    results = {'count': 0, 'body': '', 'content_type': ''}
+    client = threading.Thread(target=_scrape_until, args=(url, stop, results))
+    client.start()
+    start = time.perf_counter()
+    scraped = _frame_loop(metrics, FRAMES)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    client.join()
+    exporter.stop()
+
+    missing = _check_body(results['body'])
+    content_type_ok = results['content_type'] == CONTENT_TYPE
+    print(f"endpoint        : {url} (content type {'ok' if content_type_ok else 'mismatch'})")
+    print(f"missing metrics : {missing or 'none'}")
+    print(f"scrapes         : {results['count']} ({results['count'] / elapsed:.0f}/s during loop)")
+    for label, histogram in (("no scrape", idle), ("scraping", scraped)):
+        stats = histogram.summary()
+        print(f"frame [{label:>9}] mean={stats['mean_ms'] * 1000:.1f}µs "
+              f"p99<={stats['p99_ms'] * 1000:.0f}µs max={stats['max_ms'] * 1000:.0f}µs")
+
+
+if __name__ == "__main__":
+    run()
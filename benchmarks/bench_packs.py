@@ -0,0 +1,137 @@
+"""コーパスパックの計測（起動時間とパックの数、切り替えのフレーム時間）
+
+一時ディレクトリにパック（1パックあたり 5,000 文）を作り、次を計測する。
+
+- パックの数（0〜1,000）ごとの PackRegistry の作成時間と Game の起動時間
+- ウォームアップ後に F7 と同じ切り替えを繰り返したときの、差し替えたフレームの時間
+  （裏での読み込み時間も表示）と、切り替え後に残っているパックの数
+
+    python -m benchmarks.bench_packs
+"""
+
+import gc
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from config import Config
+from corpus_packs import CorpusPack, PackRegistry
+from main import Game
+from perf_stats import LatencyHistogram
+
+PACK_COUNTS = (0, 10, 100, 1000)
+SENTENCES_PER_PACK = 5000
+SWITCH_PACKS = 3
+SWITCHES = 30
+BOUNDS_MS = (0.1, 0.2, 0.5, 1, 2, 4, 8, 12, 16, 20, 33, 50, 100)
+FONT_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets",
+                         "NotoSansJP-Black.ttf")
+
+
+def _write_shared_files(directory):
+    """全パックで共有する文章ファイルを作る（パックからはハードリンクで参照）"""
+    rows = [
+        [i, f"Sentence number {i} for the benchmark pack.", f"ベンチマーク用の文章その{i}。"]
+        for i in range(SENTENCES_PER_PACK)
+    ]
+    path = os.path.join(directory, "sentences.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(rows, f, ensure_ascii=False)
+    return path
+
+
+def _install_packs(directory, count, sentences_path):
+    """count 個のパックを作る"""
+    os.makedirs(directory, exist_ok=True)
+    for index in range(count):
+        pack_dir = os.path.join(directory, f"pack{index:04d}")
+        os.mkdir(pack_dir)
+        os.link(sentences_path, os.path.join(pack_dir, "sentences.json"))
+        os.link(FONT_PATH, os.path.join(pack_dir, "font.ttf"))
+        with open(os.path.join(pack_dir, "pack.json"), "w", encoding="utf-8") as f:
+            json.dump({"name": f"Pack {index}", "target_font": "font.ttf",
+                       "native_font": "font.ttf"}, f)
+
+
+def _build_game(packs_dir, save_path):
+    """計測用の設定でゲームを作る"""
+    config = Config.load()
+    config.LEADERBOARD_ENABLED = False
+    config.HOT_RELOAD = False
+    config.PACKS_DIR = packs_dir
+    return Game(config=config, save_path=save_path)
+
+
+def _bench_startup(tmp, sentences_path):
+    """パックの数ごとの一覧作成時間と起動時間"""
+    _build_game(os.path.join(tmp, "none"), os.path.join(tmp, "save.json"))  # ウォームアップ
+    for count in PACK_COUNTS:
+        packs_dir = os.path.join(tmp, f"packs{count}")
+        _install_packs(packs_dir, count, sentences_path)
+        times = []
+        for _ in range(20):
+            start = time.perf_counter()
+            PackRegistry(packs_dir, "sentences.py", FONT_PATH)
+            times.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        _build_game(packs_dir, os.path.join(tmp, "save.json"))
+        startup = (time.perf_counter() - start) * 1000
+        print(f"  {count:5d} packs: registry {statistics.median(times):.3f} ms, "
+              f"game startup {startup:.0f} ms")
+
+
+def _switch_once(game):
+    """F7 と同じ切り替えを行い、(差し替えたフレームの ms, 読み込みの ms) を返す"""
+    # pylint: disable=protected-access
+    game._cycle_pack()
+    requested = time.perf_counter()
+    while True:
+        start = time.perf_counter()
+        pack = game.pack
+        game._update(16)
+        game.render()
+        game.prefetcher.fill()
+        if game.pack is not pack:
+            return (time.perf_counter() - start) * 1000, (start - requested) * 1000
+        time.sleep(0.001)
+
+
+def _bench_switch(tmp, sentences_path):
+    """ウォームアップ後の切り替え時間"""
+    packs_dir = os.path.join(tmp, "switch")
+    _install_packs(packs_dir, SWITCH_PACKS, sentences_path)
+    game = _build_game(packs_dir, os.path.join(tmp, "save.json"))
+    budget_ms = 1000 / game.config.FPS if game.config.FPS else 16.7
+    for _ in range(SWITCH_PACKS + 1):  # ウォームアップ（全パックを1回ずつ）
+        _switch_once(game)
+    frames = LatencyHistogram(BOUNDS_MS)
+    loads = LatencyHistogram(BOUNDS_MS)
+    over = 0
+    for _ in range(SWITCHES):
+        frame_ms, load_ms = _switch_once(game)
+        frames.record_ms(frame_ms)
+        loads.record_ms(load_ms)
+        over += frame_ms > budget_ms
+    print(f"  switch frame: {frames.format_summary()} (budget {budget_ms:.1f} ms, over {over})")
+    print(f"  background load: {loads.format_summary()}")
+    gc.collect()
+    live = sum(isinstance(obj, CorpusPack) for obj in gc.get_objects())
+    print(f"  live packs after {SWITCHES} switches: {live}")
+
+
+def run():
+    """ベンチマークを実行して結果を表示"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    with tempfile.TemporaryDirectory() as tmp:
+        sentences_path = _write_shared_files(tmp)
+        print(f"startup ({SENTENCES_PER_PACK} sentences per pack):")
+        _bench_startup(tmp, sentences_path)
+        print(f"switching between {SWITCH_PACKS} packs and the built-in one:")
+        _bench_switch(tmp, sentences_path)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,77 @@
+"""長文モードのメモリ・フレーム時間ベンチマーク
+
+1 KB と 50 MB のパッセージで同じ文字数をタイピングし、
+1打鍵＋描画あたりの処理時間とメモリ確保量のピークが変わらないことを確認する。
+
+    python -m benchmarks.bench_paragraph
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # pylint: disable=wrong-import-position
+
+from config import Config  # pylint: disable=wrong-import-position
+from sentences import sentences  # pylint: disable=wrong-import-position
+from ui import ParagraphDisplay  # pylint: disable=wrong-import-position
+
+SIZES = (1024, 50 * 1024 * 1024)
+KEYSTROKES = 5000
+
+
+def _write_passage(path, size):
+    """例文を繰り返して指定サイズのパッセージを作成"""
+    block = "\n".join(sentence[1] for sentence in sentences) + "\n"
+    with open(path, "w", encoding="utf-8") as f:
+        written = 0
+        while written < size:
+            part = block[:size - written]
+            f.write(part)
+            written += len(part)
+
+
+def _measure(path, screen, font, config):
+    """パッセージを開いて一定数タイピングし、処理時間とピークを返す"""
+    tracemalloc.start()
+    display = ParagraphDisplay(font, config.WIDTH - config.RIGHT_WIDTH, 160, 0, 400)
+    display.open(path)
+    samples = []
+    for _ in range(KEYSTROKES):
+        if display.is_complete():
+            display.restart()
+        start = time.perf_counter()
+        display.check_input(display._lines[0][display.line_position])  # pylint: disable=protected-access
+        screen.fill(config.BG_COLOR)
+        display.draw(screen, config.TEXT_COLOR)
+        samples.append(time.perf_counter() - start)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    samples.sort()
+    return sum(samples) / len(samples), samples[int(len(samples) * 0.99)], peak
+
+
+def run():
+    """ベンチマークを実行して結果を表示"""
+    pygame.init()  # pylint: disable=no-member
+    config = Config()
+    screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+    font = pygame.font.Font(None, 32)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in SIZES:
+            path = os.path.join(tmp_dir, f"passage_{size}.txt")
+            _write_passage(path, size)
+            mean, p99, peak = _measure(path, screen, font, config)
+            print(
+                f"{size / 1024:>10.0f} KiB : mean {mean * 1000:.3f} ms, "
+                f"p99 {p99 * 1000:.3f} ms, traced peak {peak / 1024:.1f} KiB"
+            )
+    pygame.quit()  # pylint: disable=no-member
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,100 @@
+"""文章切り替え時のフレーム時間計測
+
+文章を最後まで入力したフレーム（次の文章への切り替え＋描画）の処理時間を、
+その場で文章を設定する従来の方法と、先読み（SentencePrefetcher）で比較する。
+先読みの準備は描画後に行うため、計測する区間には含めない。
+
+    python -m benchmarks.bench_prefetch
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # pylint: disable=wrong-import-position
+
+from config import Config  # pylint: disable=wrong-import-position
+from sentences import sentences  # pylint: disable=wrong-import-position
+from ui import SentencePrefetcher, TypingDisplay  # pylint: disable=wrong-import-position
+
+COMPLETIONS = 500
+FONT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "assets", "NotoSansJP-Black.ttf",
+)
+
+
+def _choose(rng):
+    """乱数生成器を固定した文章選択関数を返す"""
+    def choose():
+        sentence = rng.choice(sentences)
+        return sentence[1], sentence[2]
+    return choose
+
+
+def _measure(screen, display, config, switch, after_frame):
+    """文章を COMPLETIONS 回入力し、(通常の打鍵フレーム, 切り替えフレーム) の時間を返す"""
+    keystroke_frames = []
+    completion_frames = []
+    for _ in range(COMPLETIONS):
+        text = display.english_text
+        for idx, char in enumerate(text):
+            start = time.perf_counter()
+            display.check_input(char)
+            if idx == len(text) - 1:
+                switch()
+            screen.fill(config.BG_COLOR)
+            display.draw(screen, config.TEXT_COLOR)
+            elapsed = time.perf_counter() - start
+            (completion_frames if idx == len(text) - 1 else keystroke_frames).append(elapsed)
+            after_frame()
+    return keystroke_frames, completion_frames
+
+
+def _format(label, samples):
+    """処理時間の集計を1行で返す"""
+    samples.sort()
+    mean = sum(samples) / len(samples)
+    p99 = samples[int(len(samples) * 0.99)]
+    return (f"{label:<22}: mean {mean * 1000:.3f} ms, p99 {p99 * 1000:.3f} ms, "
+            f"max {samples[-1] * 1000:.3f} ms")
+
+
+def run():
+    """ベンチマークを実行して結果を表示"""
+    pygame.init()  # pylint: disable=no-member
+    config = Config()
+    screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+    font_path = FONT_PATH if os.path.exists(FONT_PATH) else None
+    english_font = pygame.font.Font(font_path, 32)
+    japanese_font = pygame.font.Font(font_path, 22)
+    width = config.WIDTH - config.RIGHT_WIDTH
+
+    display = TypingDisplay(english_font, japanese_font, width, 160, 0, 400)
+    choose = _choose(random.Random(0))
+    display.set_sentence(*choose())
+    sync = _measure(
+        screen, display, config, lambda: display.set_sentence(*choose()), lambda: None
+    )
+
+    display = TypingDisplay(english_font, japanese_font, width, 160, 0, 400)
+    prefetcher = SentencePrefetcher(
+        display, _choose(random.Random(0)), config.TEXT_COLOR, config.PREFETCH_SENTENCES
+    )
+    prefetcher.fill(config.PREFETCH_SENTENCES)
+    prefetcher.advance()
+    prefetched = _measure(screen, display, config, prefetcher.advance, prefetcher.fill)
+
+    print(f"font: {font_path or 'pygame default'}, {COMPLETIONS} sentence completions")
+    print(_format("keystroke (sync)", sync[0]))
+    print(_format("completion (sync)", sync[1]))
+    print(_format("keystroke (prefetch)", prefetched[0]))
+    print(_format("completion (prefetch)", prefetched[1]))
+    print(f"prefetch misses       : {prefetcher.misses}")
+    pygame.quit()  # pylint: disable=no-member
+
+
+if __name__ == "__main__":
+    run()
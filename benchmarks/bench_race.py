@@ -0,0 +1,154 @@
+"""レースサーバーの負荷試験（ループバック）
+
+レースサーバーを別プロセスで起動し、このプロセスから多数の擬似クライアントを
+asyncio で接続する。各クライアントは人間の入力速度程度で進捗を送り、
+送信してから自分の進捗が配信に含まれるまでの時間を計測する。
+サーバーの CPU 時間は終了後に子プロセスの使用量から求める。
+計測側のクライアントも同じマシンで動くため、コアが少ない環境では
+クライアント数が多いとレイテンシは計測側の処理待ちを含む（サーバー側の
+遅れは終了時に表示される tick lag で確認できる）。
+
+    python -m benchmarks.bench_race
+"""
+
+import asyncio
+import random
+import re
+import resource
+import signal
+import subprocess
+import sys
+import time
+
+from perf_stats import LatencyHistogram
+from race.protocol import MSG_JOIN, MSG_PROGRESS, MSG_TICK, MSG_WELCOME, decode, encode
+
+CLIENT_COUNTS = (100, 300, 500)
+DURATION = 8.0  # 1回の計測時間（秒）
+KEY_INTERVAL = 0.15  # 1打鍵の平均間隔（秒、約80WPM）
+READ_LIMIT = 1 << 20
+
+
+class _SimClient:
+    """進捗を送り、自分の進捗が配信されるまでの時間を記録する擬似クライアント"""
+
+    def __init__(self, index, histogram, rng):
+        self.index = index
+        self.histogram = histogram
+        self.rng = rng
+        self.player_id = None
+        self.offsets = None
+        self.sent = None  # (進捗, 送信時刻)
+        self.marker = None  # 配信中の自分の行の先頭（デコード前の絞り込み用）
+        self.bytes_received = 0
+
+    async def run(self, port, deadline):
+        """接続して deadline まで打鍵を続ける"""
+        reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=READ_LIMIT)
+        writer.write(encode({"t": MSG_JOIN, "n": f"bot{self.index}"}))
+        welcome = decode(await reader.readline())
+        assert welcome["t"] == MSG_WELCOME
+        self.player_id = welcome["id"]
+        self.marker = f"[{self.player_id},".encode()
+        self.offsets = [0]
+        for entry in welcome["s"]:
+            self.offsets.append(self.offsets[-1] + len(entry[1]))
+        receiver = asyncio.create_task(self._receive(reader))
+        try:
+            await self._type(writer, deadline)
+        finally:
+            receiver.cancel()
+            writer.close()
+
+    async def _type(self, writer, deadline):
+        """一定の間隔（揺らぎあり）で1文字ずつ進める"""
+        loop = asyncio.get_running_loop()
+        progress = 0
+        total = self.offsets[-1]
+        while loop.time() < deadline and progress < total:
+            await asyncio.sleep(self.rng.expovariate(1.0 / KEY_INTERVAL))
+            progress += 1
+            index = _sentence_index(self.offsets, progress)
+            self.sent = (progress, time.perf_counter())
+            writer.write(encode({
+                "t": MSG_PROGRESS, "i": index, "c": progress - self.offsets[index], "e": 0,
+            }))
+
+    async def _receive(self, reader):
+        """配信を読み、自分の最新の進捗が含まれていればレイテンシを記録"""
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            self.bytes_received += len(line)
+            sent = self.sent
+            if sent is None or self.marker not in line:
+                continue  # 全員分をデコードすると計測側が先に飽和する
+            message = decode(line)
+            if message.get("t") != MSG_TICK:
+                continue
+            for player_id, progress, _errors, _rank in message.get("d", ()):
+                if player_id == self.player_id and progress >= sent[0]:
+                    self.histogram.record_ms((time.perf_counter() - sent[1]) * 1000)
+                    self.sent = None
+                    break
+
+
+def _sentence_index(offsets, progress):
+    """レース全体の入力文字数から文章番号を求める"""
+    index = 0
+    while index + 2 < len(offsets) and progress >= offsets[index + 1]:
+        index += 1
+    return index
+
+
+async def _drive(port, count):
+    """count 個のクライアントを同時に動かす"""
+    histogram = LatencyHistogram()
+    rng = random.Random(count)
+    clients = [_SimClient(i, histogram, random.Random(rng.random())) for i in range(count)]
+    deadline = asyncio.get_running_loop().time() + DURATION
+    await asyncio.gather(*(client.run(port, deadline) for client in clients))
+    return histogram, sum(client.bytes_received for client in clients)
+
+
+def _start_server():
+    """サーバーを起動し、表示されたポート番号を返す"""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "race.server", "--port", "0", "--sentences", "20", "--seed", "0"],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    match = re.search(r":(\d+) ", server.stdout.readline())
+    return server, int(match.group(1))
+
+
+def _stop_server(server):
+    """サーバーを止め、使用した CPU 時間（秒）を返す"""
+    before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    server.send_signal(signal.SIGINT)
+    summary = server.stdout.read().strip()
+    server.wait()
+    after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = (after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime)
+    return cpu, summary
+
+
+def run():
+    """ベンチマークを実行して結果を表示"""
+    for count in CLIENT_COUNTS:
+        server, port = _start_server()
+        own_start = time.process_time()
+        start = time.perf_counter()
+        histogram, received = asyncio.run(_drive(port, count))
+        elapsed = time.perf_counter() - start
+        own_cpu = time.process_time() - own_start
+        server_cpu, summary = _stop_server(server)
+        print(f"{count:>4} clients: update->broadcast {histogram.format_summary()}")
+        print(f"      server cpu {server_cpu / elapsed * 100:5.1f}% of one core, "
+              f"clients cpu {own_cpu / elapsed * 100:5.1f}%, "
+              f"received {received / elapsed / 1024:8.1f} KiB/s total | {summary}")
+
+
+if __name__ == "__main__":
+    run()
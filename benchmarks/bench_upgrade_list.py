@@ -0,0 +1,79 @@
+"""アップグレード一覧のスクロール描画ベンチマーク
+
+数千件のアップグレードを登録した状態で毎フレームスクロールしながら
+右パネルを描画し、60 FPS（16.7 ms）に収まるかを確認する。
+
+    python -m benchmarks.bench_upgrade_list
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # pylint: disable=wrong-import-position
+
+from config import Config  # pylint: disable=wrong-import-position
+from ui import UIRenderer  # pylint: disable=wrong-import-position
+from upgrades import EFFECT_TYPES, UpgradeDef, UpgradeRegistry  # pylint: disable=wrong-import-position
+
+ENTRIES = 5000
+FRAMES = 600
+
+
+def _build_registry(count):
+    """ダミーのアップグレードを大量に持つレジストリを作成"""
+    defs = [
+        UpgradeDef({
+            'id': f"upgrade_{i}",
+            'name': f"Upgrade {i}",
+            'base_cost': 10 + i,
+            'growth': 1.1 + (i % 7) * 0.1,
+            'effect': EFFECT_TYPES[i % len(EFFECT_TYPES)],
+            'amount': 1.01 if i % len(EFFECT_TYPES) == 2 else 1,
+        })
+        for i in range(count)
+    ]
+    return UpgradeRegistry(defs)
+
+
+def run():
+    """ベンチマークを実行して結果を表示"""
+    pygame.init()  # pylint: disable=no-member
+    config = Config()
+    screen = pygame.display.set_mode((config.WIDTH, config.HEIGHT))
+    fonts = {
+        'label': pygame.font.Font(None, 28),
+        'right_label': pygame.font.Font(None, 28),
+        'right_sublabel': pygame.font.Font(None, 22),
+    }
+    left_width = config.WIDTH - config.RIGHT_WIDTH
+    renderer = UIRenderer(config, fonts, left_width, config.RIGHT_WIDTH, config.HEIGHT)
+    upgrades = _build_registry(ENTRIES)
+    upgrade_list = renderer.upgrade_list
+
+    samples = []
+    hits = 0
+    for frame in range(FRAMES):
+        start = time.perf_counter()
+        upgrade_list.scroll_by(37 if frame < FRAMES // 2 else -23)
+        if frame % 10 == 0:
+            upgrades.purchase(upgrades.unlocked[upgrade_list.visible_range()[0]])
+        screen.fill(config.BG_COLOR)
+        renderer.draw_right_panel(screen, upgrades, {}, 0)
+        if renderer.upgrade_at((left_width + 120, config.HEIGHT // 2)) is not None:
+            hits += 1
+        samples.append(time.perf_counter() - start)
+
+    samples.sort()
+    print(f"entries        : {ENTRIES}")
+    print(f"frames         : {FRAMES}")
+    print(f"mean  [ms]     : {sum(samples) / len(samples) * 1000:.3f}")
+    print(f"p99   [ms]     : {samples[int(len(samples) * 0.99)] * 1000:.3f}")
+    print(f"max   [ms]     : {samples[-1] * 1000:.3f}")
+    print(f"button hits    : {hits}")
+    pygame.quit()  # pylint: disable=no-member
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,165 @@
+"""長時間プレイでメモリが増え続けないことの確認（24時間分を圧縮して実行）
+
+実際の Game をダミーのビデオドライバーで起動し、ゲーム内時間で 24 時間分の
+打鍵（ミスを含む）・クリック・購入・スクロール・プリセットの切り替えを
+流し込みながら描画する。ウォームアップ後の常駐メモリ（RSS）の増加量と
+傾きがしきい値を超えるか、サーフェスの合計が予算を超えたら失敗（終了コード 1）。
+
+    python -m benchmarks.soak_memory --hours 24 --budget-mb 2
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from config import Config
+from main import Game
+from metrics import process_rss_bytes
+
+STEP_MS = 10_000  # 1ステップで進めるゲーム内時間
+CHARS_PER_SECOND = 6.0  # 約 70 WPM
+ERROR_RATE = 0.03
+FRAMES_PER_STEP = 2
+SAMPLES = 50
+MIB = 1024 * 1024
+
+
+def parse_args(argv=None):
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="TypingClicker memory soak test")
+    parser.add_argument("--hours", type=float, default=24.0, help="ゲーム内時間（時間）")
+    parser.add_argument("--budget-mb", type=float, default=None,
+                        help="サーフェスの予算（既定は設定ファイルの値）")
+    parser.add_argument("--warmup", type=float, default=0.1,
+                        help="計測から除く最初の割合")
+    parser.add_argument("--max-growth-mb", type=float, default=4.0,
+                        help="ウォームアップ後に許容する RSS の増加量")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def _build_game(args, save_path):
+    """計測用の設定でゲームを作る（セーブは一時ファイル、記録の書き込みはしない）"""
+    config = Config.load()
+    config.LEADERBOARD_ENABLED = False
+    config.HOT_RELOAD = False
+    if args.budget_mb is not None:
+        config.SURFACE_BUDGET_MB = args.budget_mb
+    config.validate()
+    return Game(config=config, save_path=save_path)
+
+
+def _type(game, rng, count):
+    """表示中の文章を count 文字分入力（一定の割合で誤入力）"""
+    for _ in range(count):
+        display = game.typing_display
+        position = display.current_position
+        text = display.english_text
+        char = text[position] if position < len(text) else " "
+        if rng.random() < ERROR_RATE:
+            char = "q" if char != "q" else "x"
+        game._handle_typing_input(char)  # pylint: disable=protected-access
+
+
+def _interact(game, rng, step):
+    """クリック・購入・スクロール・プリセット切り替えを混ぜる"""
+    # pylint: disable=protected-access
+    for _ in range(rng.randrange(20)):
+        game._handle_main_button_click()
+    if step % 6 == 0:
+        game.state.english_power += 10 ** 6
+        unlocked = game.upgrades.unlocked
+        if unlocked:
+            game._handle_purchase(rng.choice(unlocked))
+    game.ui_renderer.upgrade_list.scroll_rows(rng.choice((-2, -1, 1, 2)))
+    if step % 360 == 0:  # ゲーム内で1時間ごと
+        game._cycle_preset()
+
+
+def _step(game, rng, step):
+    """ゲーム内時間を1ステップ進め、数フレーム描画"""
+    # pylint: disable=protected-access
+    game.handle_events()
+    _type(game, rng, int(CHARS_PER_SECOND * STEP_MS / 1000))
+    _interact(game, rng, step)
+    for _ in range(FRAMES_PER_STEP):
+        game._update(STEP_MS // FRAMES_PER_STEP)
+        game.render()
+        if game.prefetcher is not None:
+            game.prefetcher.fill()
+
+
+def _slope(samples):
+    """(ステップ, RSS) の最小二乗直線の傾き"""
+    count = len(samples)
+    mean_x = sum(x for x, _ in samples) / count
+    mean_y = sum(y for _, y in samples) / count
+    var = sum((x - mean_x) ** 2 for x, _ in samples)
+    if var == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in samples) / var
+
+
+def _check(args, samples, ledger, steps):
+    """RSS とサーフェスの予算を判定し、問題の一覧を返す"""
+    problems = []
+    growth = samples[-1][1] - samples[0][1]
+    trend = _slope(samples) * (steps - samples[0][0])
+    print(f"RSS after warm-up {samples[0][1] / MIB:.1f} MiB, end {samples[-1][1] / MIB:.1f} MiB, "
+          f"growth {growth / MIB:+.2f} MiB, trend {trend / MIB:+.2f} MiB over the session")
+    limit = args.max_growth_mb * MIB
+    if growth > limit:
+        problems.append(f"RSS grew {growth / MIB:.2f} MiB (limit {args.max_growth_mb} MiB)")
+    if trend > limit:
+        problems.append(f"RSS trend {trend / MIB:.2f} MiB (limit {args.max_growth_mb} MiB)")
+    # 表示中のサーフェスだけで予算を超える場合は、キャッシュが空なら合格とする
+    if ledger.budget_bytes and ledger.total_bytes > ledger.budget_bytes and ledger.cached_entries:
+        problems.append(f"surfaces {ledger.total_bytes / MIB:.2f} MiB exceed the budget "
+                        f"with {ledger.cached_entries} cached entries left")
+    return problems
+
+
+def run(args):
+    """ソークテストを実行し、問題がなければ True を返す"""
+    if process_rss_bytes() is None:
+        print("RSS is not available on this platform")
+        return False
+    rng = random.Random(args.seed)
+    steps = int(args.hours * 3600 * 1000 / STEP_MS)
+    warmup = int(steps * args.warmup)
+    interval = max(1, (steps - warmup) // SAMPLES)
+    samples = []
+    with tempfile.TemporaryDirectory() as tmp:
+        game = _build_game(args, os.path.join(tmp, "save.json"))
+        start = time.perf_counter()
+        for step in range(steps):
+            _step(game, rng, step)
+            if step >= warmup and (step - warmup) % interval == 0:
+                samples.append((step, process_rss_bytes()))
+        samples.append((steps, process_rss_bytes()))
+        elapsed = time.perf_counter() - start
+        print(f"{args.hours:g} h of game time in {elapsed:.0f} s: "
+              f"{game.metrics.keystrokes:,} keystrokes, level {game.state.level}")
+        print(game.surfaces.report())
+        problems = _check(args, samples, game.surfaces, steps)
+        if game.exporter is not None:
+            game.exporter.stop()
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    return not problems
+
+
+def main(argv=None):
+    """エントリーポイント"""
+    args = parse_args(argv)
+    # 画面・音声のないマシンでも動くようにする（pygame.init より前に設定）
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    sys.exit(0 if run(args) else 1)
+
+
+if __name__ == "__main__":
+    main()
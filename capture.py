@@ -0,0 +1,270 @@
+"""ゲーム画面の録画（フレームキャプチャ）を管理するモジュール"""
+
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
+import pygame
+
+FORMAT_PNG = "png"
+FORMAT_RAW = "raw"
+
+
+class _Session:
+    """録画1回分の状態（停止後も書き出しスレッドが使い続ける）"""
+
+    __slots__ = ('session_dir', 'size', 'pixel_layout', 'free', 'filled',
+                 'captured', 'written', 'dropped', 'error', 'thread')
+
+    def __init__(self, session_dir, size, pixel_layout):
+        self.session_dir = session_dir
+        self.size = size
+        self.pixel_layout = pixel_layout
+        self.free = queue.SimpleQueue()
+        self.filled = queue.SimpleQueue()
+        self.captured = 0
+        self.written = 0
+        self.dropped = 0
+        self.error = None  # 書き出しに失敗した場合のメッセージ
+        self.thread = None
+
+
+class FrameRecorder:
+    """画面キャプチャを別スレッドで書き出すクラス
+
+    キャプチャ先のサーフェスは録画開始時に決まった枚数だけ確保しておき、
+    フレームループ側は空きサーフェスへ画面をblitしてキューに入れるだけにする。
+    書き出しが追いつかず空きがない場合は、待たずにそのフレームを捨てて数える。
+    停止時も書き出しの完了は待たず、残りのフレームと session.json は
+    書き出しスレッドが書く（ディレクトリの作成も書き出しスレッドで行う）。
+    書き出しに失敗した場合（ディスクの空き不足など）は録画を止め、
+    失敗の内容を session.json と標準エラー出力に残す。
+    """
+
+    def __init__(self, output_dir, buffer_count=8, frame_format=FORMAT_PNG):
+        """
+        Args:
+            output_dir (str): 録画セッションを保存するディレクトリ
+            buffer_count (int): 事前確保するキャプチャ用サーフェスの枚数
+            frame_format (str): "png"（連番PNG）または "raw"（生フレームの連結）
+        """
+        if frame_format not in (FORMAT_PNG, FORMAT_RAW):
+            raise ValueError(f"unknown capture format '{frame_format}'")
+        self.output_dir = output_dir
+        self.buffer_count = buffer_count
+        self.frame_format = frame_format
+
+        self.recording = False
+        self._session = None  # 録画中または最後に録画したセッション
+        self._threads = []  # 書き出し中のスレッド（前のセッションのものを含む）
+        # 書き出しを終えたセッションから戻ったサーフェス（次の録画で使い回す）
+        self._spare = queue.SimpleQueue()
+
+    @property
+    def session_dir(self):
+        """最後に開始したセッションの保存先"""
+        return self._session.session_dir if self._session is not None else None
+
+    @property
+    def captured(self):
+        """最後のセッションでキャプチャしたフレーム数"""
+        return self._session.captured if self._session is not None else 0
+
+    @property
+    def written(self):
+        """最後のセッションで書き出したフレーム数"""
+        return self._session.written if self._session is not None else 0
+
+    @property
+    def dropped(self):
+        """最後のセッションで捨てたフレーム数"""
+        return self._session.dropped if self._session is not None else 0
+
+    @property
+    def error(self):
+        """最後のセッションの書き出しエラー（なければ None）"""
+        return self._session.error if self._session is not None else None
+
+    def toggle(self, surface):
+        """録画の開始・停止を切り替え"""
+        if self.recording:
+            self.stop()
+        else:
+            self.start(surface)
+
+    def start(self, surface):
+        """録画を開始（前のセッションの書き出しが残っていても待たない）
+
+        Args:
+            surface (pygame.Surface): 録画対象の画面（サイズと形式の参照用）
+        """
+        if self.recording:
+            return
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        buffers = self._take_buffers(surface)
+        session = _Session(
+            os.path.join(self.output_dir, time.strftime("session_%Y%m%d_%H%M%S")),
+            surface.get_size(),
+            {
+                "bytes_per_pixel": buffers[0].get_bytesize(),
+                "pitch": buffers[0].get_pitch(),
+                "masks": list(buffers[0].get_masks()),
+            },
+        )
+        for buffer in buffers:
+            session.free.put(buffer)
+        session.thread = threading.Thread(
+            target=self._encode_loop, args=(session,), name="frame-encoder", daemon=True
+        )
+        session.thread.start()
+        self._threads.append(session.thread)
+        self._session = session
+        self.recording = True
+
+    def _take_buffers(self, surface):
+        """キャプチャ用サーフェスを用意（前の録画のものが同じ形式なら使い回す）"""
+        size, bytesize = surface.get_size(), surface.get_bytesize()
+        buffers = []
+        while True:
+            try:
+                buffer = self._spare.get_nowait()
+            except queue.Empty:
+                break
+            if (len(buffers) < self.buffer_count and buffer.get_size() == size
+                    and buffer.get_bytesize() == bytesize):
+                buffers.append(buffer)
+        while len(buffers) < self.buffer_count:
+            buffers.append(pygame.Surface(size, 0, surface))
+        return buffers
+
+    def capture(self, surface):
+        """画面を1フレーム分キャプチャ（空きがなければ捨てる）"""
+        if not self.recording:
+            return
+        session = self._session
+        try:
+            buffer = session.free.get_nowait()
+        except queue.Empty:
+            session.dropped += 1
+            return
+        buffer.blit(surface, (0, 0))
+        session.filled.put((session.captured, time.perf_counter(), buffer))
+        session.captured += 1
+
+    def stop(self):
+        """録画を停止（残りのフレームは書き出しスレッドが書き出す。ここでは待たない）"""
+        if not self.recording:
+            return
+        self.recording = False
+        self._session.filled.put(None)
+
+    def join(self, timeout=None):
+        """書き出し中のセッションがすべて終わるまで待つ（終了時・計測用）
+
+        Args:
+            timeout (float | None): スレッド1本あたりの最大待ち時間（秒）
+        """
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+
+    def _encode_loop(self, session):
+        """書き出しスレッド本体（停止の目印まで書き出し、最後にセッション情報を保存）"""
+        try:
+            self._write_frames(session)
+        except (OSError, pygame.error) as exc:
+            session.error = str(exc)
+            if self._session is session:
+                self.recording = False  # 以降のフレームは受け付けない（フレームループは待たない）
+            print(f"recording stopped: {exc}", file=sys.stderr)
+            self._discard_frames(session)
+        while True:
+            try:
+                self._spare.put(session.free.get_nowait())
+            except queue.Empty:
+                break
+        if not os.path.isdir(session.session_dir):
+            return  # ディレクトリを作れなかった（エラーは表示済み）
+        try:
+            self._write_metadata(session)
+        except OSError as exc:
+            print(f"recording: session.json could not be written: {exc}", file=sys.stderr)
+
+    def _write_frames(self, session):
+        """停止の目印までフレームを書き出す"""
+        session.session_dir = _make_unique_dir(session.session_dir)
+        raw_file = None
+        try:
+            if self.frame_format == FORMAT_RAW:
+                raw_file = open(  # pylint: disable=consider-using-with
+                    os.path.join(session.session_dir, "frames.raw"), "wb"
+                )
+            with open(
+                os.path.join(session.session_dir, "frames.csv"), "w", encoding="utf-8"
+            ) as index_file:
+                index_file.write("frame,timestamp\n")
+                while True:
+                    item = session.filled.get()
+                    if item is None:
+                        return
+                    frame, timestamp, buffer = item
+                    try:
+                        if raw_file is not None:
+                            raw_file.write(buffer.get_buffer())
+                        else:
+                            pygame.image.save(
+                                buffer,
+                                os.path.join(session.session_dir, f"frame_{frame:06d}.png"),
+                            )
+                    except (OSError, pygame.error):
+                        session.dropped += 1
+                        raise
+                    finally:
+                        session.free.put(buffer)
+                    index_file.write(f"{frame},{timestamp:.6f}\n")
+                    session.written += 1
+        finally:
+            if raw_file is not None:
+                raw_file.close()
+
+    def _discard_frames(self, session):
+        """書き出せなかったキュー上のフレームを捨て、サーフェスを空きに戻す"""
+        while True:
+            try:
+                item = session.filled.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None:
+                session.free.put(item[2])
+                session.dropped += 1
+
+    def _write_metadata(self, session):
+        """セッション情報をJSONで保存"""
+        metadata = {
+            "format": self.frame_format,
+            "width": session.size[0],
+            "height": session.size[1],
+            "frames": session.written,
+            "dropped": session.dropped,
+        }
+        if session.error is not None:
+            metadata["error"] = session.error
+        if self.frame_format == FORMAT_RAW:
+            metadata.update(session.pixel_layout)
+        with open(os.path.join(session.session_dir, "session.json"), "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2)
+
+
+def _make_unique_dir(path):
+    """ディレクトリを作る（同じ秒に開始したセッションがあれば連番を付ける）"""
+    candidate, number = path, 1
+    while True:
+        try:
+            os.makedirs(candidate)
+            return candidate
+        except FileExistsError:
+            number += 1
+            candidate = f"{path}_{number}"
@@ -1,15 +1,91 @@
 """ゲーム設定を管理するモジュール"""
 
+import json
+import os
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10
+    tomllib = None
+
+ENV_PREFIX = "TYPINGCLICKER_"
+DEFAULT_CONFIG_FILES = ("config.toml", "config.json")
+
+# 性能プリセット（実行中にも切り替え可能な項目のみ）
+PRESETS = {
+    "low_power": {
+        "FPS": 30,
+        "ANTIALIAS": False,
+        "DIRTY_RECTS": True,
+        "EFFECTS_ENABLED": True,
+        "PARTICLES_PER_CLICK": 4,
+        "PARTICLES_PER_KEYSTROKE": 0,
+        "LOW_LATENCY_INPUT": False,
+    },
+    "balanced": {
+        "FPS": 60,
+        "ANTIALIAS": True,
+        "DIRTY_RECTS": False,
+        "EFFECTS_ENABLED": True,
+        "PARTICLES_PER_CLICK": 12,
+        "PARTICLES_PER_KEYSTROKE": 6,
+        "LOW_LATENCY_INPUT": False,
+    },
+    "competitive": {
+        "FPS": 0,  # 上限なし
+        "ANTIALIAS": True,
+        "DIRTY_RECTS": False,
+        "EFFECTS_ENABLED": True,
+        "PARTICLES_PER_CLICK": 6,
+        "PARTICLES_PER_KEYSTROKE": 2,
+        "LOW_LATENCY_INPUT": True,
+    },
+}
+
+# 実行中の再読み込みでは反映できず、再起動が必要な設定（ウィンドウ・フォント・デバイスなど）
+RESTART_KEYS = frozenset({
+    "WIDTH", "HEIGHT", "RIGHT_WIDTH", "BTN_IMAGE_RATIO", "PANEL_VISIBLE_ROWS",
+    "PARTICLE_POOL_SIZE", "FLOATING_NUMBER_POOL_SIZE",
+    "AUDIO_ENABLED", "AUDIO_FREQUENCY", "AUDIO_BUFFER",
+    "AUDIO_KEYSTROKE_CHANNELS", "AUDIO_EFFECT_CHANNELS",
+    "CAPTURE_DIR", "CAPTURE_FORMAT", "CAPTURE_BUFFERS",
+    "METRICS_ENABLED", "METRICS_HOST", "METRICS_PORT",
+    "HOT_RELOAD", "HOT_RELOAD_INTERVAL",
+    "LEADERBOARD_ENABLED", "LEADERBOARD_PATH", "PROFILE_NAME", "PACKS_DIR",
+})
+# 文字や図形の描画キャッシュを作り直す必要がある設定
+RENDER_KEYS = frozenset({
+    "ANTIALIAS", "TEXT_COLOR", "BG_COLOR", "PANEL_BG", "PANEL_RECT", "PANEL_RECT_BORDER",
+    "PANEL_BTN", "PANEL_BTN_BORDER", "LEVEL_BAR_BG", "LEVEL_BAR_FILL", "LEVEL_BAR_BORDER",
+})
+# 入力の照合ルールに関わる設定
+MATCH_KEYS = frozenset({"MATCH_CASE_SENSITIVE", "MATCH_STRICT_PUNCTUATION"})
+
+
+class ConfigError(ValueError):
+    """設定ファイル・環境変数の値が不正な場合の例外"""
+
 
 class Config:
-    """ゲーム設定を管理するクラス"""
+    """ゲーム設定を管理するクラス
+
+    クラス属性が既定値。``Config.load()`` は設定ファイルと環境変数の値を
+    インスタンス属性として上書きし、検証してから返す。
+    """
+    source_path = None  # 読み込んだ設定ファイル（なければ None）
+    overrides = ()  # ((設定元, {設定名: 値}), ...) プリセットの切り替え後にも適用し直す
     # ボタンの配置などを定義
     WIDTH = 1440
     HEIGHT = 640
     RIGHT_WIDTH = 480     # 右側の幅（固定）、左側は余った領域
     BG_COLOR = (24, 24, 32)
     TEXT_COLOR = (235, 235, 235)
-    FPS = 60
+    FPS = 60              # 0で上限なし
+    PRESET = "balanced"
+    ANTIALIAS = True      # 文字のアンチエイリアス
+    DIRTY_RECTS = False   # Trueで変化した領域だけを再描画・転送
+    LOW_LATENCY_INPUT = False     # Trueでフレーム待機をビジーループにする（待機の誤差を減らす）
+    REPORT_INPUT_LATENCY = False  # Trueで終了時に入力〜表示レイテンシを出力
     BTN_IMAGE_RATIO = 0.35
     PANEL_BG = (34, 34, 46)
     PANEL_RECT = (58, 92, 130)
@@ -19,3 +95,230 @@ class Config:
     LEVEL_BAR_BG = (40, 40, 50)
     LEVEL_BAR_FILL = (90, 170, 120)
     LEVEL_BAR_BORDER = (180, 210, 240)
+    PANEL_VISIBLE_ROWS = 3  # 右パネルに並べるアップグレードの行数
+    PREFETCH_SENTENCES = 3  # 表示準備を済ませておく次の文章の数
+    # 入力の照合（’と'、全角と半角などの表記ゆれは常に同一視）
+    MATCH_CASE_SENSITIVE = True       # Falseで大文字小文字を区別しない
+    MATCH_STRICT_PUNCTUATION = True   # Falseで句読点・記号同士を区別しない
+    # エフェクト（プールの最大同時数）
+    EFFECTS_ENABLED = True
+    PARTICLE_POOL_SIZE = 1024
+    FLOATING_NUMBER_POOL_SIZE = 128
+    PARTICLES_PER_CLICK = 12
+    PARTICLES_PER_KEYSTROKE = 6
+    # 効果音（バッファは小さいほど低レイテンシ）
+    AUDIO_ENABLED = True
+    AUDIO_FREQUENCY = 44100
+    AUDIO_BUFFER = 256
+    AUDIO_VOLUME = 0.4
+    AUDIO_KEYSTROKE_CHANNELS = 8  # 高速タイピストでも打鍵音が途切れない数
+    AUDIO_EFFECT_CHANNELS = 4
+    # 録画（F9で開始・停止）
+    CAPTURE_DIR = "captures"
+    CAPTURE_FORMAT = "png"  # "png"（連番PNG）または "raw"（生フレーム）
+    CAPTURE_BUFFERS = 8     # 書き出し待ちにできる最大フレーム数
+    # メトリクス公開（Prometheus 形式、既定では無効）
+    METRICS_ENABLED = False
+    METRICS_HOST = "127.0.0.1"
+    METRICS_PORT = 9464
+    # sentences.py と設定ファイルの変更を検知して実行中に反映
+    HOT_RELOAD = True
+    HOT_RELOAD_INTERVAL = 0.5  # inotify が使えない環境でのポーリング間隔（秒）
+    # セーブ・リーダーボード（F6で表示する指標を切り替え）
+    AUTOSAVE_INTERVAL = 60.0  # 自動セーブの間隔（秒、0で無効）
+    LEADERBOARD_ENABLED = True
+    LEADERBOARD_PATH = "leaderboard.db"
+    LEADERBOARD_TTL = 5.0  # 表示中のランキングを取り直す間隔（秒）
+    PROFILE_NAME = ""      # 空なら OS のユーザー名
+    # サーフェスのメモリ予算（キャッシュは超えた分を古い順に追い出す）
+    SURFACE_BUDGET_MB = 64.0
+    SURFACE_REPORT_INTERVAL = 0.0  # 使用量を表示する間隔（秒、0で無効）
+    # コーパスパック（F7で切り替え）
+    PACKS_DIR = "packs"
+    CORPUS_PACK = ""  # 空なら組み込みの英語 / 日本語（sentences.py）
+
+    @classmethod
+    def load(cls, path=None, environ=None):
+        """設定ファイルと環境変数から設定を読み込む
+
+        優先順位は 既定値 < プリセット < 設定ファイル < 環境変数。
+        設定ファイルは引数、環境変数 TYPINGCLICKER_CONFIG、リポジトリ直下の
+        config.toml / config.json の順に探す。
+
+        Args:
+            path (str | None): 設定ファイル（.toml / .json）のパス
+            environ (Mapping[str, str] | None): 環境変数（省略時は os.environ）
+
+        Returns:
+            Config: 検証済みの設定
+
+        Raises:
+            ConfigError: 設定値が不正な場合
+        """
+        environ = os.environ if environ is None else environ
+        config = cls()
+        path = path or environ.get(ENV_PREFIX + "CONFIG") or _find_default_file()
+        file_values = _read_config_file(path) if path else {}
+        env_values = {
+            key[len(ENV_PREFIX):]: value
+            for key, value in environ.items()
+            if key.startswith(ENV_PREFIX) and key != ENV_PREFIX + "CONFIG"
+        }
+
+        preset = env_values.get("PRESET", file_values.get("PRESET", cls.PRESET))
+        config.overrides = ((path, file_values), ("environment", env_values))
+        config.apply_preset(preset)
+        config.validate()
+        config.source_path = path
+        return config
+
+    def apply_preset(self, name):
+        """性能プリセットを適用（実行中の切り替えにも使う）
+
+        設定ファイル・環境変数で指定した項目はプリセットより優先し、
+        切り替えた後も明示した値（FPS など）を保つ。
+
+        Args:
+            name (str): "low_power" / "balanced" / "competitive"
+        """
+        if name not in PRESETS:
+            raise ConfigError(
+                f"unknown preset '{name}' (choose from {', '.join(PRESETS)})"
+            )
+        self.PRESET = name  # pylint: disable=invalid-name
+        for key, value in PRESETS[name].items():
+            setattr(self, key, value)
+        for source, values in self.overrides:
+            for key, value in values.items():
+                self.set_value(key, value, source)
+
+    def set_value(self, key, value, source="override"):
+        """既定値と同じ型に変換して1項目を設定
+
+        Args:
+            key (str): 設定名（大文字小文字は問わない）
+            value (object): 値（環境変数の場合は文字列）
+            source (str): エラーメッセージに使う設定元
+        """
+        key = key.upper()
+        if key == "PRESET":
+            return
+        if not hasattr(Config, key) or key.startswith("_") or callable(getattr(Config, key)):
+            raise ConfigError(f"{source}: unknown setting '{key}'")
+        try:
+            setattr(self, key, _coerce(value, getattr(Config, key)))
+        except (TypeError, ValueError) as exc:
+            raise ConfigError(f"{source}: invalid value for {key}: {value!r}") from exc
+
+    def changed_keys(self, other):
+        """値が異なる設定名の集合を返す
+
+        Args:
+            other (Config): 比較対象の設定
+
+        Returns:
+            set[str]: 値が異なる設定名
+        """
+        return {
+            key for key in dir(Config)
+            if key.isupper() and getattr(self, key) != getattr(other, key)
+        }
+
+    def validate(self):
+        """設定値の範囲を検証
+
+        Raises:
+            ConfigError: 不正な値がある場合（すべての問題をまとめて報告）
+        """
+        checks = (
+            (self.WIDTH > 0 and self.HEIGHT > 0, "WIDTH/HEIGHT must be positive"),
+            (0 < self.RIGHT_WIDTH < self.WIDTH, "RIGHT_WIDTH must be within WIDTH"),
+            (self.FPS >= 0, "FPS must be >= 0 (0 = uncapped)"),
+            (0 < self.BTN_IMAGE_RATIO <= 1, "BTN_IMAGE_RATIO must be in (0, 1]"),
+            (self.PANEL_VISIBLE_ROWS >= 1, "PANEL_VISIBLE_ROWS must be >= 1"),
+            (self.PREFETCH_SENTENCES >= 1, "PREFETCH_SENTENCES must be >= 1"),
+            (self.PARTICLE_POOL_SIZE >= 0 and self.FLOATING_NUMBER_POOL_SIZE >= 0,
+             "effect pool sizes must be >= 0"),
+            (self.PARTICLES_PER_CLICK >= 0 and self.PARTICLES_PER_KEYSTROKE >= 0,
+             "particle counts must be >= 0"),
+            (self.AUDIO_BUFFER > 0 and self.AUDIO_BUFFER & (self.AUDIO_BUFFER - 1) == 0,
+             "AUDIO_BUFFER must be a power of two"),
+            (0.0 <= self.AUDIO_VOLUME <= 1.0, "AUDIO_VOLUME must be in [0, 1]"),
+            (self.AUDIO_KEYSTROKE_CHANNELS >= 1 and self.AUDIO_EFFECT_CHANNELS >= 1,
+             "audio channel counts must be >= 1"),
+            (self.CAPTURE_FORMAT in ("png", "raw"), "CAPTURE_FORMAT must be 'png' or 'raw'"),
+            (self.CAPTURE_BUFFERS >= 1, "CAPTURE_BUFFERS must be >= 1"),
+            (self.HOT_RELOAD_INTERVAL > 0, "HOT_RELOAD_INTERVAL must be positive"),
+            (0 <= self.METRICS_PORT <= 65535, "METRICS_PORT must be in 0..65535"),
+            (self.AUTOSAVE_INTERVAL >= 0, "AUTOSAVE_INTERVAL must be >= 0 (0 = disabled)"),
+            (self.LEADERBOARD_TTL >= 0, "LEADERBOARD_TTL must be >= 0"),
+            (self.SURFACE_BUDGET_MB >= 0, "SURFACE_BUDGET_MB must be >= 0 (0 = unlimited)"),
+            (self.SURFACE_REPORT_INTERVAL >= 0,
+             "SURFACE_REPORT_INTERVAL must be >= 0 (0 = disabled)"),
+        )
+        errors = [message for ok, message in checks if not ok]
+        for key in dir(Config):
+            default = getattr(Config, key)
+            if key.isupper() and isinstance(default, tuple) and len(default) == 3:
+                color = getattr(self, key)
+                if len(color) != 3 or not all(0 <= c <= 255 for c in color):
+                    errors.append(f"{key} must be an RGB triple in 0..255")
+        if errors:
+            raise ConfigError("invalid configuration: " + "; ".join(errors))
+
+
+def _find_default_file():
+    """リポジトリ直下の既定の設定ファイルを探す"""
+    base_dir = os.path.dirname(__file__)
+    for name in DEFAULT_CONFIG_FILES:
+        path = os.path.join(base_dir, name)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _read_config_file(path):
+    """設定ファイルを読み込み、キーを大文字にした辞書を返す"""
+    try:
+        if path.endswith(".toml"):
+            if tomllib is None:
+                raise ConfigError(f"{path}: TOML needs Python 3.11+ (use JSON instead)")
+            with open(path, "rb") as f:
+                data = tomllib.load(f)
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+    except (OSError, ValueError) as exc:
+        if isinstance(exc, ConfigError):
+            raise
+        raise ConfigError(f"{path}: {exc}") from exc
+    if not isinstance(data, dict):
+        raise ConfigError(f"{path}: top level must be a table/object")
+    return {str(key).upper(): value for key, value in data.items()}
+
+
+def _coerce(value, default):
+    """既定値の型に合わせて値を変換（環境変数の文字列も扱う）"""
+    if isinstance(default, bool):
+        if isinstance(value, str):
+            lowered = value.strip().lower()
+            if lowered in ("1", "true", "yes", "on"):
+                return True
+            if lowered in ("0", "false", "no", "off"):
+                return False
+            raise ValueError(value)
+        if not isinstance(value, bool):
+            raise TypeError(value)
+        return value
+    if isinstance(default, tuple):
+        if isinstance(value, str):
+            value = value.strip("()[] ").split(",")
+        return tuple(int(v) for v in value)
+    if isinstance(default, (int, float)):
+        if isinstance(value, bool):
+            raise TypeError(value)
+        converted = type(default)(value)
+        if isinstance(default, int) and isinstance(value, float) and not value.is_integer():
+            raise ValueError(value)
+        return converted
+    return str(value)
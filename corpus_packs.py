@@ -0,0 +1,207 @@
+"""多言語のコーパスパック（出題する文章とフォントの組）を管理するモジュール
+
+パックは ``packs/<パックID>/`` のディレクトリで、次の ``pack.json`` を置く。
+
+    {
+        "name": "Español → 日本語",
+        "target_language": "es",
+        "native_language": "ja",
+        "sentences": "sentences.json",
+        "target_font": "MyFont.ttf",
+        "native_font": "MyFont.ttf"
+    }
+
+``sentences`` は [ID, 入力する文, 訳] の一覧を持つ JSON ファイル（既定は
+sentences.json）。フォントはパックのディレクトリからの相対パスで、省略すると
+同梱のフォントを使う。起動時はディレクトリ名を列挙するだけで、ファイルは
+そのパックが選ばれたときに初めて読み込む。
+"""
+
+import io
+import json
+import os
+import queue
+import threading
+
+import pygame
+
+from sentence_corpus import SentenceCorpus, read_sentences_file
+
+PACK_MANIFEST = "pack.json"
+BUILTIN_PACK = "builtin"  # sentences.py と同梱フォント（英語 / 日本語）
+
+
+class PackError(Exception):
+    """パックの内容が不正な場合の例外"""
+
+
+class CorpusPack:
+    """読み込み済みのパック（文章の一覧とフォントファイルの中身）
+
+    フォントはファイルの中身（bytes）で持ち、表示に使う大きさの Font は
+    ``fonts`` で作る（ディスクの読み込みはフレームループで行わない）。
+    """
+
+    __slots__ = (
+        'pack_id', 'name', 'target_language', 'native_language',
+        'corpus', 'target_font', 'native_font',
+    )
+
+    def __init__(self, pack_id, name, target_language, native_language,
+                 corpus, target_font, native_font):
+        self.pack_id = pack_id
+        self.name = name
+        self.target_language = target_language
+        self.native_language = native_language
+        self.corpus = corpus
+        self.target_font = target_font  # フォントファイルの中身
+        self.native_font = native_font
+
+    def fonts(self, target_size, native_size):
+        """表示用のフォントを作る
+
+        Args:
+            target_size (int): 入力する文のフォントサイズ
+            native_size (int): 訳のフォントサイズ
+
+        Returns:
+            tuple[pygame.font.Font, pygame.font.Font]: (入力する文用, 訳用)
+        """
+        return (
+            pygame.font.Font(io.BytesIO(self.target_font), target_size),
+            pygame.font.Font(io.BytesIO(self.native_font), native_size),
+        )
+
+
+class PackRegistry:
+    """インストール済みのパックの一覧と、選ばれたパックの読み込み
+
+    一覧はディレクトリ名だけで作る（パックの数が増えても起動時間は変わらない）。
+    読み込み（JSON の解析とフォントファイルの読み込み）は専用スレッドで行い、
+    フレームループは ``poll`` で完成したパックを受け取って差し替えるだけにする。
+    """
+
+    def __init__(self, directory, sentences_path, default_font_path):
+        """
+        Args:
+            directory (str): パックを置くディレクトリ（なくてもよい）
+            sentences_path (str): 組み込みパックの sentences.py のパス
+            default_font_path (str): フォントを指定しないパックで使うフォント
+        """
+        self.directory = directory
+        self.sentences_path = sentences_path
+        self.default_font_path = default_font_path
+        self.pack_ids = ()
+        self.requested = None  # 読み込み中のパックID（最後に依頼したもの）
+        self._results = queue.SimpleQueue()
+        self.refresh()
+
+    def refresh(self):
+        """ディレクトリを列挙し直す（組み込みパックが先頭、以降は名前順）"""
+        try:
+            with os.scandir(self.directory) as entries:
+                found = sorted(entry.name for entry in entries if entry.is_dir())
+        except OSError:
+            found = []
+        self.pack_ids = (BUILTIN_PACK,) + tuple(found)
+
+    def load(self, pack_id, builtin_rows=None):
+        """パックをこのスレッドで読み込む（起動時用）
+
+        Args:
+            pack_id (str): パックID
+            builtin_rows (list | None): 組み込みパックの文章（読み込み済みならファイルを読まない）
+
+        Returns:
+            CorpusPack: 読み込んだパック
+
+        Raises:
+            PackError: パックがない、または内容が不正な場合
+            OSError: ファイルを読み込めない場合
+        """
+        fonts = {}
+        if pack_id == BUILTIN_PACK:
+            rows = builtin_rows if builtin_rows is not None else read_sentences_file(
+                self.sentences_path
+            )
+            font = _read_font(self.default_font_path, fonts)
+            corpus = _build_corpus(pack_id, rows)
+            return CorpusPack(pack_id, "English → 日本語", "en", "ja", corpus, font, font)
+        if pack_id not in self.pack_ids:
+            raise PackError(f"pack '{pack_id}' is not installed")
+        pack_dir = os.path.join(self.directory, pack_id)
+        manifest = _read_json(os.path.join(pack_dir, PACK_MANIFEST))
+        if not isinstance(manifest, dict):
+            raise PackError(f"{pack_id}: {PACK_MANIFEST} must be an object")
+        rows = _read_json(os.path.join(pack_dir, manifest.get("sentences", "sentences.json")))
+        return CorpusPack(
+            pack_id,
+            str(manifest.get("name", pack_id)),
+            str(manifest.get("target_language", "")),
+            str(manifest.get("native_language", "")),
+            _build_corpus(pack_id, rows),
+            _read_font(self._font_path(pack_dir, manifest.get("target_font")), fonts),
+            _read_font(self._font_path(pack_dir, manifest.get("native_font")), fonts),
+        )
+
+    def request(self, pack_id):
+        """パックの読み込みを専用スレッドで開始（結果は poll で受け取る）"""
+        self.requested = pack_id
+        threading.Thread(
+            target=self._load_in_background, args=(pack_id,), name="pack-loader", daemon=True
+        ).start()
+
+    def poll(self):
+        """読み込みが終わったパックを返す（最後に依頼したもの以外は捨てる）
+
+        Returns:
+            CorpusPack | Exception | None: 読み込んだパック、失敗時は例外、未完了なら None
+        """
+        result = None
+        while True:
+            try:
+                pack_id, loaded = self._results.get_nowait()
+            except queue.Empty:
+                return result
+            if pack_id == self.requested:
+                self.requested = None
+                result = loaded
+
+    def _load_in_background(self, pack_id):
+        """専用スレッドで読み込み、結果をキューへ入れる"""
+        try:
+            loaded = self.load(pack_id)
+        except (PackError, OSError, ValueError, TypeError, SyntaxError) as exc:
+            loaded = exc
+        self._results.put((pack_id, loaded))
+
+    def _font_path(self, pack_dir, name):
+        """マニフェストのフォント指定をパスにする（省略時は同梱フォント）"""
+        if not name:
+            return self.default_font_path
+        return os.path.join(pack_dir, name)
+
+
+def _read_json(path):
+    """JSON ファイルを読み込む"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _read_font(path, cache):
+    """フォントファイルの中身を読み込む（同じファイルは1回だけ）"""
+    data = cache.get(path)
+    if data is None:
+        with open(path, "rb") as f:
+            data = cache[path] = f.read()
+    return data
+
+
+def _build_corpus(pack_id, rows):
+    """文章の一覧からコーパスを作る（空ならエラー）"""
+    if not isinstance(rows, list):
+        raise PackError(f"{pack_id}: sentences must be a list")
+    corpus = SentenceCorpus.from_rows(rows)
+    if not corpus.entries:
+        raise PackError(f"{pack_id}: sentences list is empty")
+    return corpus
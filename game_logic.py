@@ -19,16 +19,17 @@ class GameLogic:
         return math.ceil(125 * (1.5 ** (level - 1)))
 
     @staticmethod
-    def current_multiplier(multiplier_level):
+    def current_multiplier(multiplier_level, factor=1.5):
         """現在の倍率を計算
 
         Args:
             multiplier_level (int): 倍率レベル
+            factor (float): 1レベルあたりの倍率
 
         Returns:
             float: 倍率
         """
-        return 1.5 ** multiplier_level
+        return factor ** multiplier_level
 
     @staticmethod
     def current_power_per_click(power_per_click_base, multiplier):
@@ -57,21 +58,18 @@ class GameLogic:
         return math.floor(power_per_second_base * multiplier)
 
     @staticmethod
-    def calc_costs(practice_level, auto_level, multiplier_level):
-        """各アップグレードのコストを計算
+    def upgrade_cost(base_cost, growth, level):
+        """アップグレードの次回購入コストを計算
 
         Args:
-            practice_level (int): タイピングスキルレベル
-            auto_level (int): 自動タイピングレベル
-            multiplier_level (int): CPU倍率レベル
+            base_cost (int): レベル0での購入コスト
+            growth (float): 1レベルごとのコスト増加率
+            level (int): 現在のアップグレードレベル
 
         Returns:
-            list[int]: [practice_cost, auto_cost, multiplier_cost]
+            int: 次回購入コスト
         """
-        practice_cost = math.ceil(10 * (1.35 ** practice_level))
-        auto_cost = math.ceil(50 * (1.60 ** auto_level))
-        multiplier_cost = math.ceil(500 * (3.00 ** multiplier_level))
-        return [practice_cost, auto_cost, multiplier_cost]
+        return math.ceil(base_cost * (growth ** level))
 
     @staticmethod
     def xp_for_current_level(level):
@@ -3,9 +3,28 @@
 import os
 import json
 
+from game_logic import GameLogic
+
+# 旧形式のセーブデータのキー → アップグレードID
+LEGACY_UPGRADE_KEYS = {
+    "practice_level": "typing_skill",
+    "auto_level": "auto_typing",
+    "multiplier_level": "cpu",
+}
+
 
 class GameState:
-    """ゲーム状態を管理するクラス"""
+    """ゲーム状態を管理するクラス
+
+    値が変わるたびに ``version`` を進め、購読中のコールバックへ通知する。
+    レベル進捗などの派生値は、元になる値が変わったときだけ再計算する。
+    """
+
+    __slots__ = (
+        'save_path', 'version', '_observers',
+        '_english_power', '_upgrade_levels', '_level', '_xp',
+        '_next_level_xp', '_level_progress', 'achievements', 'stats',
+    )
 
     def __init__(self, save_path=None):
         """
@@ -15,28 +34,139 @@ class GameState:
         self.save_path = save_path or os.path.join(
             os.path.dirname(__file__), "save.json"
         )
+        self.version = 0
+        self._observers = {}
 
         # ゲーム状態
-        self.english_power = 0
-        self.power_per_click_base = 1
-        self.power_per_second_base = 0
-        self.practice_level = 0
-        self.auto_level = 0
-        self.multiplier_level = 0
-        self.level = 1
-        self.xp = 0
+        self._english_power = 0
+        self._upgrade_levels = {}  # アップグレードID → レベル
+        self._level = 1
+        self._xp = 0
+        self.achievements = set()  # 解除済みの実績ID
+        self.stats = {}  # 累計値（実績の判定用。描画には影響しないため通知しない）
+
+        # 派生値のキャッシュ（Noneは未計算）
+        self._next_level_xp = None
+        self._level_progress = None
+
+    def subscribe(self, field, callback):
+        """値の変更通知を購読
+
+        Args:
+            field (str): 監視するフィールド名
+                ('english_power', 'upgrade_levels', 'level', 'xp')
+            callback (Callable[[object], None]): 新しい値を受け取る関数
+        """
+        self._observers.setdefault(field, []).append(callback)
+
+    def _notify(self, field, value):
+        """バージョンを進めて購読者に通知"""
+        self.version += 1
+        for callback in self._observers.get(field, ()):
+            callback(value)
+
+    def increment_stat(self, name, amount=1):
+        """累計値を加算
+
+        Returns:
+            int: 加算後の値
+        """
+        value = self.stats.get(name, 0) + amount
+        self.stats[name] = value
+        return value
+
+    def reset_stat(self, name):
+        """累計値を0に戻す（連続記録が途切れたときなど）"""
+        self.stats[name] = 0
+
+    def update_best(self, name, value):
+        """最高記録を更新
+
+        Returns:
+            bool: 記録を更新したか
+        """
+        if value <= self.stats.get(name, 0):
+            return False
+        self.stats[name] = value
+        return True
+
+    @property
+    def english_power(self):
+        """現在の English Power"""
+        return self._english_power
+
+    @english_power.setter
+    def english_power(self, value):
+        if value != self._english_power:
+            self._english_power = value
+            self._notify('english_power', value)
+
+    @property
+    def upgrade_levels(self):
+        """アップグレードID → レベル（変更は set_upgrade_level で行う）"""
+        return self._upgrade_levels
+
+    @upgrade_levels.setter
+    def upgrade_levels(self, value):
+        self._upgrade_levels = dict(value)
+        self._notify('upgrade_levels', self._upgrade_levels)
+
+    def set_upgrade_level(self, upgrade_id, level):
+        """アップグレード1件のレベルを更新"""
+        if self._upgrade_levels.get(upgrade_id) != level:
+            self._upgrade_levels[upgrade_id] = level
+            self._notify('upgrade_levels', self._upgrade_levels)
+
+    @property
+    def level(self):
+        """プレイヤーレベル"""
+        return self._level
+
+    @level.setter
+    def level(self, value):
+        if value != self._level:
+            self._level = value
+            self._next_level_xp = None
+            self._level_progress = None
+            self._notify('level', value)
+
+    @property
+    def xp(self):
+        """累計XP"""
+        return self._xp
+
+    @xp.setter
+    def xp(self, value):
+        if value != self._xp:
+            self._xp = value
+            self._level_progress = None
+            self._notify('xp', value)
+
+    @property
+    def next_level_xp(self):
+        """次のレベルに必要な累計XP（レベル変更時のみ再計算）"""
+        if self._next_level_xp is None:
+            self._next_level_xp = GameLogic.xp_required(self._level + 1)
+        return self._next_level_xp
+
+    @property
+    def level_progress(self):
+        """現在レベル内での進捗率（XP・レベル変更時のみ再計算）"""
+        if self._level_progress is None:
+            self._level_progress = GameLogic.xp_progress_ratio(
+                self._xp, self._level, self.next_level_xp
+            )
+        return self._level_progress
 
     def save(self):
         """現在の状態をJSONファイルに保存"""
         data = {
             "english_power": self.english_power,
-            "power_per_click_base": self.power_per_click_base,
-            "power_per_second_base": self.power_per_second_base,
-            "practice_level": self.practice_level,
-            "auto_level": self.auto_level,
-            "multiplier_level": self.multiplier_level,
+            "upgrade_levels": self.upgrade_levels,
             "level": self.level,
             "xp": self.xp,
+            "achievements": sorted(self.achievements),
+            "stats": self.stats,
         }
         try:
             with open(self.save_path, "w", encoding="utf-8") as f:
@@ -60,14 +190,20 @@ class GameState:
         self.english_power = int(
             data.get("english_power", data.get("typing_power", self.english_power))
         )
-        self.power_per_click_base = int(
-            data.get("power_per_click_base", self.power_per_click_base)
-        )
-        self.power_per_second_base = int(
-            data.get("power_per_second_base", self.power_per_second_base)
-        )
-        self.practice_level = int(data.get("practice_level", self.practice_level))
-        self.auto_level = int(data.get("auto_level", self.auto_level))
-        self.multiplier_level = int(data.get("multiplier_level", self.multiplier_level))
+        self.upgrade_levels = self._load_upgrade_levels(data)
         self.level = int(data.get("level", self.level))
         self.xp = int(data.get("xp", self.xp))
+        self.achievements = set(data.get("achievements", ()))
+        self.stats = {str(name): int(value) for name, value in data.get("stats", {}).items()}
+
+    @staticmethod
+    def _load_upgrade_levels(data):
+        """アップグレードレベルを読み込み（旧形式のキーも変換）"""
+        levels = {
+            upgrade_id: int(data[key])
+            for key, upgrade_id in LEGACY_UPGRADE_KEYS.items()
+            if key in data
+        }
+        for upgrade_id, level in data.get("upgrade_levels", {}).items():
+            levels[str(upgrade_id)] = int(level)
+        return levels
@@ -0,0 +1,213 @@
+"""ファイルの変更を検知して実行中のゲームへ反映するモジュール"""
+
+import ctypes
+import os
+import queue
+import select
+import struct
+import sys
+import threading
+
+# inotify のイベント種別（書き込みを終えて閉じた / 別名から移動してきた）
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+BACKEND_INOTIFY = "inotify"
+BACKEND_POLLING = "polling"
+
+
+class FileWatcher:
+    """ファイルの変更を別スレッドで監視するクラス
+
+    Linux では inotify でディレクトリを監視し、それ以外の環境や inotify が
+    使えない場合は更新時刻とサイズを一定間隔で比較する。エディタの保存は
+    一時ファイルからの置き換えになることが多いため、ファイルではなく
+    ディレクトリ単位で監視し、対象のファイル名だけを拾う。
+    """
+
+    def __init__(self, paths, callback, interval=0.5, debounce=0.1):
+        """
+        Args:
+            paths (Iterable[str]): 監視するファイル（存在しなくてもよい）
+            callback (Callable[[str], None]): 変更されたファイルのパスを受け取る関数
+                （監視スレッドから呼ばれる）
+            interval (float): ポーリング間隔・停止確認の間隔（秒）
+            debounce (float): 連続した変更をまとめる待ち時間（秒）
+        """
+        self.paths = frozenset(os.path.abspath(path) for path in paths)
+        self.callback = callback
+        self.interval = interval
+        self.debounce = debounce
+        self.backend = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """監視を開始（使用する方式は self.backend に入る）"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        inotify = _inotify_open({os.path.dirname(path) for path in self.paths})
+        if inotify is not None:
+            self.backend = BACKEND_INOTIFY
+            target, args = self._run_inotify, inotify
+        else:
+            self.backend = BACKEND_POLLING
+            target, args = self._run_polling, ()
+        self._thread = threading.Thread(
+            target=target, args=args, name="file-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """監視を停止"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run_inotify(self, fd, directories):
+        """inotify のイベントを読み、対象ファイルの変更を通知"""
+        try:
+            while not self._stop.is_set():
+                readable, _, _ = select.select([fd], [], [], self.interval)
+                if not readable:
+                    continue
+                changed = _read_inotify_events(fd, directories)
+                # 保存直後の連続イベントをまとめる
+                while select.select([fd], [], [], self.debounce)[0]:
+                    changed |= _read_inotify_events(fd, directories)
+                for path in sorted(changed & self.paths):
+                    self.callback(path)
+        finally:
+            os.close(fd)
+
+    def _run_polling(self):
+        """更新時刻とサイズを定期的に比較して変更を通知"""
+        stamps = {path: _stamp(path) for path in self.paths}
+        while not self._stop.wait(self.interval):
+            for path in sorted(self.paths):
+                stamp = _stamp(path)
+                if stamp != stamps[path]:
+                    stamps[path] = stamp
+                    if stamp is not None:
+                        self.callback(path)
+
+
+class HotReloader:
+    """変更されたファイルの再読み込みを監視スレッドで行い、結果をフレームループで反映する
+
+    重い処理（読み込み・解析・検証）は ``load`` として監視スレッドで実行し、
+    フレームループは ``apply_pending`` で完成した結果を受け取って差し替えるだけにする。
+    """
+
+    def __init__(self, interval=0.5):
+        """
+        Args:
+            interval (float): ポーリング方式の場合の確認間隔（秒）
+        """
+        self.interval = interval
+        self.watcher = None
+        self._handlers = {}  # パス -> (load, apply)
+        self._results = queue.SimpleQueue()
+
+    def register(self, path, load, apply):
+        """監視するファイルと処理を登録（start より前に呼ぶ）
+
+        Args:
+            path (str): 監視するファイル
+            load (Callable[[str], object]): 監視スレッドで実行する読み込み処理
+            apply (Callable[[object], None]): フレームループで実行する反映処理
+        """
+        self._handlers[os.path.abspath(path)] = (load, apply)
+
+    def start(self):
+        """監視を開始"""
+        self.watcher = FileWatcher(self._handlers, self._on_change, interval=self.interval)
+        self.watcher.start()
+
+    def stop(self):
+        """監視を停止"""
+        if self.watcher is not None:
+            self.watcher.stop()
+
+    def _on_change(self, path):
+        """監視スレッドで読み込みを行い、結果をキューへ入れる"""
+        load, apply = self._handlers[path]
+        try:
+            result = load(path)
+        except (OSError, ValueError, TypeError, SyntaxError) as exc:
+            print(f"reload failed: {path}: {exc}", file=sys.stderr)
+            return
+        self._results.put((apply, result))
+
+    def apply_pending(self):
+        """読み込み済みの結果を反映（フレームループから毎フレーム呼ぶ）
+
+        Returns:
+            int: 反映した件数
+        """
+        applied = 0
+        while True:
+            try:
+                apply, result = self._results.get_nowait()
+            except queue.Empty:
+                return applied
+            apply(result)
+            applied += 1
+
+
+def _inotify_open(directories):
+    """inotify を初期化してディレクトリを監視（使えなければ None）
+
+    Returns:
+        tuple[int, dict[int, str]] | None: ファイル記述子と 監視ID -> ディレクトリ
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        inotify_init1 = libc.inotify_init1
+        inotify_add_watch = libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    fd = inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        return None
+    watches = {}
+    for directory in directories:
+        wd = inotify_add_watch(fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO)
+        if wd < 0:
+            os.close(fd)
+            return None
+        watches[wd] = directory
+    return fd, watches
+
+
+def _read_inotify_events(fd, directories):
+    """inotify のイベントを読み、変更されたファイルのパスの集合を返す"""
+    try:
+        data = os.read(fd, 64 * 1024)
+    except BlockingIOError:
+        return set()
+    changed = set()
+    offset = 0
+    while offset + _EVENT_HEADER.size <= len(data):
+        wd, _, _, name_len = _EVENT_HEADER.unpack_from(data, offset)
+        offset += _EVENT_HEADER.size
+        name = data[offset:offset + name_len].rstrip(b"\0")
+        offset += name_len
+        if name and wd in directories:
+            changed.add(os.path.join(directories[wd], os.fsdecode(name)))
+    return changed
+
+
+def _stamp(path):
+    """変更検知用の (更新時刻, サイズ)。ファイルがなければ None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
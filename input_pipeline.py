@@ -0,0 +1,75 @@
+"""入力イベントの取得とレイテンシ計測を管理するモジュール"""
+
+import time
+
+import pygame
+
+from perf_stats import LatencyHistogram
+
+
+class InputPipeline:
+    """入力ステージを管理するクラス
+
+    使用するイベントだけをキューに入れるよう制限し、取り出した時刻を記録する。
+    画面反映（flip）後に ``mark_presented`` を呼ぶと、取り出しから表示までの
+    時間をヒストグラムに記録する。
+    """
+
+    # 入力のイベント（取り出しから表示までのレイテンシを記録する）
+    INPUT_EVENTS = frozenset((
+        pygame.KEYDOWN,  # pylint: disable=no-member
+        pygame.TEXTINPUT,  # pylint: disable=no-member
+        pygame.MOUSEBUTTONDOWN,  # pylint: disable=no-member
+        pygame.MOUSEWHEEL,  # pylint: disable=no-member
+    ))
+    # 画面の描き直しが必要なウィンドウのイベント（差分描画でも全体を描き直す）
+    # WINDOWEXPOSED などは pygame 2.0.1 以降にしかないため、ある名前だけを使う
+    REDRAW_EVENTS = frozenset(
+        getattr(pygame, name) for name in (
+            "VIDEOEXPOSE", "ACTIVEEVENT", "WINDOWEXPOSED", "WINDOWSHOWN",
+            "WINDOWRESTORED", "WINDOWMAXIMIZED", "WINDOWSIZECHANGED",
+        )
+        if hasattr(pygame, name)
+    )
+    # キューに入れるイベント（マウス移動などは捨てる）
+    ALLOWED_EVENTS = (
+        (pygame.QUIT,)  # pylint: disable=no-member
+        + tuple(sorted(INPUT_EVENTS))
+        + tuple(sorted(REDRAW_EVENTS))
+    )
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self._pending = []  # 表示待ちのイベントの取り出し時刻
+
+    def install(self):
+        """イベントキューの制限とテキスト入力の開始"""
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(self.ALLOWED_EVENTS))
+        pygame.key.start_text_input()
+
+    def poll(self):
+        """キューからイベントを取り出し、取り出し時刻を記録
+
+        Returns:
+            list[pygame.event.Event]: 取り出したイベント
+        """
+        events = pygame.event.get()
+        if events:
+            dequeued_at = time.perf_counter()
+            pending = self._pending
+            for event in events:
+                if event.type in self.INPUT_EVENTS:
+                    pending.append(dequeued_at)
+        return events
+
+    def mark_presented(self):
+        """画面反映直後に呼び、表示待ちイベントのレイテンシを記録"""
+        pending = self._pending
+        if not pending:
+            return
+        now = time.perf_counter()
+        record = self.latency.record_ms
+        for dequeued_at in pending:
+            record((now - dequeued_at) * 1000)
+        pending.clear()
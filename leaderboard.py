@@ -0,0 +1,306 @@
+"""プロフィール間のランキング（リーダーボード）を管理するモジュール
+
+記録は SQLite に保存し、プロフィールごとに各指標の自己ベストを1行で持つ。
+ゲーム側は LeaderboardClient を通して使い、データベースへのアクセスは
+すべて専用スレッドで行う（描画中にディスクI/Oを待つことはない）。
+"""
+
+import math
+import queue
+import sqlite3
+import threading
+import time
+
+METRIC_LEVEL = "level"
+METRIC_WPM = "best_wpm"
+METRIC_POWER = "english_power"
+METRICS = (METRIC_LEVEL, METRIC_WPM, METRIC_POWER)
+
+# 指標ごとの順位計算用の区間（値に対して単調非減少）
+_BUCKETS = {
+    METRIC_LEVEL: int,
+    METRIC_WPM: lambda value: int(value * 10),  # 0.1 WPM 刻み
+    METRIC_POWER: lambda value: int(math.log2(value) * 16) if value >= 1 else 0,  # 約4.4%刻み
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    profile TEXT PRIMARY KEY,
+    level INTEGER NOT NULL,
+    level_bucket INTEGER NOT NULL,
+    best_wpm REAL NOT NULL,
+    best_wpm_bucket INTEGER NOT NULL,
+    english_power INTEGER NOT NULL,
+    english_power_bucket INTEGER NOT NULL,
+    updated REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS score_buckets (
+    metric TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (metric, bucket)
+) WITHOUT ROWID;
+"""
+
+# 指標ごとの索引と、区間ごとの人数を保つトリガー
+_METRIC_SCHEMA = """
+CREATE INDEX IF NOT EXISTS scores_{m} ON scores ({m}_bucket DESC, {m} DESC);
+CREATE TRIGGER IF NOT EXISTS scores_{m}_insert AFTER INSERT ON scores BEGIN
+    INSERT INTO score_buckets VALUES ('{m}', NEW.{m}_bucket, 1)
+        ON CONFLICT DO UPDATE SET n = n + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS scores_{m}_update AFTER UPDATE OF {m}_bucket ON scores
+WHEN OLD.{m}_bucket != NEW.{m}_bucket BEGIN
+    UPDATE score_buckets SET n = n - 1 WHERE metric = '{m}' AND bucket = OLD.{m}_bucket;
+    INSERT INTO score_buckets VALUES ('{m}', NEW.{m}_bucket, 1)
+        ON CONFLICT DO UPDATE SET n = n + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS scores_{m}_delete AFTER DELETE ON scores BEGIN
+    UPDATE score_buckets SET n = n - 1 WHERE metric = '{m}' AND bucket = OLD.{m}_bucket;
+END;
+"""
+
+# 既存の記録より良い値だけを残す
+_UPSERT = """
+INSERT INTO scores VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (profile) DO UPDATE SET
+    level = max(level, excluded.level),
+    level_bucket = max(level_bucket, excluded.level_bucket),
+    best_wpm = max(best_wpm, excluded.best_wpm),
+    best_wpm_bucket = max(best_wpm_bucket, excluded.best_wpm_bucket),
+    english_power = max(english_power, excluded.english_power),
+    english_power_bucket = max(english_power_bucket, excluded.english_power_bucket),
+    updated = excluded.updated
+"""
+
+
+class LeaderboardStore:
+    """SQLite に保存したランキング
+
+    上位N件は指標ごとの索引を先頭から読むだけで求まる。順位は
+    「自分より上の区間の人数の合計（score_buckets）」と
+    「同じ区間で自分より上の人数（索引の範囲検索）」の和で求める。
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): データベースファイルのパス（":memory:" も可）
+        """
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            self.connection.executescript(
+                _SCHEMA + "".join(_METRIC_SCHEMA.format(m=metric) for metric in METRICS)
+            )
+
+    def close(self):
+        """接続を閉じる"""
+        self.connection.close()
+
+    def submit(self, results):
+        """記録をまとめて登録（1トランザクション、自己ベストのみ更新）
+
+        Args:
+            results (Iterable[tuple[str, int, float, int]]):
+                (プロフィール名, レベル, 最高WPM, English Power) の並び
+        """
+        now = time.time()
+        rows = [
+            (profile,
+             level, _BUCKETS[METRIC_LEVEL](level),
+             wpm, _BUCKETS[METRIC_WPM](wpm),
+             power, _BUCKETS[METRIC_POWER](power),
+             now)
+            for profile, level, wpm, power in results
+        ]
+        with self.connection:
+            self.connection.executemany(_UPSERT, rows)
+
+    def count(self):
+        """登録されているプロフィール数"""
+        return self.connection.execute("SELECT count(*) FROM scores").fetchone()[0]
+
+    def top(self, metric, limit=10):
+        """上位の記録を返す
+
+        Returns:
+            list[tuple[str, float]]: (プロフィール名, 値) を順位順に並べたもの
+        """
+        _check_metric(metric)
+        return self.connection.execute(
+            f"SELECT profile, {metric} FROM scores "
+            f"ORDER BY {metric}_bucket DESC, {metric} DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+
+    def rank(self, metric, profile):
+        """プロフィールの順位を返す（同じ値は同順位）
+
+        Returns:
+            tuple[int, float] | None: (順位, 値)。未登録なら None
+        """
+        _check_metric(metric)
+        row = self.connection.execute(
+            f"SELECT {metric}, {metric}_bucket FROM scores WHERE profile = ?", (profile,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, bucket = row
+        above = self.connection.execute(
+            "SELECT coalesce(sum(n), 0) FROM score_buckets WHERE metric = ? AND bucket > ?",
+            (metric, bucket),
+        ).fetchone()[0]
+        above += self.connection.execute(
+            f"SELECT count(*) FROM scores WHERE {metric}_bucket = ? AND {metric} > ?",
+            (bucket, value),
+        ).fetchone()[0]
+        return above + 1, value
+
+
+class LeaderboardView:
+    """ある時点のランキングの表示用データ（作成後は変更しない）"""
+
+    __slots__ = ('metric', 'top', 'own', 'fetched_at')
+
+    def __init__(self, metric, top, own, fetched_at):
+        self.metric = metric
+        self.top = top  # [(プロフィール名, 値), ...]
+        self.own = own  # (順位, 値) または None
+        self.fetched_at = fetched_at
+
+
+class LeaderboardClient:
+    """ゲームから使うランキングのクライアント
+
+    記録は ``record`` でメモリ上に溜め、``flush`` でまとめて専用スレッドへ渡す。
+    表示用のデータは ``view`` がキャッシュを即座に返し、TTL を過ぎていれば
+    裏で取り直す（取り直しが終わると ``revision`` が増える）。
+    """
+
+    def __init__(self, path, profile, ttl=5.0, limit=10):
+        """
+        Args:
+            path (str): データベースファイルのパス
+            profile (str): 自分のプロフィール名
+            ttl (float): 表示用データを取り直すまでの秒数
+            limit (int): 表示する上位の件数
+        """
+        self.path = path
+        self.profile = profile
+        self.ttl = ttl
+        self.limit = limit
+        self.revision = 0
+        self.error = None  # 直近のデータベースエラー
+        self.disabled = False  # データベースを開けなかった（以降の依頼は受け付けない）
+        self._pending = {}  # プロフィール名 -> まだ送っていない自己ベスト
+        self._views = {}  # 指標 -> LeaderboardView
+        self._requested = set()  # 取り直しを依頼中の指標
+        self._jobs = queue.Queue()
+        self._thread = None
+
+    def start(self):
+        """専用スレッドを開始"""
+        self._thread = threading.Thread(target=self._run, name="leaderboard", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """溜まっている記録を送ってからスレッドを止める"""
+        if self._thread is None:
+            return
+        self.flush()
+        self._jobs.put(None)
+        self._thread.join(timeout=5.0)
+        self._thread = None
+
+    def record(self, level, wpm, power, profile=None):
+        """記録を溜める（同じプロフィールは各指標の最大値だけを残す）"""
+        profile = profile or self.profile
+        best = self._pending.get(profile)
+        if best is not None:
+            level, wpm, power = max(level, best[0]), max(wpm, best[1]), max(power, best[2])
+        self._pending[profile] = (level, wpm, power)
+
+    def flush(self):
+        """溜めた記録を専用スレッドへ渡す（書き込みの完了は待たない）"""
+        if self.disabled:
+            self._pending.clear()
+            return
+        if not self._pending:
+            return
+        batch = [(profile, *values) for profile, values in self._pending.items()]
+        self._pending = {}
+        self._jobs.put(("submit", batch))
+        # 自分の順位が変わりうるので、次の view で取り直す
+        self._views = {
+            metric: LeaderboardView(metric, view.top, view.own, float("-inf"))
+            for metric, view in self._views.items()
+        }
+
+    def view(self, metric):
+        """表示用のデータを返す（待たない。古ければ裏で取り直す）
+
+        Returns:
+            LeaderboardView | None: まだ取得していなければ None
+        """
+        view = self._views.get(metric)
+        if self.disabled:
+            return view
+        if metric not in self._requested and (
+                view is None or time.monotonic() - view.fetched_at > self.ttl):
+            self._requested.add(metric)
+            self._jobs.put(("query", metric))
+        return view
+
+    def _run(self):
+        """専用スレッド本体（接続はこのスレッドだけが使う）"""
+        try:
+            store = LeaderboardStore(self.path)
+        except sqlite3.Error as exc:
+            # 処理するスレッドがなくなるので、以降はキューに入れない（入っていた分も捨てる）
+            self.disabled = True
+            self.error = str(exc)
+            self._discard_jobs()
+            return
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    return
+                try:
+                    self._handle(store, *job)
+                except sqlite3.Error as exc:
+                    self.error = str(exc)
+        finally:
+            store.close()
+
+    def _discard_jobs(self):
+        """キューに残っている依頼を捨てる"""
+        while True:
+            try:
+                self._jobs.get_nowait()
+            except queue.Empty:
+                return
+
+    def _handle(self, store, kind, payload):
+        """1件の処理を実行"""
+        if kind == "submit":
+            store.submit(payload)
+            return
+        metric = payload
+        try:
+            view = LeaderboardView(
+                metric, store.top(metric, self.limit), store.rank(metric, self.profile),
+                time.monotonic(),
+            )
+            self._views = {**self._views, metric: view}  # 参照の差し替え1回で公開
+            self.revision += 1
+        finally:
+            self._requested.discard(metric)
+
+
+def _check_metric(metric):
+    """SQL に埋め込む指標名を検証"""
+    if metric not in METRICS:
+        raise ValueError(f"unknown leaderboard metric '{metric}'")
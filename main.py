@@ -1,64 +1,362 @@
 """Main game module for TypingClicker."""
+import argparse
+import copy
+import getpass
 import os
-import random
 import sys
+import time
 
 import pygame
 
-from config import Config
-from game_logic import GameLogic
+from achievements import (
+    EVENT_CLEAN_STREAK, EVENT_ENGLISH_POWER, EVENT_KEYSTROKES, EVENT_LEVEL,
+    EVENT_PURCHASES, EVENT_SENTENCES, AchievementTracker, EventBus
+)
+from audio import AudioManager
+from capture import FrameRecorder
+from config import (
+    DEFAULT_CONFIG_FILES, MATCH_KEYS, PRESETS, RENDER_KEYS, RESTART_KEYS, Config, ConfigError
+)
+from corpus_packs import BUILTIN_PACK, PackError, PackRegistry
 from game_state import GameState
+from hot_reload import HotReloader
+from input_pipeline import InputPipeline
+from leaderboard import METRICS as LEADERBOARD_METRICS, METRIC_WPM, LeaderboardClient
+from matching import MatchRules
+from metrics import GameMetrics, MetricsExporter
+from passage import check_readable
+from race import RaceClient
+from sentence_corpus import read_sentences_file
 from sentences import sentences
-from ui import Button, Counter, TypingDisplay, UIRenderer
+from upgrades import UpgradeRegistry
+from ui import (
+    Button, Counter, EffectsManager, HitTester, LeaderboardPanel, ParagraphDisplay,
+    RacePanel, SentencePrefetcher, SurfaceLedger, Toast, TypingDisplay, UIRenderer
+)
+
+# WPM を記録する文章の最小打鍵数と最短時間（IME の一括確定などで極端な値になるのを防ぐ）
+WPM_MIN_KEYS = 10
+WPM_MIN_SECONDS = 2.0
+
+# クリック判定の領域キー
+HIT_MAIN_BUTTON = "main_button"
+HIT_UPGRADES = "upgrades"
 
 
 class Game:
     """ゲーム全体を管理するクラス"""
 
-    def __init__(self):
-        """ゲーム初期化"""
+    def __init__(self, passage_path=None, config=None, race_client=None, save_path=None):
+        """ゲーム初期化
+
+        Args:
+            passage_path (str | None): 長文モードで使うテキストファイル。
+                Noneなら短文をランダムに出題する
+            config (Config | None): 設定。Noneなら設定ファイルと環境変数から読み込む
+            race_client (RaceClient | None): レースモードで使うクライアント（未開始のもの）
+            save_path (str | None): セーブファイルのパス。Noneならリポジトリ直下の save.json
+        """
+        self.passage_path = passage_path
+        self.race = race_client
+        self._race_index = None  # 入力中のレース文章の番号（参加前は None）
+        self._race_cursor = 0  # 次に先読みするレース文章の番号
+        self._race_errors = 0
+        self.config = config or Config.load()
+        # 再読み込み時の差分は読み込んだ値同士で取る（F5での切り替えは残す）
+        self._loaded_config = copy.copy(self.config)
+        self.packs = None
+        self.pack = None  # 選択中のコーパスパック
+        self.corpus = None
+        self._load_initial_pack()
+
+        # ミキサーは pygame.init() より前に低レイテンシ設定を予約する
+        AudioManager.pre_init(self.config)
         pygame.init()  # pylint: disable=no-member
 
-        self.config = Config()
         self.screen = pygame.display.set_mode(
             (self.config.WIDTH, self.config.HEIGHT)
         )
-        pygame.display.set_caption("TypingClicker")
+        self._update_caption()
         self.clock = pygame.time.Clock()
+        self.input = InputPipeline()
+        self.input.install()
+        self.audio = AudioManager(self.config)
+        self.audio.load()
+        self.recorder = FrameRecorder(
+            os.path.join(os.path.dirname(__file__), self.config.CAPTURE_DIR),
+            buffer_count=self.config.CAPTURE_BUFFERS,
+            frame_format=self.config.CAPTURE_FORMAT,
+        )
 
         # レイアウト領域（右側は固定、左側は余った領域）
         self.right_width = self.config.RIGHT_WIDTH
         self.left_width = self.config.WIDTH - self.right_width
+        self.left_rect = pygame.Rect(0, 0, self.left_width, self.config.HEIGHT)
+        self.right_rect = pygame.Rect(
+            self.left_width, 0, self.right_width, self.config.HEIGHT
+        )
+
+        # 差分描画用に前回描画時の状態を覚えておく
+        self._left_render_key = None
+        self._right_render_key = None
+        self._effects_were_live = False
+        self._sentence_clean = True  # 表示中の文章でまだミスしていないか
+        self._sentence_started = None  # 表示中の文章の最初の正しい入力の時刻
+        self._sentence_keys = 0  # 表示中の文章での正しい入力数
+        self._autosave_ms = 0
+        self._surface_report_ms = 0
+        # サーフェスの使用量（所有者ごと）と、キャッシュ全体の予算
+        self.surfaces = SurfaceLedger(self._surface_budget_bytes())
 
         # 属性の事前宣言
         self.typing_display = None
+        self.prefetcher = None
         self.button = None
         self.counter = None
         self.ui_renderer = None
+        self.effects = None
+        self.toast = None
+        self.events = None
+        self.achievements = None
+        self.race_panel = None
+        self.leaderboard = None
+        self.leaderboard_panel = None
+        self.leaderboard_metric = None  # 表示中の指標（None は非表示）
 
         # フォント初期化
         self._init_fonts()
 
         # ゲーム状態の初期化
-        self.state = GameState()
-        self.next_level_xp = GameLogic.xp_required(self.state.level + 1)
+        self.state = GameState(save_path)
+        self.upgrades = UpgradeRegistry.load(
+            os.path.join(os.path.dirname(__file__), "data", "upgrades.json")
+        )
 
         # UI要素の初期化
         self._init_ui_elements()
+        self.state.subscribe('english_power', self.counter.set_value)
+        self.state.subscribe('level', self.upgrades.refresh_unlocks)
 
-        # 右パネル用の画像を事前読み込み
+        # 右パネル用の画像を事前読み込み（予算超過で追い出されたら描画時に読み直す）
         self.right_images, self.right_image_max_width = self._load_right_images()
 
         # UI描画クラスの初期化
         self._init_ui_renderer()
 
+        # クリック判定の領域を登録（ボタンは画像・位置の変更時に自分で更新する）
+        self.hit_regions = HitTester()
+        self.button.register(self.hit_regions, HIT_MAIN_BUTTON)
+        self.hit_regions.add(
+            HIT_UPGRADES,
+            self.ui_renderer.upgrade_list.viewport,
+            resolve=self.ui_renderer.upgrade_at,
+        )
+
         self.running = True
         self.auto_accumulator_ms = 0
 
         # 保存データの読み込み
         self.state.load()
-        self.next_level_xp = GameLogic.xp_required(self.state.level + 1)
-        self.counter.set_value(self.state.english_power)
+        self.upgrades.set_levels(self.state.upgrade_levels, self.state.level)
+        self._apply_config()
+        self.state.subscribe('level', lambda _level: self.audio.play("level_up"))
+        self._init_achievements()
+
+        self.metrics = GameMetrics()
+        self.exporter = None
+        if self.config.METRICS_ENABLED:
+            self._start_exporter()
+        self.reloader = None
+        if self.config.HOT_RELOAD:
+            self._start_hot_reload()
+        if self.race is not None:
+            self._start_race()
+        if self.config.LEADERBOARD_ENABLED:
+            self._start_leaderboard()
+
+    def _init_achievements(self):
+        """実績の判定を準備し、保存済みの進捗で判定し直す（定義の追加に対応）"""
+        self.toast = Toast(
+            self.label_font,
+            self.left_width // 2,
+            8,
+            self.config.TEXT_COLOR,
+            self.config.PANEL_RECT,
+            self.config.PANEL_RECT_BORDER,
+        )
+        self.events = EventBus()
+        self.achievements = AchievementTracker.load(
+            os.path.join(os.path.dirname(__file__), "data", "achievements.json"),
+            self.state.achievements,
+            self._on_achievement,
+        )
+        self.achievements.attach(self.events)
+
+        self.events.publish(EVENT_ENGLISH_POWER, self.state.english_power)
+        self.events.publish(EVENT_LEVEL, self.state.level)
+        for event in (EVENT_KEYSTROKES, EVENT_SENTENCES, EVENT_CLEAN_STREAK, EVENT_PURCHASES):
+            self.events.publish(event, self.state.stats.get(event, 0))
+
+    def _on_achievement(self, definition):
+        """実績の解除を通知"""
+        self.toast.show(f"Achievement: {definition.name}")
+
+    def _start_leaderboard(self):
+        """リーダーボードの専用スレッドを開始（表示は F6 で切り替え）"""
+        profile = self.config.PROFILE_NAME
+        if not profile:
+            try:
+                profile = getpass.getuser()
+            except (OSError, KeyError):
+                profile = "player"
+        self.leaderboard = LeaderboardClient(
+            os.path.join(os.path.dirname(__file__), self.config.LEADERBOARD_PATH),
+            profile,
+            ttl=self.config.LEADERBOARD_TTL,
+        )
+        self.leaderboard_panel = LeaderboardPanel(
+            self.right_sublabel_font,
+            (self.left_width - 8, 8),
+            self.config.TEXT_COLOR,
+            self.config.PANEL_RECT,
+            self.config.PANEL_RECT_BORDER,
+            ledger=self.surfaces,
+        )
+        self.leaderboard.start()
+
+    def _load_initial_pack(self):
+        """起動時のコーパスパックを読み込む（読めなければ組み込みパックで続行）
+
+        インストール済みのパックはディレクトリ名を列挙するだけで、
+        選ばれたパック以外のファイルは読まない。
+        """
+        base_dir = os.path.dirname(__file__)
+        self.packs = PackRegistry(
+            os.path.join(base_dir, self.config.PACKS_DIR),
+            os.path.join(base_dir, "sentences.py"),
+            os.path.join(base_dir, "assets", "NotoSansJP-Black.ttf"),
+        )
+        pack_id = BUILTIN_PACK if not self._packs_enabled else (
+            self.config.CORPUS_PACK or BUILTIN_PACK
+        )
+        try:
+            self.pack = self.packs.load(pack_id, builtin_rows=sentences)
+        except (PackError, OSError, ValueError, TypeError) as exc:
+            print(f"pack '{pack_id}' could not be loaded: {exc}", file=sys.stderr)
+            self.pack = self.packs.load(BUILTIN_PACK, builtin_rows=sentences)
+        self.corpus = self.pack.corpus
+
+    @property
+    def _packs_enabled(self):
+        """パックを切り替えられるか（長文モードとレースでは組み込みパックのまま）"""
+        return not self.passage_path and self.race is None
+
+    def _cycle_pack(self):
+        """コーパスパックを順に切り替え（新しくインストールされたパックも含める）"""
+        self.packs.refresh()
+        pack_ids = self.packs.pack_ids
+        current = self.packs.requested or self.pack.pack_id
+        index = pack_ids.index(current) if current in pack_ids else -1
+        self._request_pack(pack_ids[(index + 1) % len(pack_ids)])
+
+    def _request_pack(self, pack_id):
+        """パックの読み込みを裏で開始（完了したフレームで _switch_pack が差し替える）"""
+        if self._packs_enabled and pack_id != (self.packs.requested or self.pack.pack_id):
+            self.packs.request(pack_id)
+
+    def _apply_loaded_pack(self):
+        """読み込みが終わったパックがあれば差し替える"""
+        loaded = self.packs.poll()
+        if loaded is None:
+            return
+        if isinstance(loaded, Exception):
+            print(f"pack could not be loaded: {loaded}", file=sys.stderr)
+            self.toast.show("Pack could not be loaded")
+            return
+        self._switch_pack(loaded)
+
+    def _switch_pack(self, pack):
+        """読み込み済みのパックへ差し替え
+
+        前のパックのフォント・描画済みの文章・索引はここで参照を外して解放する。
+        このフレームで行うのはフォントの作成（メモリ上のファイルから）と
+        次の文章1件のレンダリングだけ。
+        """
+        self.pack = pack
+        self.corpus = pack.corpus
+        self.typing_display.set_fonts(*pack.fonts(*self._typing_font_sizes))
+        self._sentence_clean = True
+        self._sentence_started = None
+        self._sentence_keys = 0
+        self.prefetcher.invalidate()
+        self.prefetcher.fill()
+        self.prefetcher.advance()  # 残りの先読みは次のフレームから
+        self.toast.show(f"Pack: {pack.name}")
+
+    def _cycle_leaderboard(self):
+        """リーダーボードの表示を 非表示 → 各指標 → 非表示 の順に切り替え"""
+        if self.leaderboard is None:
+            return
+        order = (None,) + LEADERBOARD_METRICS
+        self.leaderboard_metric = order[(order.index(self.leaderboard_metric) + 1) % len(order)]
+
+    def _start_race(self):
+        """レースサーバーへの接続を開始（参加の完了は _update で確認する）"""
+        self.race_panel = RacePanel(
+            self.right_sublabel_font,
+            (8, 8),
+            self.config.TEXT_COLOR,
+            self.config.PANEL_RECT,
+            self.config.PANEL_RECT_BORDER,
+            ledger=self.surfaces,
+        )
+        self.race.start()
+
+    def _begin_race(self):
+        """配られた文章の並びで出題し直す"""
+        self._race_index = 0
+        self._race_cursor = 0
+        self._race_errors = 0
+        self._sentence_clean = True
+        self.prefetcher.invalidate()
+        self.prefetcher.fill(self.config.PREFETCH_SENTENCES)
+        self.prefetcher.advance()
+        self._report_race_progress()
+
+    @property
+    def _race_active(self):
+        """レースの文章を入力中か"""
+        return self._race_index is not None and self._race_index < len(self.race.entries)
+
+    def _report_race_progress(self):
+        """現在の進捗をクライアントへ書き込む（送信は通信スレッドが tick ごとに行う）"""
+        if self._race_active:
+            position = self.typing_display.current_position
+        else:
+            position = 0  # 完走後は最終位置のまま
+        self.race.send_progress(
+            min(self._race_index, len(self.race.entries)), position, self._race_errors
+        )
+
+    def _start_exporter(self):
+        """メトリクスの公開を開始（ゲージはスクレイプ時に読み出す）"""
+        state = self.state
+        self.exporter = MetricsExporter(
+            self.metrics,
+            gauges=(
+                ("english_power", "Current English Power", lambda: state.english_power),
+                ("level", "Current player level", lambda: state.level),
+                ("surface_bytes", "Bytes held by cached and displayed surfaces",
+                 lambda: self.surfaces.total_bytes),
+            ),
+            host=self.config.METRICS_HOST,
+            port=self.config.METRICS_PORT,
+        )
+        try:
+            self.exporter.start()
+        except OSError as exc:  # ポートが使用中など。メトリクスなしで続ける
+            print(f"metrics exporter could not start: {exc}", file=sys.stderr)
+            self.exporter = None
 
     def _init_fonts(self):
         """フォント初期化"""
@@ -89,26 +387,31 @@ class Game:
             offset_x=0,
             offset_y=0,
             label_font=self.label_font,
+            ledger=self.surfaces,
         )
 
         # タイピング表示の初期化
         self._init_typing_display()
 
-        # ランダムな文章を選択して表示
-        self._set_random_sentence()
+        # エフェクトの初期化
+        self.effects = EffectsManager(
+            self.label_font,
+            self.config.TEXT_COLOR,
+            self.config.PARTICLE_POOL_SIZE,
+            self.config.FLOATING_NUMBER_POOL_SIZE,
+            ledger=self.surfaces,
+        )
+
+        # 最初の文章を表示
+        self._next_text()
 
     def _init_typing_display(self):
         """タイピング表示の初期化"""
         base_size = int(min(self.left_width, self.config.HEIGHT) * 0.10)
-        font_path = os.path.join(
-            os.path.dirname(__file__), "assets", "NotoSansJP-Black.ttf"
-        )
-
-        typing_display_font_size = int(base_size * 0.5)
-        typing_display_font = pygame.font.Font(font_path, typing_display_font_size)
 
-        japanese_font_size = int(base_size * 0.35)
-        japanese_font = pygame.font.Font(font_path, japanese_font_size)
+        # 入力する文と訳のフォントは選択中のパックのもの（切り替え時に作り直す）
+        self._typing_font_sizes = (int(base_size * 0.5), int(base_size * 0.35))
+        typing_display_font, japanese_font = self.pack.fonts(*self._typing_font_sizes)
 
         button_center_y = int(self.config.HEIGHT * 0.48)
         button_size = int(self.config.HEIGHT * self.config.BTN_IMAGE_RATIO)
@@ -117,6 +420,19 @@ class Game:
         progress_bar_top_y = self.config.HEIGHT - 24 - 18 - 24
         typing_display_height = progress_bar_top_y - button_bottom_y - 20
         typing_display_top_y = button_bottom_y + 10
+        match_rules = self._build_match_rules()
+
+        if self.passage_path:
+            self.typing_display = ParagraphDisplay(
+                typing_display_font,
+                self.left_width,
+                typing_display_height,
+                offset_x=0,
+                offset_y=typing_display_top_y,
+                match_rules=match_rules,
+                ledger=self.surfaces,
+            )
+            return
 
         self.typing_display = TypingDisplay(
             typing_display_font,
@@ -125,6 +441,22 @@ class Game:
             typing_display_height,
             offset_x=0,
             offset_y=typing_display_top_y,
+            match_rules=match_rules,
+            ledger=self.surfaces,
+        )
+        self.prefetcher = SentencePrefetcher(
+            self.typing_display,
+            self._choose_sentence,
+            self.config.TEXT_COLOR,
+            depth=self.config.PREFETCH_SENTENCES,
+        )
+        self.prefetcher.fill(self.config.PREFETCH_SENTENCES)
+
+    def _build_match_rules(self):
+        """設定から入力の照合ルールを作成"""
+        return MatchRules(
+            case_sensitive=self.config.MATCH_CASE_SENSITIVE,
+            strict_punctuation=self.config.MATCH_STRICT_PUNCTUATION,
         )
 
     def _init_ui_renderer(self):
@@ -139,7 +471,8 @@ class Game:
             fonts,
             self.left_width,
             self.right_width,
-            self.config.HEIGHT
+            self.config.HEIGHT,
+            ledger=self.surfaces,
         )
 
     def _init_button(self):
@@ -156,7 +489,9 @@ class Game:
         # ボタン中央座標
         center = pygame.Vector2(self.left_width // 2, self.config.HEIGHT * 0.48)
 
-        return Button(center, button_image)
+        button = Button(center, button_image)
+        self.surfaces.account("images", button, button.image)
+        return button
 
     def _scale_image_keep_aspect(self, image, max_width, max_height):
         """アスペクト比を保ったまま、指定サイズに収まるようスケーリング"""
@@ -166,31 +501,32 @@ class Game:
         return pygame.transform.scale(image, new_size)
 
     def _load_right_images(self):
-        """右パネルで使う画像を読み込み＆スケーリング。最大幅も返す"""
-        asset_dir = os.path.join(os.path.dirname(__file__), "assets")
-        filenames = [
-            "keyboard_typing.png",
-            "robot.png",
-            "cpu.png",
-        ]
+        """右パネルで使う画像の予算つきキャッシュを作る。最大幅も返す
 
+        同じアイコンを使うアップグレードが多数あっても読み込みは1回だけ。
+        予算超過で追い出された画像は、次に使うときに読み込み直す。
+        """
+        filenames = sorted({
+            upgrade.icon for upgrade in self.upgrades.defs if upgrade.icon
+        })
+        images = self.surfaces.cache("images", loader=self._load_right_image)
+        max_loaded_width = 0
+        for name in filenames:
+            max_loaded_width = max(max_loaded_width, images.get(name).get_width())
+        return images, max_loaded_width
+
+    def _load_right_image(self, name):
+        """右パネルの画像を1枚読み込み＆スケーリング"""
         margin = 24
         available_height = self.config.HEIGHT - margin * 4
-        rect_height = available_height / 3
+        rect_height = available_height / self.config.PANEL_VISIBLE_ROWS
 
         # 画像は右パネルの幅の約35%、高さは矩形高さの80%以内で比率維持
         max_width = int(self.right_width * 0.35)
         max_height = int(rect_height * 0.8)
 
-        images = []
-        max_loaded_width = 0
-        for name in filenames:
-            path = os.path.join(asset_dir, name)
-            img = pygame.image.load(path)
-            scaled = self._scale_image_keep_aspect(img, max_width, max_height)
-            images.append(scaled)
-            max_loaded_width = max(max_loaded_width, scaled.get_width())
-        return images, max_loaded_width
+        path = os.path.join(os.path.dirname(__file__), "assets", name)
+        return self._scale_image_keep_aspect(pygame.image.load(path), max_width, max_height)
 
     def _scale_button_image(self, original_image, reference_h):
         """
@@ -217,162 +553,449 @@ class Game:
 
         return pygame.transform.scale(original_image, (new_width, new_height))
 
-    def _set_random_sentence(self):
-        """ランダムな文章を選択して表示"""
-        sentence = random.choice(sentences)
-        # sentence = [id, english, japanese]
-        english = sentence[1]
-        japanese = sentence[2]
-        self.typing_display.set_sentence(english, japanese)
+    def _start_hot_reload(self):
+        """sentences.py と設定ファイルの監視を開始"""
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        self.reloader = HotReloader(interval=self.config.HOT_RELOAD_INTERVAL)
+        self.reloader.register(
+            os.path.join(base_dir, "sentences.py"),
+            lambda path: self.corpus.rebuild(read_sentences_file(path)),
+            self._reload_corpus,
+        )
+        # 設定ファイルがまだなければ、既定の場所に作られたときに読み込む
+        config_paths = [self.config.source_path] if self.config.source_path else [
+            os.path.join(base_dir, name) for name in DEFAULT_CONFIG_FILES
+        ]
+        for path in config_paths:
+            self.reloader.register(path, Config.load, self._reload_config)
+        self.reloader.start()
+
+    def _reload_corpus(self, result):
+        """再読み込みした文章一覧へ差し替え（変更された文章の先読みだけ捨てる）"""
+        corpus, changed_ids = result
+        if self.pack.pack_id != BUILTIN_PACK:
+            return  # 組み込みパックに戻すときにファイルから読み直す
+        if not corpus.entries:
+            print("reload skipped: sentences list is empty", file=sys.stderr)
+            return
+        self.corpus = corpus
+        self.pack.corpus = corpus
+        if self.prefetcher is not None and changed_ids and not self._race_active:
+            current = {(entry[1], entry[2]) for entry in corpus.entries}
+            self.prefetcher.retain(
+                lambda prepared: (prepared.english, prepared.japanese) in current
+            )
+
+    def _reload_config(self, new_config):
+        """再読み込みした設定を反映（影響するキャッシュだけを作り直す）"""
+        changed = self._loaded_config.changed_keys(new_config)
+        self._loaded_config = new_config
+        self.config.overrides = new_config.overrides  # F5 で適用し直す値も新しいものにする
+        restart = changed & RESTART_KEYS
+        if restart:
+            print(f"config: restart required for {', '.join(sorted(restart))}", file=sys.stderr)
+        for key in changed - restart:
+            setattr(self.config, key, getattr(new_config, key))
+
+        if changed & MATCH_KEYS:
+            self.typing_display.set_match_rules(self._build_match_rules())
+        if "AUDIO_VOLUME" in changed:
+            self.audio.set_volume(self.config.AUDIO_VOLUME)
+        if "TEXT_COLOR" in changed:
+            self.effects.set_number_color(self.label_font, self.config.TEXT_COLOR)
+        if changed & RENDER_KEYS:
+            self._invalidate_text_caches()
+        if "CORPUS_PACK" in changed:
+            self._request_pack(self.config.CORPUS_PACK or BUILTIN_PACK)
+        self._apply_runtime_settings()
+
+    def _next_text(self):
+        """次の出題へ進む（長文モードは先頭から読み直す）"""
+        if self.passage_path:
+            if self.typing_display.path is None:
+                self.typing_display.open(self.passage_path)
+            else:
+                self.typing_display.restart()
+        else:
+            # 先読み済みの文章に差し替えるだけで、このフレームでは描画処理をしない
+            self.prefetcher.advance()
+
+    def _choose_sentence(self):
+        """次の文章を選択（レース中は配られた順、それ以外はランダム）
+
+        Returns:
+            tuple[str, str]: (英文, 日本語訳)
+        """
+        if self._race_index is not None and self._race_cursor < len(self.race.entries):
+            entry = self.race.entries[self._race_cursor]
+            self._race_cursor += 1
+            return entry[1], entry[2]
+        return self.corpus.choose()
 
     def handle_events(self):
         """イベント処理"""
-        for event in pygame.event.get():
+        for event in self.input.poll():
             if event.type == pygame.QUIT:  # pylint: disable=no-member
                 self.running = False
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # pylint: disable=no-member
                 self._handle_mouse_click(event.pos)
+            elif event.type == pygame.MOUSEWHEEL:  # pylint: disable=no-member
+                self._handle_mouse_wheel(event)
+            elif event.type == pygame.TEXTINPUT:  # pylint: disable=no-member
+                self._handle_text_input(event.text)
             elif event.type == pygame.KEYDOWN:  # pylint: disable=no-member
                 self._handle_keyboard(event)
+            elif event.type in InputPipeline.REDRAW_EVENTS:
+                self._request_full_redraw()
 
     def _handle_mouse_click(self, pos):
         """マウスクリック処理"""
-        if self.button.is_clicked(pos):
-            self._handle_main_button_click()
-        else:
-            self._check_right_panel_buttons(pos)
-
-    def _handle_main_button_click(self):
+        hit = self.hit_regions.hit(pos)
+        if hit is None:
+            return
+        key, detail = hit
+        if key == HIT_MAIN_BUTTON:
+            self._handle_main_button_click(pos)
+        elif key == HIT_UPGRADES:
+            self._handle_purchase(detail)
+
+    def _handle_main_button_click(self, pos=None):
         """メインボタンクリック処理"""
-        multiplier = GameLogic.current_multiplier(
-            self.state.multiplier_level
-        )
-        power = GameLogic.current_power_per_click(
-            self.state.power_per_click_base, multiplier
-        )
+        power = self.upgrades.power_per_click
         self._add_english_power(power)
 
-    def _check_right_panel_buttons(self, pos):
-        """右パネルボタンチェック"""
-        for idx, rect in enumerate(self.ui_renderer.right_button_rects):
-            if rect.collidepoint(pos):
-                self._handle_purchase(idx)
-                break
+        effect_pos = pos or (int(self.button.center.x), int(self.button.center.y))
+        self.effects.spawn_number(effect_pos, power)
+        self.effects.spawn_particles(effect_pos, self.config.PARTICLES_PER_CLICK)
+
+    def _handle_mouse_wheel(self, event):
+        """マウスホイールで右パネルをスクロール"""
+        upgrade_list = self.ui_renderer.upgrade_list
+        if upgrade_list.viewport.collidepoint(pygame.mouse.get_pos()):
+            upgrade_list.scroll_by(-event.y * upgrade_list.row_pitch // 2)
+
+    def _handle_scroll_key(self, key):
+        """スクロール用のキーなら右パネルをスクロールしてTrueを返す"""
+        upgrade_list = self.ui_renderer.upgrade_list
+        if key == pygame.K_UP:  # pylint: disable=no-member
+            upgrade_list.scroll_rows(-1)
+        elif key == pygame.K_DOWN:  # pylint: disable=no-member
+            upgrade_list.scroll_rows(1)
+        elif key == pygame.K_PAGEUP:  # pylint: disable=no-member
+            upgrade_list.scroll_pages(-1)
+        elif key == pygame.K_PAGEDOWN:  # pylint: disable=no-member
+            upgrade_list.scroll_pages(1)
+        elif key == pygame.K_HOME:  # pylint: disable=no-member
+            upgrade_list.scroll_to(0)
+        elif key == pygame.K_END:  # pylint: disable=no-member
+            upgrade_list.scroll_to(upgrade_list.max_offset)
+        else:
+            return False
+        return True
 
     def _handle_keyboard(self, event):
-        """キーボード入力処理"""
+        """キーボード入力処理（文字入力は TEXTINPUT で扱う）"""
         if event.key == pygame.K_ESCAPE:  # pylint: disable=no-member
             self.running = False
-        elif event.unicode:
-            self._handle_typing_input(event.unicode)
+        elif event.key == pygame.K_F5:  # pylint: disable=no-member
+            self._cycle_preset()
+        elif event.key == pygame.K_F6:  # pylint: disable=no-member
+            self._cycle_leaderboard()
+        elif event.key == pygame.K_F7:  # pylint: disable=no-member
+            self._cycle_pack()
+        elif event.key == pygame.K_F9:  # pylint: disable=no-member
+            self.recorder.toggle(self.screen)
+        else:
+            self._handle_scroll_key(event.key)
+
+    def _handle_text_input(self, text):
+        """テキスト入力処理（IMEの確定文字列は複数文字になりうる）"""
+        for char in text:
+            self._handle_typing_input(char)
 
     def _handle_typing_input(self, char):
         """タイピング入力処理"""
-        if self.typing_display.check_input(char):
-            self._add_english_power(1)
-            if self.typing_display.is_complete():
-                self._set_random_sentence()
+        if not self.typing_display.check_input(char):
+            self.audio.play("error")
+            self._sentence_clean = False
+            if self._race_active:
+                self._race_errors += 1
+                self._report_race_progress()
+            return
+
+        self.audio.play_keystroke()
+        self.metrics.keystrokes += 1
+        if self._sentence_started is None:
+            self._sentence_started = time.perf_counter()
+        self._sentence_keys += 1
+        self.events.publish(EVENT_KEYSTROKES, self.state.increment_stat(EVENT_KEYSTROKES))
+        self._add_english_power(1)
+        self.effects.spawn_particles(
+            self.typing_display.caret_pos, self.config.PARTICLES_PER_KEYSTROKE
+        )
+        racing = self._race_active
+        if self.typing_display.is_complete():
+            self.metrics.sentences_completed += 1
+            self._complete_sentence()
+            if racing:
+                self._race_index += 1
+            self._next_text()
+        if racing:
+            self._report_race_progress()
+
+    def _complete_sentence(self):
+        """文章の完了を記録（ミスなしの連続数も更新）"""
+        state = self.state
+        self.events.publish(EVENT_SENTENCES, state.increment_stat(EVENT_SENTENCES))
+        if self._sentence_clean:
+            self.events.publish(EVENT_CLEAN_STREAK, state.increment_stat(EVENT_CLEAN_STREAK))
+        else:
+            state.reset_stat(EVENT_CLEAN_STREAK)
+        self._sentence_clean = True
+        self._record_wpm()
+
+    def _record_wpm(self):
+        """完了した文章の WPM（5文字を1語とする）で最高記録を更新"""
+        started, keys = self._sentence_started, self._sentence_keys
+        self._sentence_started = None
+        self._sentence_keys = 0
+        if started is None or keys < WPM_MIN_KEYS:
+            return
+        seconds = time.perf_counter() - started
+        if seconds >= WPM_MIN_SECONDS:
+            self.state.update_best(METRIC_WPM, int(keys / 5 * 60 / seconds))
+
+    def _cycle_preset(self):
+        """性能プリセットを順に切り替え（再起動不要）"""
+        names = list(PRESETS)
+        current = names.index(self.config.PRESET) if self.config.PRESET in names else -1
+        self.config.apply_preset(names[(current + 1) % len(names)])
+        self._apply_config()
+
+    def _apply_config(self):
+        """設定変更を各コンポーネントへ反映し、描画キャッシュを破棄"""
+        self._invalidate_text_caches()
+        self._apply_runtime_settings()
+
+    def _invalidate_text_caches(self):
+        """文字・パネルの描画キャッシュを破棄（アンチエイリアスや色の変更時）"""
+        antialias = self.config.ANTIALIAS
+        self.counter.set_antialias(antialias)
+        self.typing_display.set_antialias(antialias)
+        self.ui_renderer.invalidate()
+        if self.prefetcher is not None:
+            self.prefetcher.color = self.config.TEXT_COLOR
+            self.prefetcher.invalidate()
+            if self._race_index is not None:
+                # 破棄したレース文章は表示中の次から準備し直す
+                self._race_cursor = self._race_index + 1
+            self.prefetcher.fill(self.config.PREFETCH_SENTENCES)
+
+    def _apply_runtime_settings(self):
+        """キャッシュに影響しない設定を反映"""
+        if self.prefetcher is not None:
+            self.prefetcher.depth = self.config.PREFETCH_SENTENCES
+        if self.leaderboard is not None:
+            self.leaderboard.ttl = self.config.LEADERBOARD_TTL
+        self.surfaces.set_budget(self._surface_budget_bytes())
+        self.effects.enabled = self.config.EFFECTS_ENABLED
+        self._request_full_redraw()
+        self._update_caption()
+
+    def _request_full_redraw(self):
+        """差分描画でも次のフレームで左右とも描き直す（ウィンドウが再表示されたときなど）"""
+        self._left_render_key = None
+        self._right_render_key = None
+
+    def _update_caption(self):
+        """ウィンドウタイトルに現在のプリセットを表示"""
+        pygame.display.set_caption(f"TypingClicker [{self.config.PRESET}]")
 
     def render(self):
         """画面に描画"""
-        self.screen.fill(self.config.BG_COLOR)
-        self.counter.set_value(self.state.english_power)
+        if self.config.DIRTY_RECTS:
+            self._render_dirty()
+        else:
+            self._draw_left()
+            self._draw_right()
+            pygame.display.flip()
+        self.input.mark_presented()
+
+    def _render_dirty(self):
+        """前回から変化した領域だけを再描画して転送"""
+        dirty = []
+        left_key = (self.state.version, self.typing_display.revision)
+        if self.race is not None:
+            left_key += (self.race.revision, self.race.error)
+        if self.leaderboard_metric is not None:
+            left_key += (self.leaderboard_metric, self.leaderboard.revision, self.leaderboard.error)
+        effects_live = self.effects.live_count > 0 or self.toast.active
+        if left_key != self._left_render_key or effects_live or self._effects_were_live:
+            self._left_render_key = left_key
+            self._draw_left()
+            dirty.append(self.left_rect)
+        self._effects_were_live = effects_live
+
+        right_key = (self.upgrades.revision, self.ui_renderer.upgrade_list.scroll_offset)
+        if right_key != self._right_render_key:
+            self._right_render_key = right_key
+            self._draw_right()
+            dirty.append(self.right_rect)
+
+        if dirty:
+            pygame.display.update(dirty)
+
+    def _draw_left(self):
+        """左側（カウンター・ボタン・英文・レベルバー・エフェクト）を描画"""
+        self.screen.fill(self.config.BG_COLOR, self.left_rect)
         self.button.draw(self.screen)
         self.counter.draw(self.screen, self.config.TEXT_COLOR)
 
         # レベル進捗バーの描画
-        level_state = {
-            'level': self.state.level,
-            'next_xp': self.next_level_xp,
-            'progress': GameLogic.xp_progress_ratio(
-                self.state.xp, self.state.level, self.next_level_xp
-            ),
-        }
-        self.ui_renderer.draw_level_bar(self.screen, level_state)
+        self.ui_renderer.draw_level_bar(self.screen, self.state)
 
-        # 右パネルの描画
-        multiplier = GameLogic.current_multiplier(self.state.multiplier_level)
-        game_state = {
-            'power_per_click': GameLogic.current_power_per_click(
-                self.state.power_per_click_base, multiplier
-            ),
-            'power_per_second': GameLogic.current_power_per_second(
-                self.state.power_per_second_base, multiplier
-            ),
-            'multiplier': multiplier,
-            'practice_level': self.state.practice_level,
-            'auto_level': self.state.auto_level,
-            'multiplier_level': self.state.multiplier_level,
-            'costs': GameLogic.calc_costs(
-                self.state.practice_level,
-                self.state.auto_level,
-                self.state.multiplier_level
-            ),
-        }
+        # タイピング表示の描画
+        self.typing_display.draw(self.screen, self.config.TEXT_COLOR)
+
+        # エフェクトは最前面に描画（左側の領域内に収める）
+        self.screen.set_clip(self.left_rect)
+        self.effects.draw(self.screen)
+        self.screen.set_clip(None)
+        if self.race_panel is not None:
+            self.race_panel.draw(self.screen, self.race)
+        if self.leaderboard_metric is not None:
+            self.leaderboard_panel.draw(self.screen, self.leaderboard, self.leaderboard_metric)
+        self.toast.draw(self.screen)
+
+    def _draw_right(self):
+        """右パネルを描画（派生値はレジストリのキャッシュを参照）"""
+        self.screen.fill(self.config.BG_COLOR, self.right_rect)
         self.ui_renderer.draw_right_panel(
             self.screen,
-            game_state,
+            self.upgrades,
             self.right_images,
             self.right_image_max_width
         )
 
-        # タイピング表示の描画
-        self.typing_display.draw(self.screen, self.config.TEXT_COLOR)
-
-        pygame.display.flip()
-
     def _handle_purchase(self, idx):
         """アップグレード購入処理（資金確認のみ）"""
-        costs = GameLogic.calc_costs(
-            self.state.practice_level,
-            self.state.auto_level,
-            self.state.multiplier_level
-        )
-        cost = costs[idx]
+        cost = self.upgrades.costs[idx]
         if self.state.english_power < cost:
+            self.audio.play("error")
             return  # 資金不足
 
         self.state.english_power -= cost
         self._apply_upgrade(idx)
-        self.counter.set_value(self.state.english_power)
+        self.audio.play("purchase")
 
     def _apply_upgrade(self, idx):
         """アップグレード効果を適用"""
-        if idx == 0:
-            self.state.practice_level += 1
-            self.state.power_per_click_base += 1
-        elif idx == 1:
-            self.state.auto_level += 1
-            self.state.power_per_second_base += 2
-        elif idx == 2:
-            self.state.multiplier_level += 1
+        self.upgrades.purchase(idx)
+        upgrade_id = self.upgrades.defs[idx].id
+        self.state.set_upgrade_level(upgrade_id, self.upgrades.levels[idx])
+        self.upgrades.refresh_unlocks(self.state.level)
+        self.events.publish(EVENT_PURCHASES, self.state.increment_stat(EVENT_PURCHASES))
 
     def run(self):
         """メインループ"""
         while self.running:
-            dt = self.clock.tick(self.config.FPS)
-            self._update_auto(dt)
+            # 入力はフレーム待機の後、時間経過の更新も済ませて描画の直前に取り出す
+            # （どちらのモードでも同じ）。低レイテンシ入力では待機をビジーループにして、
+            # OS のスリープの誤差で描画が遅れないようにする（CPU 使用率は上がる）
+            if self.config.LOW_LATENCY_INPUT:
+                dt = self.clock.tick_busy_loop(self.config.FPS)
+            else:
+                dt = self.clock.tick(self.config.FPS)
+            self._update(dt)
             self.handle_events()
+            if self.reloader is not None:
+                self.reloader.apply_pending()
             self.render()
-
-        self.state.save()
+            self.recorder.capture(self.screen)
+            if self.prefetcher is not None:
+                # 次の文章の準備は描画後（次フレームまでの待ち時間の前）に行う
+                self.prefetcher.fill()
+            self.metrics.record_frame(dt, self.clock.get_fps())
+
+        self.recorder.stop()
+        self.recorder.join()  # 終了時だけは書き出しの完了を待つ
+        if self.config.REPORT_INPUT_LATENCY:
+            print(f"input-to-display latency: {self.input.latency.format_summary()}")
+        self._save()
+        if self.exporter is not None:
+            self.exporter.stop()
+        if self.reloader is not None:
+            self.reloader.stop()
+        if self.race is not None:
+            self.race.stop()
+        if self.leaderboard is not None:
+            self.leaderboard.stop()
         pygame.quit()  # pylint: disable=no-member
         sys.exit()
 
+    def _save(self):
+        """セーブし、所要時間をメトリクスに記録（リーダーボードへの登録も依頼する）"""
+        start = time.perf_counter()
+        self.state.save()
+        if self.leaderboard is not None:
+            state = self.state
+            self.leaderboard.record(
+                state.level, state.stats.get(METRIC_WPM, 0), state.english_power
+            )
+            self.leaderboard.flush()
+        self.metrics.save_time.record_ms((time.perf_counter() - start) * 1000)
+
+    def _update(self, dt_ms):
+        """時間経過による更新"""
+        self._update_auto(dt_ms)
+        if self.race is not None and self._race_index is None and self.race.entries is not None:
+            self._begin_race()
+        if self.leaderboard_metric is not None:
+            self.leaderboard.view(self.leaderboard_metric)  # 古ければ裏で取り直す
+        if self.packs.requested is not None:
+            self._apply_loaded_pack()
+        self._update_autosave(dt_ms)
+        self._update_surface_report(dt_ms)
+        self.effects.update(dt_ms)
+        self.toast.update(dt_ms)
+
+    def _update_autosave(self, dt_ms):
+        """一定間隔で自動セーブ"""
+        interval_ms = self.config.AUTOSAVE_INTERVAL * 1000
+        if interval_ms <= 0:
+            return
+        self._autosave_ms += dt_ms
+        if self._autosave_ms >= interval_ms:
+            self._autosave_ms = 0
+            self._save()
+
+    def _surface_budget_bytes(self):
+        """設定のサーフェス予算（MiB）をバイト数にする"""
+        return int(self.config.SURFACE_BUDGET_MB * 1024 * 1024)
+
+    def _update_surface_report(self, dt_ms):
+        """一定間隔でサーフェスの使用量を表示"""
+        interval_ms = self.config.SURFACE_REPORT_INTERVAL * 1000
+        if interval_ms <= 0:
+            return
+        self._surface_report_ms += dt_ms
+        if self._surface_report_ms >= interval_ms:
+            self._surface_report_ms = 0
+            print(self.surfaces.report())
+
     def _update_auto(self, dt_ms):
         """毎秒加算の処理（Auto Typing）"""
         self.auto_accumulator_ms += dt_ms
         while self.auto_accumulator_ms >= 1000:
             self.auto_accumulator_ms -= 1000
-            multiplier = GameLogic.current_multiplier(self.state.multiplier_level)
-            gain = GameLogic.current_power_per_second(self.state.power_per_second_base, multiplier)
+            gain = self.upgrades.power_per_second
             if gain > 0:
                 self._add_english_power(gain)
 
     def _add_english_power(self, amount):
         self.state.english_power += amount
+        self.events.publish(EVENT_ENGLISH_POWER, self.state.english_power)
         self._add_xp(amount)
-        self.counter.set_value(self.state.english_power)
 
     def _add_xp(self, amount):
         self.state.xp += amount
@@ -380,11 +1003,62 @@ class Game:
 
     def _check_level_up(self):
         # 複数段のレベルアップにも対応
-        while self.state.xp >= self.next_level_xp:
+        while self.state.xp >= self.state.next_level_xp:
             self.state.level += 1
-            self.next_level_xp = GameLogic.xp_required(self.state.level + 1)
+            self.events.publish(EVENT_LEVEL, self.state.level)
+
+
+def parse_args(argv=None):
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="TypingClicker")
+    parser.add_argument(
+        "--passage", metavar="PATH", type=parse_passage_path,
+        help="長文モードでタイピングするテキストファイル（UTF-8）",
+    )
+    parser.add_argument(
+        "--race", metavar="HOST:PORT", type=parse_race_address,
+        help="レースサーバーに接続して対戦する",
+    )
+    parser.add_argument("--name", default="", help="レースでの表示名")
+    parser.add_argument(
+        "--pack", metavar="ID",
+        help="出題に使うコーパスパック（packs/ 以下のディレクトリ名）",
+    )
+    args = parser.parse_args(argv)
+    if args.race and args.passage:
+        parser.error("--race と --passage は同時に指定できません")
+    if args.pack and (args.race or args.passage):
+        parser.error("--pack は --race / --passage と同時に指定できません")
+    return args
+
+
+def parse_passage_path(value):
+    """長文モードのファイルを起動前に検証（ウィンドウを開いてから失敗しないように）"""
+    try:
+        check_readable(value)
+    except (OSError, UnicodeDecodeError) as exc:
+        raise argparse.ArgumentTypeError(f"cannot read '{value}': {exc}") from exc
+    return value
+
+
+def parse_race_address(value):
+    """HOST:PORT 形式のアドレスを (ホスト, ポート) に変換"""
+    host, _, port = value.rpartition(":")
+    if not host or not port.isdigit():
+        raise argparse.ArgumentTypeError(f"invalid address '{value}' (expected HOST:PORT)")
+    return host, int(port)
 
 
 if __name__ == "__main__":
-    game = Game()
+    args = parse_args()
+    race_client = None
+    if args.race:
+        race_client = RaceClient(args.race[0], args.race[1], args.name)
+    try:
+        game_config = Config.load()
+    except ConfigError as exc:
+        sys.exit(f"config error: {exc}")
+    if args.pack:
+        game_config.CORPUS_PACK = args.pack
+    game = Game(passage_path=args.passage, config=game_config, race_client=race_client)
     game.run()
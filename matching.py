@@ -0,0 +1,78 @@
+"""タイピング入力の文字照合ルールを提供するモジュール"""
+
+import string
+
+# 見た目が同じでもコードが異なる文字（代表となるASCII文字へ寄せる。常に同一視する）
+TYPOGRAPHIC_EQUIVALENTS = {
+    '‘': "'", '’': "'", '‚': "'", '‛': "'", '′': "'",
+    '“': '"', '”': '"', '„': '"', '‟': '"', '″': '"',
+    '‐': '-', '‑': '-', '‒': '-', '–': '-', '—': '-',
+    '―': '-', '−': '-',
+    '\u00a0': ' ', '\u2002': ' ', '\u2003': ' ', '\u2009': ' ', '\u202f': ' ',  # 各種の空白
+    '\u3000': ' ',  # 全角空白
+}
+
+# 見た目の違う記号（アクセント記号・長音・和文の句読点など）。句読点を区別しない場合だけ寄せる
+LOOSE_PUNCTUATION_EQUIVALENTS = {
+    '´': "'", '`': "'",
+    'ー': '-',
+    '、': ',', '。': '.', '・': '.',
+}
+
+# 句読点を区別しない場合に句読点全体をまとめる代表文字
+PUNCTUATION_CLASS = '.'
+
+
+class MatchRules:
+    """期待文字と入力文字を同一視するルール
+
+    正規化テーブルは生成時に一度だけ作る。文章は ``normalize`` で
+    期待文字の並び（同値類の代表文字）に変換しておき、打鍵ごとの照合は
+    入力文字との比較と、一致しない場合の ``classes`` の辞書参照1回で済ませる。
+    代表文字は自分自身に対応するため、比較が一致すればそのまま正解とみなせる。
+    """
+
+    __slots__ = ('case_sensitive', 'strict_punctuation', 'table', 'classes')
+
+    def __init__(self, case_sensitive=True, strict_punctuation=True):
+        """
+        Args:
+            case_sensitive (bool): Falseなら大文字小文字を区別しない
+            strict_punctuation (bool): Falseなら句読点・記号同士を区別しない
+        """
+        self.case_sensitive = case_sensitive
+        self.strict_punctuation = strict_punctuation
+        self.table = str.maketrans(_build_mapping(case_sensitive, strict_punctuation))
+        self.classes = {chr(code): rep for code, rep in self.table.items()}
+
+    def normalize(self, text):
+        """文字列を同値類の代表文字の並びに変換（文字数は変わらない）"""
+        return text.translate(self.table)
+
+
+def _build_mapping(case_sensitive, strict_punctuation):
+    """正規化テーブルの元になる 文字 -> 代表文字 の辞書を作成
+
+    変換先がさらに変換される場合（全角の「，」→「,」→「.」など）は
+    最終的な代表文字までたどり、代表文字が必ず自分自身に対応するようにする。
+    """
+    mapping = dict(TYPOGRAPHIC_EQUIVALENTS)
+    # 全角英数記号（IME入力）を半角へ
+    for code in range(0xFF01, 0xFF5F):
+        mapping[chr(code)] = chr(code - 0xFEE0)
+    if not case_sensitive:
+        for upper in string.ascii_uppercase:
+            mapping[upper] = upper.lower()
+    if not strict_punctuation:
+        mapping.update(LOOSE_PUNCTUATION_EQUIVALENTS)
+        for char in string.punctuation:
+            if char != PUNCTUATION_CLASS:
+                mapping[char] = PUNCTUATION_CLASS
+
+    resolved = {}
+    for char, rep in mapping.items():
+        while rep in mapping and mapping[rep] != rep:
+            rep = mapping[rep]
+        if rep != char:
+            resolved[char] = rep
+    return resolved
@@ -0,0 +1,170 @@
+"""稼働状況のメトリクスを Prometheus 形式で公開するモジュール"""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from perf_stats import LatencyHistogram
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+PREFIX = "typingclicker_"
+
+
+class GameMetrics:
+    """フレームループ側で更新するメトリクス
+
+    更新は属性の加算と固定バケットへの記録だけで、ロックは取らない。
+    読み出し側（スクレイプ）は多少古い値や途中の値を読むことがあるが、
+    フレームループが待たされることはない。
+    """
+
+    __slots__ = (
+        'frame_time', 'save_time', 'fps', 'keystrokes', 'keystrokes_per_second',
+        'sentences_completed', '_window_ms', '_window_keystrokes',
+    )
+
+    def __init__(self):
+        self.frame_time = LatencyHistogram()
+        self.save_time = LatencyHistogram()
+        self.fps = 0.0
+        self.keystrokes = 0
+        self.keystrokes_per_second = 0.0
+        self.sentences_completed = 0
+        self._window_ms = 0
+        self._window_keystrokes = 0
+
+    def record_frame(self, dt_ms, fps):
+        """1フレーム分を記録（打鍵数/秒は約1秒ごとに更新）
+
+        Args:
+            dt_ms (float): 前フレームからの経過時間 (ms)
+            fps (float): 直近の平均FPS
+        """
+        self.frame_time.record_ms(dt_ms)
+        self.fps = fps
+        self._window_ms += dt_ms
+        if self._window_ms >= 1000:
+            typed = self.keystrokes - self._window_keystrokes
+            self.keystrokes_per_second = typed * 1000 / self._window_ms
+            self._window_keystrokes = self.keystrokes
+            self._window_ms = 0
+
+
+class MetricsExporter:
+    """メトリクスを HTTP で公開するクラス
+
+    localhost 上のバックグラウンドスレッドで ``/metrics`` に応答する。
+    応答はリクエストのたびに GameMetrics と登録済みゲージから組み立てる。
+    """
+
+    def __init__(self, metrics, gauges=(), host="127.0.0.1", port=9464):
+        """
+        Args:
+            metrics (GameMetrics): 公開するメトリクス
+            gauges (Iterable[tuple[str, str, Callable[[], float]]]):
+                追加のゲージ（名前、説明、値を返す関数）
+            host (str): 待ち受けアドレス
+            port (int): 待ち受けポート（0なら空きポートを自動で選ぶ）
+        """
+        self.metrics = metrics
+        self.gauges = list(gauges)
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        """待ち受けを開始（実際のポート番号は self.port に入る）"""
+        if self._server is not None:
+            return
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """/metrics のみに応答するハンドラー"""
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """GETリクエストの処理"""
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                """アクセスログは出力しない"""
+
+        self._server = HTTPServer((self.host, self.port), Handler)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """待ち受けを停止"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def render(self):
+        """現在の値を Prometheus テキスト形式で返す"""
+        metrics = self.metrics
+        lines = []
+        _histogram(lines, "frame_time_seconds", "Frame time", metrics.frame_time)
+        _histogram(lines, "save_duration_seconds", "Save file write time", metrics.save_time)
+        _sample(lines, "fps", "gauge", "Average frames per second", metrics.fps)
+        _sample(lines, "keystrokes_total", "counter", "Correct keystrokes",
+                metrics.keystrokes)
+        _sample(lines, "keystrokes_per_second", "gauge",
+                "Correct keystrokes per second (last second)",
+                metrics.keystrokes_per_second)
+        _sample(lines, "sentences_completed_total", "counter", "Completed sentences",
+                metrics.sentences_completed)
+        for name, help_text, read in self.gauges:
+            _sample(lines, name, "gauge", help_text, read())
+        rss = process_rss_bytes()
+        if rss is not None:
+            _sample(lines, "process_resident_memory_bytes", "gauge",
+                    "Resident memory size", rss)
+        return "\n".join(lines) + "\n"
+
+
+def process_rss_bytes():
+    """プロセスの常駐メモリ量（/proc のない環境では None）"""
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _sample(lines, name, kind, help_text, value):
+    """単一値のメトリクスを追加"""
+    lines.append(f"# HELP {PREFIX}{name} {help_text}")
+    lines.append(f"# TYPE {PREFIX}{name} {kind}")
+    lines.append(f"{PREFIX}{name} {value}")
+
+
+def _histogram(lines, name, help_text, histogram):
+    """LatencyHistogram を秒単位の累積バケットに変換して追加"""
+    counts = list(histogram.counts)  # 記録中でもバケット同士の整合を保つため複製
+    total_ms = histogram.sum_ms
+    lines.append(f"# HELP {PREFIX}{name} {help_text}")
+    lines.append(f"# TYPE {PREFIX}{name} histogram")
+    cumulative = 0
+    for bound_ms, bucket_count in zip(histogram.bounds_ms, counts):
+        cumulative += bucket_count
+        lines.append(f'{PREFIX}{name}_bucket{{le="{bound_ms / 1000:g}"}} {cumulative}')
+    cumulative += counts[-1]
+    lines.append(f'{PREFIX}{name}_bucket{{le="+Inf"}} {cumulative}')
+    lines.append(f"{PREFIX}{name}_sum {total_ms / 1000}")
+    lines.append(f"{PREFIX}{name}_count {cumulative}")
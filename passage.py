@@ -0,0 +1,136 @@
+"""長文パッセージをファイルから逐次読み込むモジュール"""
+
+CHUNK_SIZE = 16 * 1024
+
+
+def check_readable(path, chunk_size=CHUNK_SIZE * 64):
+    """ファイルを開けて最後まで UTF-8 として読めるかを確認（内容は保持しない）
+
+    Args:
+        path (str): テキストファイルのパス
+        chunk_size (int): 1回に読み込む文字数
+
+    Raises:
+        OSError: ファイルがない、または読み込めない場合
+        UnicodeDecodeError: UTF-8 として読めない場合
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        while f.read(chunk_size):
+            pass
+
+
+def iter_words(path, chunk_size=CHUNK_SIZE):
+    """テキストファイルから単語を1つずつ取り出すジェネレーター
+
+    ファイル全体は読み込まず、一定サイズずつ読みながら空白で区切る。
+    改行や連続した空白は1つの区切りとして扱う。空白のない長い並び
+    （圧縮された文書や CJK の文章）は chunk_size 文字ごとの断片に分け、
+    保持する文字数を一定に保つ。
+
+    Args:
+        path (str): テキストファイルのパス（UTF-8）
+        chunk_size (int): 1回に読み込む文字数（断片の最大の長さ）
+
+    Yields:
+        tuple[str, bool]: (単語または断片, 次の断片が同じ単語の続きなら True)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        carry = ""
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            words = (carry + chunk).split()
+            # チャンク末尾が空白でなければ最後の単語は次のチャンクに続く
+            if words and not chunk[-1].isspace():
+                carry = words.pop()
+            else:
+                carry = ""
+            for word in words:
+                yield word, False
+            # 続きが長すぎる場合は断片として先に渡す（次の断片と空白なしでつながる）。
+            # 単語が次のチャンクで終わる場合に備え、carry には1文字以上残す
+            while len(carry) > chunk_size:
+                yield carry[:chunk_size], True
+                carry = carry[chunk_size:]
+        if carry:
+            yield carry, False
+
+
+def wrap_words(words, measure, max_width, space_width):
+    """単語列を指定幅で折り返し、1行ずつ返すジェネレーター
+
+    各行の末尾には次の単語との区切りの空白を含める（最終行を除く）。
+    1単語が幅を超える場合は文字単位で分割し、分割した位置には空白を入れない
+    （元の文章にない文字を入力させない）。
+
+    Args:
+        words (Iterable[tuple[str, bool]]): iter_words が返す (単語, 続きがあるか) の列
+        measure (Callable[[str], int]): 文字列の描画幅を返す関数
+        max_width (int): 1行の最大幅
+        space_width (int): 空白1文字の描画幅
+
+    Yields:
+        str: 折り返し済みの1行
+    """
+    line = ""
+    line_width = 0
+    separator = ""  # 直前の断片と次の断片の間に入れる文字（単語の途中なら空）
+    for piece, joined in _iter_pieces(words, measure, max_width):
+        piece_width = measure(piece)
+        if line and line_width + piece_width > max_width:
+            yield line + separator
+            line = ""
+            line_width = 0
+        elif line:
+            line += separator
+        line += piece
+        line_width += piece_width
+        separator = "" if joined else " "
+        if not joined:
+            line_width += space_width
+    if line:
+        yield line
+
+
+def _iter_pieces(words, measure, max_width):
+    """単語列を1行に収まる断片の列にする
+
+    続きのある断片は末尾の収まりきらない部分を次の断片の先頭につなげてから
+    分割する（断片の境目で短い行ができないようにする）。
+
+    Yields:
+        tuple[str, bool]: (断片, 次の断片が同じ単語の続きなら True)
+    """
+    rest = ""
+    for word, continues in words:
+        pieces = _split_long_word(rest + word, measure, max_width)
+        if continues:
+            pieces = list(pieces)
+            rest = pieces.pop()[0]
+            for piece, _ in pieces:
+                yield piece, True
+        else:
+            rest = ""
+            yield from pieces
+    if rest:
+        yield rest, False
+
+
+def _split_long_word(word, measure, max_width):
+    """1行に収まらない単語を文字単位で分割
+
+    Yields:
+        tuple[str, bool]: (断片, 次の断片が同じ単語の続きなら True)
+    """
+    if measure(word) <= max_width:
+        yield word, False
+        return
+    piece = ""
+    for char in word:
+        if piece and measure(piece + char) > max_width:
+            yield piece, True
+            piece = ""
+        piece += char
+    if piece:
+        yield piece, False
@@ -0,0 +1,90 @@
+"""性能計測用の統計クラスを提供するモジュール"""
+
+from bisect import bisect_left
+
+
+class LatencyHistogram:
+    """固定バケットのレイテンシヒストグラム
+
+    記録はバケット番号を二分探索してカウントを増やすだけなので、
+    フレームループ内から呼んでもメモリ確保は発生しない。
+    """
+
+    DEFAULT_BOUNDS_MS = (
+        0.5, 1, 2, 4, 8, 12, 16, 20, 25, 33, 50, 75, 100, 250, 500, 1000,
+    )
+
+    __slots__ = ('bounds_ms', 'counts', 'count', 'sum_ms', 'max_ms')
+
+    def __init__(self, bounds_ms=DEFAULT_BOUNDS_MS):
+        """
+        Args:
+            bounds_ms (tuple[float, ...]): 各バケットの上限 (ms、昇順)
+        """
+        self.bounds_ms = tuple(bounds_ms)
+        self.counts = [0] * (len(self.bounds_ms) + 1)  # 末尾は上限超過
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def record_ms(self, value_ms):
+        """1件記録
+
+        Args:
+            value_ms (float): レイテンシ (ms)
+        """
+        self.counts[bisect_left(self.bounds_ms, value_ms)] += 1
+        self.count += 1
+        self.sum_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def reset(self):
+        """記録を消去"""
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def percentile(self, q):
+        """パーセンタイル値（該当バケットの上限）を返す
+
+        Args:
+            q (float): 0.0 ~ 1.0
+
+        Returns:
+            float: レイテンシ (ms)。記録がなければ0.0
+        """
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for idx, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target and bucket_count:
+                if idx < len(self.bounds_ms):
+                    return min(float(self.bounds_ms[idx]), self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+    def summary(self):
+        """集計結果を辞書で返す"""
+        mean = self.sum_ms / self.count if self.count else 0.0
+        return {
+            'count': self.count,
+            'mean_ms': mean,
+            'p50_ms': self.percentile(0.50),
+            'p95_ms': self.percentile(0.95),
+            'p99_ms': self.percentile(0.99),
+            'max_ms': self.max_ms,
+        }
+
+    def format_summary(self):
+        """集計結果を1行の文字列で返す"""
+        stats = self.summary()
+        return (
+            f"n={stats['count']} mean={stats['mean_ms']:.2f}ms "
+            f"p50<={stats['p50_ms']:.2f}ms p95<={stats['p95_ms']:.2f}ms "
+            f"p99<={stats['p99_ms']:.2f}ms max={stats['max_ms']:.2f}ms"
+        )
@@ -0,0 +1,9 @@
+"""ネットワーク対戦（タイピングレース）
+
+サーバーは ``python -m race.server`` で起動し、ゲームは ``--race HOST:PORT`` で接続する。
+サーバー（RaceServer）は ``race.server`` から直接 import する（``-m`` 実行時の二重読み込みを避けるため）。
+"""
+
+from .client import RaceClient
+
+__all__ = ['RaceClient']
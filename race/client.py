@@ -0,0 +1,163 @@
+"""タイピングレースのクライアント
+
+通信は専用スレッドの asyncio ループで行い、ゲーム側とは属性の読み書き
+（参照の代入のみ）でやり取りする。ゲームのフレームループが通信を待つことはない。
+"""
+
+import asyncio
+import threading
+
+from .protocol import MSG_JOIN, MSG_PROGRESS, MSG_TICK, MSG_WELCOME, TICK_SECONDS, decode, encode
+
+
+class RaceClient:
+    """レースサーバーとの通信を管理するクラス
+
+    ゲーム側は ``send_progress`` で最新の進捗を書き込むだけで、送信は
+    通信スレッドが tick ごとに最新の値だけをまとめて行う。
+    受信した順位は ``standings`` を丸ごと差し替えて公開する。
+    """
+
+    def __init__(self, host, port, name):
+        """
+        Args:
+            host (str): サーバーのホスト名
+            port (int): サーバーのポート番号
+            name (str): 表示名
+        """
+        self.host = host
+        self.port = port
+        self.name = name
+        self.player_id = None
+        self.entries = None  # 出題される (ID, 英文, 日本語訳) の並び（参加前は None）
+        self.total = 0  # レース全体の文字数
+        self.standings = ()  # (進捗, ミス数, 順位, ID, 名前) を順位順に並べたもの
+        self.revision = 0  # standings を差し替えるたびに増える
+        self.error = None  # 通信エラーの内容
+        self.connected = False
+        self._progress = (0, 0, 0)  # (文章番号, 入力位置, ミス数)
+        self._players = {}  # ID -> [名前, 進捗, ミス数, 順位]（通信スレッドのみが使う）
+        self._loop = None
+        self._stop = None
+        self._thread = None
+
+    def start(self):
+        """通信スレッドを開始"""
+        self._thread = threading.Thread(target=self._run_thread, name="race-client", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """通信を終了してスレッドを止める"""
+        if self._thread is None:
+            return
+        if self._loop is not None and self._stop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._stop.set)
+            except RuntimeError:  # エラーで通信スレッドが先に終わり、ループが閉じている
+                pass
+        self._thread.join(timeout=2.0)
+        self._thread = None
+
+    def send_progress(self, sentence_index, position, errors):
+        """最新の進捗を書き込む（送信は次の tick で行われる）"""
+        self._progress = (sentence_index, position, errors)
+
+    def _run_thread(self):
+        """通信スレッド本体"""
+        try:
+            asyncio.run(self._main())
+        except (OSError, ValueError, asyncio.IncompleteReadError) as exc:
+            self.error = str(exc) or exc.__class__.__name__
+        except (KeyError, TypeError) as exc:  # 形式の合わないメッセージ（tick など）
+            self.error = f"malformed message from race server ({exc!r})"
+        self.connected = False
+
+    async def _main(self):
+        """接続して参加し、送信と受信を並行して行う"""
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(encode({"t": MSG_JOIN, "n": self.name}))
+            self._on_welcome(decode(await reader.readline()))
+            self.connected = True
+            receiver = asyncio.create_task(self._receive(reader))
+            sender = asyncio.create_task(self._send(writer))
+            stopper = asyncio.create_task(self._stop.wait())
+            done, pending = await asyncio.wait(
+                (receiver, sender, stopper), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in pending:
+                task.cancel()
+            for task in done:
+                task.result()
+        finally:
+            writer.close()
+
+    def _on_welcome(self, message):
+        """参加時の情報を受け取る"""
+        if message.get("t") != MSG_WELCOME:
+            raise ValueError("unexpected response from race server")
+        try:
+            player_id = message["id"]
+            entries = [tuple(entry) for entry in message["s"]]
+            total = sum(len(entry[1]) for entry in entries)
+            players = {
+                pid: [name, progress, errors, rank]
+                for pid, name, progress, errors, rank in message["p"]
+            }
+            hash(player_id)
+        except (KeyError, IndexError, TypeError, ValueError) as exc:
+            raise ValueError(f"malformed welcome from race server ({exc!r})") from exc
+        self.player_id = player_id
+        self.total = total
+        self._players.update(players)
+        self.name = self.name or f"player{self.player_id}"  # サーバーと同じ既定名
+        self._players[self.player_id] = [self.name, 0, 0, 0]
+        self._publish_standings()
+        self.entries = entries
+
+    async def _send(self, writer):
+        """tick ごとに、変化があれば最新の進捗を1件だけ送る"""
+        last = None
+        while True:
+            progress = self._progress
+            if progress != last:
+                last = progress
+                writer.write(encode({
+                    "t": MSG_PROGRESS, "i": progress[0], "c": progress[1], "e": progress[2],
+                }))
+                await writer.drain()
+            await asyncio.sleep(TICK_SECONDS)
+
+    async def _receive(self, reader):
+        """順位の変化分を受け取って反映"""
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionResetError("race server closed the connection")
+            message = decode(line)
+            if message.get("t") == MSG_TICK:
+                self._apply_tick(message)
+
+    def _apply_tick(self, message):
+        """tick の変化分を反映して順位を作り直す"""
+        players = self._players
+        for player_id, name in message.get("j", ()):
+            players.setdefault(player_id, [name, 0, 0, 0])[0] = name
+        for player_id, progress, errors, rank in message.get("d", ()):
+            entry = players.setdefault(player_id, ["?", 0, 0, 0])
+            entry[1:] = [progress, errors, rank]
+        for player_id in message.get("l", ()):
+            players.pop(player_id, None)
+        self._publish_standings()
+
+    def _publish_standings(self):
+        """順位表を作り直して公開（参照の差し替え1回）"""
+        # 完走者は順位順、それ以外は進捗の多い順
+        self.standings = tuple(sorted(
+            ((progress, errors, rank, player_id, name)
+             for player_id, (name, progress, errors, rank) in self._players.items()),
+            key=lambda row: (row[2] == 0, row[2], -row[0], row[1]),
+        ))
+        self.revision += 1
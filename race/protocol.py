@@ -0,0 +1,46 @@
+"""レースのメッセージ形式
+
+メッセージは改行区切りの JSON（区切り文字の空白なし）で、キーは1文字に詰める。
+
+クライアント → サーバー
+    {"t": "j", "n": 名前}                       参加
+    {"t": "p", "i": 文章番号, "c": 入力位置, "e": ミス数}   進捗（最新の値のみ）
+
+サーバー → クライアント
+    {"t": "w", "id": 自分のID, "s": [[ID, 英文, 日本語訳], ...],
+     "p": [[ID, 名前, 進捗, ミス数, 順位], ...], "k": tick秒}   参加時に1回
+    {"t": "s", "n": tick番号, "d": [[ID, 進捗, ミス数, 順位], ...],
+     "j": [[ID, 名前], ...], "l": [ID, ...]}                    tickごとに変化分のみ
+
+進捗はレース全体の入力済み文字数、順位は完走した順（未完走は0）。
+"""
+
+import json
+
+MSG_JOIN = "j"
+MSG_PROGRESS = "p"
+MSG_WELCOME = "w"
+MSG_TICK = "s"
+
+TICK_SECONDS = 0.05  # 進捗の送信・順位の配信間隔
+MAX_LINE_BYTES = 4096  # クライアントから受け付ける1行の最大長
+MAX_NAME_LENGTH = 24
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def encode(message):
+    """メッセージを1行分のバイト列に変換"""
+    return _ENCODER.encode(message).encode("utf-8") + b"\n"
+
+
+def decode(line):
+    """1行分のバイト列をメッセージに変換
+
+    Raises:
+        ValueError: JSON のオブジェクトでない場合
+    """
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("message must be an object")
+    return message
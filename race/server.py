@@ -0,0 +1,239 @@
+"""タイピングレースのサーバー
+
+全参加者に同じ文章の並びを配り、各参加者の進捗を受け取って順位を配信する。
+進捗は受信のたびに配信せず、tick ごとに変化した参加者の分だけを
+1つのメッセージにまとめ、全員に同じバイト列を送る。
+
+    python -m race.server --port 8765 --sentences 10
+"""
+
+import argparse
+import asyncio
+import random
+import signal
+
+from perf_stats import LatencyHistogram
+from sentences import sentences
+
+from .protocol import (
+    MAX_LINE_BYTES, MAX_NAME_LENGTH, MSG_JOIN, MSG_PROGRESS, MSG_TICK, MSG_WELCOME,
+    TICK_SECONDS, decode, encode,
+)
+
+MAX_WRITE_BUFFER = 256 * 1024  # これ以上送信が滞った参加者は切断する
+
+
+class Player:
+    """参加者1人分の状態"""
+
+    __slots__ = ('id', 'name', 'writer', 'progress', 'errors', 'rank')
+
+    def __init__(self, player_id, name, writer):
+        self.id = player_id
+        self.name = name
+        self.writer = writer
+        self.progress = 0
+        self.errors = 0
+        self.rank = 0
+
+    def row(self):
+        """配信用の [ID, 進捗, ミス数, 順位]"""
+        return [self.id, self.progress, self.errors, self.rank]
+
+
+class RaceServer:
+    """レースの進行を管理する asyncio サーバー"""
+
+    def __init__(self, entries, tick=TICK_SECONDS):
+        """
+        Args:
+            entries (list[tuple[int, str, str]]): 出題する (ID, 英文, 日本語訳) の並び
+            tick (float): 配信間隔（秒）
+        """
+        self.entries = [list(entry) for entry in entries]
+        self.tick = tick
+        # 文章ごとの開始位置（レース全体での文字数）
+        self.offsets = [0]
+        for entry in entries:
+            self.offsets.append(self.offsets[-1] + len(entry[1]))
+        self.total = self.offsets[-1]
+        self.players = {}
+        self.port = None
+        self.ticks = 0
+        self.bytes_sent = 0
+        self.dropped = 0  # 受信が追いつかず切断した参加者の数
+        self.tick_lag = LatencyHistogram()  # 予定時刻からの配信の遅れ
+        self._next_id = 1
+        self._finished = 0
+        self._changed = set()
+        self._joined = []
+        self._left = []
+        self._server = None
+        self._tick_task = None
+
+    async def start(self, host="127.0.0.1", port=0):
+        """待ち受けと配信を開始（実際のポート番号は self.port に入る）"""
+        self._server = await asyncio.start_server(
+            self._handle_client, host, port, limit=MAX_LINE_BYTES
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._tick_task = asyncio.create_task(self._tick_loop())
+
+    async def stop(self):
+        """待ち受けを停止し、全員を切断"""
+        self._tick_task.cancel()
+        self._server.close()
+        for player in list(self.players.values()):
+            player.writer.close()
+        await self._server.wait_closed()
+
+    async def _handle_client(self, reader, writer):
+        """1接続分の処理（参加 → 進捗の受信）"""
+        player = None
+        try:
+            message = decode(await reader.readline())
+            if message.get("t") != MSG_JOIN:
+                return
+            player = self._add_player(str(message.get("n", ""))[:MAX_NAME_LENGTH], writer)
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                message = decode(line)
+                if message.get("t") == MSG_PROGRESS:
+                    self._update_progress(player, message)
+        except (ValueError, TypeError, ConnectionError, asyncio.LimitOverrunError):
+            return
+        finally:
+            if player is not None:
+                self._remove_player(player)
+            writer.close()
+
+    def _add_player(self, name, writer):
+        """参加者を追加し、文章の並びと現在の順位を送る"""
+        player = Player(self._next_id, name or f"player{self._next_id}", writer)
+        self._next_id += 1
+        welcome = {
+            "t": MSG_WELCOME,
+            "id": player.id,
+            "s": self.entries,
+            "p": [[p.id, p.name, p.progress, p.errors, p.rank] for p in self.players.values()],
+            "k": self.tick,
+        }
+        self.players[player.id] = player
+        self._joined.append([player.id, player.name])
+        self._changed.add(player)
+        writer.write(encode(welcome))
+        return player
+
+    def _remove_player(self, player):
+        """参加者を外す"""
+        if self.players.pop(player.id, None) is not None:
+            self._changed.discard(player)
+            self._left.append(player.id)
+
+    def _update_progress(self, player, message):
+        """進捗を更新（値は範囲内に丸め、配信は次の tick でまとめて行う）"""
+        index = min(max(int(message.get("i", 0)), 0), len(self.entries))
+        position = 0
+        if index < len(self.entries):
+            position = min(max(int(message.get("c", 0)), 0), len(self.entries[index][1]))
+        progress = self.offsets[index] + position
+        errors = max(int(message.get("e", 0)), 0)
+        if progress == player.progress and errors == player.errors:
+            return
+        player.progress = progress
+        player.errors = errors
+        if progress >= self.total and not player.rank:
+            self._finished += 1
+            player.rank = self._finished
+        self._changed.add(player)
+
+    async def _tick_loop(self):
+        """tick ごとに変化分をまとめて配信"""
+        loop = asyncio.get_running_loop()
+        next_time = loop.time()
+        while True:
+            next_time += self.tick
+            await asyncio.sleep(max(0.0, next_time - loop.time()))
+            now = loop.time()
+            self.tick_lag.record_ms((now - next_time) * 1000)
+            if now - next_time > self.tick:
+                next_time = now  # 大きく遅れたら追いつこうとせず、そこから数え直す
+            self._broadcast()
+
+    def _broadcast(self):
+        """変化した参加者の分だけを1つのメッセージにして全員へ送る"""
+        if not (self._changed or self._joined or self._left):
+            return
+        self.ticks += 1
+        message = {"t": MSG_TICK, "n": self.ticks}
+        if self._changed:
+            message["d"] = [player.row() for player in self._changed]
+        if self._joined:
+            message["j"] = self._joined
+        if self._left:
+            message["l"] = self._left
+        self._changed = set()
+        self._joined = []
+        self._left = []
+
+        data = encode(message)
+        for player in list(self.players.values()):
+            transport = player.writer.transport
+            if transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+                # 受信が追いつかない参加者のために他の参加者を待たせない
+                transport.abort()
+                self.dropped += 1
+                continue
+            player.writer.write(data)
+            self.bytes_sent += len(data)
+
+
+def choose_entries(count, seed=None):
+    """出題する文章を選ぶ"""
+    rng = random.Random(seed)
+    rows = rng.sample(sentences, min(count, len(sentences)))
+    return [(row[0], row[1], row[2]) for row in rows]
+
+
+async def serve(host, port, count, seed):
+    """サーバーを起動して停止シグナルまで動かす"""
+    server = RaceServer(choose_entries(count, seed))
+    await server.start(host, port)
+    print(f"race server listening on {host}:{server.port} "
+          f"({len(server.entries)} sentences, {server.total} chars)", flush=True)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows では Ctrl+C の KeyboardInterrupt で止まる
+    await stop.wait()
+    await server.stop()
+    print(f"race server stopped ({server.ticks} ticks, {server.bytes_sent} bytes sent, "
+          f"{server.dropped} dropped, tick lag {server.tick_lag.format_summary()})", flush=True)
+
+
+def parse_args(argv=None):
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="TypingClicker race server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--sentences", type=int, default=10, help="出題する文章の数")
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """エントリーポイント"""
+    args = parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.sentences, args.seed))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
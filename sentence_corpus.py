@@ -0,0 +1,107 @@
+"""出題する文章の一覧（コーパス）を管理するモジュール"""
+
+import ast
+import random
+
+
+class SentenceCorpus:
+    """出題する文章の一覧
+
+    生成後は変更しない。再読み込み時は ``rebuild`` で新しいコーパスを作り、
+    参照ごと差し替える（参照の代入は1回なので、読み出し側が途中の状態を見ることはない）。
+    """
+
+    __slots__ = ('entries', 'by_id')
+
+    def __init__(self, entries):
+        """
+        Args:
+            entries (tuple[tuple[int, str, str], ...]): (ID, 英文, 日本語訳) の並び
+        """
+        self.entries = entries
+        self.by_id = {entry[0]: entry for entry in entries}
+
+    @classmethod
+    def from_rows(cls, rows):
+        """[id, english, japanese] 形式の一覧から作成"""
+        return cls(tuple(_to_entry(row) for row in rows))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def choose(self, rng=random):
+        """ランダムに1件選ぶ
+
+        Returns:
+            tuple[str, str]: (英文, 日本語訳)
+        """
+        entry = rng.choice(self.entries)
+        return entry[1], entry[2]
+
+    def rebuild(self, rows):
+        """新しい一覧から差分だけを作り直したコーパスを返す
+
+        内容が変わらない項目は既存のエントリをそのまま使う。
+
+        Args:
+            rows (Iterable[Sequence]): [id, english, japanese] 形式の一覧
+
+        Returns:
+            tuple[SentenceCorpus, set[int]]: 新しいコーパスと、追加・変更・削除されたID
+        """
+        old = self.by_id
+        entries = []
+        changed = set()
+        for row in rows:
+            entry = _to_entry(row)
+            previous = old.get(entry[0])
+            if previous == entry:
+                entry = previous
+            else:
+                changed.add(entry[0])
+            entries.append(entry)
+        corpus = SentenceCorpus(tuple(entries))
+        changed.update(old.keys() - corpus.by_id.keys())
+        return corpus, changed
+
+
+def read_sentences_file(path):
+    """sentences.py を実行せずに読み込み、``sentences = [...]`` の一覧を返す
+
+    Args:
+        path (str): sentences.py のパス
+
+    Returns:
+        list: [id, english, japanese] 形式の一覧
+
+    Raises:
+        ValueError: 一覧が見つからない、またはリテラルとして解釈できない場合
+        SyntaxError: ファイルの構文が正しくない場合
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "sentences" for target in node.targets
+        ):
+            return ast.literal_eval(node.value)
+    raise ValueError(f"{path}: 'sentences' list not found")
+
+
+def _to_entry(row):
+    """1行分をエントリ (id, english, japanese) に変換
+
+    Raises:
+        ValueError: 3要素の list / tuple でない、ID がハッシュできない、
+            または文章が文字列でない場合
+    """
+    if not isinstance(row, (list, tuple)) or len(row) != 3:
+        raise ValueError(f"invalid sentence entry: {row!r}")
+    sentence_id, english, japanese = row
+    try:
+        hash(sentence_id)
+    except TypeError:
+        raise ValueError(f"invalid sentence id: {row!r}") from None
+    if not isinstance(english, str) or not english or not isinstance(japanese, str):
+        raise ValueError(f"invalid sentence entry: {row!r}")
+    return (sentence_id, english, japanese)
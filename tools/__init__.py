@@ -0,0 +1,4 @@
+"""開発・バランス調整用のコマンドラインツール群
+
+リポジトリ直下から ``python -m tools.<name>`` で実行する。
+"""
@@ -0,0 +1,356 @@
+"""合成タイピストによる負荷生成ツール
+
+実際の Game をダミーのビデオドライバーで起動し、別スレッドから
+``pygame.event.post`` で入力イベント（打鍵・クリックの連打・購入の連打）を
+流し込む。指定時間の経過後に、処理できた打鍵数/秒、遅れた・落としたフレーム、
+入力から表示までのレイテンシを表示する。WPM を上げながら実行すると、
+``handle_events`` と ``render`` が追いつかなくなる入力レートがわかる。
+
+    python -m tools.load_generator --duration 20 --wpm 600 --error-rate 0.05 \\
+        --burstiness 1.5 --click-rate 40 --purchase-rate 10 --preset low_power
+"""
+
+import argparse
+import heapq
+import os
+import random
+import tempfile
+import threading
+import time
+
+import pygame
+
+from config import Config
+from input_pipeline import InputPipeline
+from main import Game
+from metrics import GameMetrics
+from perf_stats import LatencyHistogram
+
+WRONG_CHARS = "qjxz"  # ミス入力に使う文字（期待する文字と異なるものを選ぶ）
+BUDGET_TOLERANCE_MS = 1.0  # tick の誤差として許容する遅れ
+FRAME_BOUNDS_MS = (1, 2, 4, 8, 12, 16, 20, 25, 33, 50, 75, 100, 250, 500, 1000)
+
+
+class Typist:
+    """一定の WPM・ミス率・揺らぎで打鍵する合成タイピスト
+
+    打鍵間隔は平均 12/WPM 秒、変動係数 burstiness のガンマ分布に従う
+    （0 で等間隔、1 でポアソン到着、1 より大きいと連打と間が混ざる）。
+    文章を打ち終えたら、ゲームが次の文章を表示するまで待つ。
+    """
+
+    def __init__(self, wpm, error_rate, burstiness, rng):
+        self.mean_interval = 12.0 / wpm
+        self.error_rate = error_rate
+        self.burstiness = burstiness
+        self.rng = rng
+        self.posted = 0
+        self.errors = 0
+        self.waits = 0  # 次の文章の表示を待った回数
+        self._text = None
+        self._position = 0
+        self._ready_revision = 0  # この revision に達したら次の文章が表示されている
+
+    def interval(self):
+        """次の打鍵までの秒数"""
+        if self.burstiness <= 0:
+            return self.mean_interval
+        shape = 1.0 / (self.burstiness * self.burstiness)
+        return self.rng.gammavariate(shape, self.mean_interval / shape)
+
+    def emit(self, game):
+        """次の打鍵イベントを作る（次の文章の表示待ちなら None）"""
+        display = game.typing_display
+        if self._text is None:
+            revision = display.revision
+            if revision < self._ready_revision:
+                self.waits += 1
+                return None
+            self._text = display.english_text
+            self._position = display.current_position
+            # 正しい入力1文字ごとと、次の文章の表示で revision が1ずつ進む
+            self._ready_revision = revision + len(self._text) - self._position + 1
+        expected = self._text[self._position]
+        if self.rng.random() < self.error_rate:
+            self.errors += 1
+            char = next(c for c in WRONG_CHARS if c != expected.lower())
+        else:
+            char = expected
+            self._position += 1
+            if self._position >= len(self._text):
+                self._text = None
+        self.posted += 1
+        return pygame.event.Event(pygame.TEXTINPUT, text=char)  # pylint: disable=no-member
+
+
+class ClickStorm:
+    """一定時間ごとにボタンを連打するクリック源（storm_on 秒連打し storm_off 秒休む）"""
+
+    def __init__(self, rate, storm_on, storm_off, rng):
+        self.rate = rate
+        self.storm_on = storm_on
+        self.storm_off = storm_off
+        self.rng = rng
+        self.posted = 0
+        self._elapsed = 0.0
+
+    def interval(self):
+        """次のクリックまでの秒数（休みの間は次の連打の開始まで飛ばす）"""
+        delay = self.rng.expovariate(self.rate)
+        period = self.storm_on + self.storm_off
+        phase = (self._elapsed + delay) % period
+        if self.storm_off > 0 and phase >= self.storm_on:
+            delay += period - phase
+        self._elapsed += delay
+        return delay
+
+    def emit(self, game):
+        """ボタン中央のクリックイベントを作る"""
+        self.posted += 1
+        return pygame.event.Event(  # pylint: disable=no-member
+            pygame.MOUSEBUTTONDOWN, button=1, pos=game.button.rect.center  # pylint: disable=no-member
+        )
+
+
+class PurchaseSpam:
+    """表示中の購入ボタンを順番に連打する購入源"""
+
+    def __init__(self, rate, rng):
+        self.rate = rate
+        self.rng = rng
+        self.posted = 0
+        self._row = 0
+
+    def interval(self):
+        """次の購入までの秒数"""
+        return self.rng.expovariate(self.rate)
+
+    def emit(self, game):
+        """購入ボタンのクリックイベントを作る（ボタンが見えていなければ None）"""
+        rows = len(game.upgrades.unlocked)
+        if rows == 0:
+            return None
+        self._row = (self._row + 1) % rows
+        pos = game.ui_renderer.purchase_button_center(self._row)
+        if pos is None:
+            return None
+        self.posted += 1
+        return pygame.event.Event(  # pylint: disable=no-member
+            pygame.MOUSEBUTTONDOWN, button=1, pos=pos  # pylint: disable=no-member
+        )
+
+
+class LoadGenerator:
+    """複数の入力源を時刻順に並べ、別スレッドからイベントを投入するクラス
+
+    投入が予定より遅れた場合は待たずに続けて投入し、目標レートを保つ。
+    """
+
+    def __init__(self, game, sources, duration):
+        self.game = game
+        self.sources = sources
+        self.duration = duration
+        self.rejected = 0  # イベントキューが満杯で投入できなかった数
+        self.started_at = None
+        self._thread = None
+
+    def start(self):
+        """投入スレッドを開始"""
+        self._thread = threading.Thread(target=self._run, name="load-generator", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """予定時刻順にイベントを投入し、最後に QUIT を送る"""
+        start = self.started_at = time.perf_counter()
+        end = start + self.duration
+        schedule = [(start + source.interval(), idx) for idx, source in enumerate(self.sources)]
+        heapq.heapify(schedule)
+        while schedule[0][0] < end:
+            due, idx = schedule[0]
+            wait = due - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+            source = self.sources[idx]
+            event = source.emit(self.game)
+            if event is not None:
+                self._post(event)
+            heapq.heapreplace(schedule, (due + source.interval(), idx))
+        self._post(pygame.event.Event(pygame.QUIT))  # pylint: disable=no-member
+
+    def _post(self, event):
+        """投入時刻を付けてキューへ入れる"""
+        event.sent_at = time.perf_counter()
+        try:
+            if not pygame.event.post(event):
+                self.rejected += 1
+        except pygame.error:
+            self.rejected += 1
+
+
+def _timed(func, histogram):
+    """呼び出し時間を histogram に記録するラッパーを返す"""
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            histogram.record_ms((time.perf_counter() - start) * 1000)
+    return wrapper
+
+
+class TimedInputPipeline(InputPipeline):
+    """投入時刻からキューを出るまでの待ち時間と、表示までの時間を記録する入力ステージ"""
+
+    def __init__(self):
+        super().__init__()
+        self.queue_wait = LatencyHistogram(FRAME_BOUNDS_MS)
+        self.end_to_end = LatencyHistogram(FRAME_BOUNDS_MS)
+        self.chars = 0  # 取り出した打鍵数
+        self._sent = []
+
+    def poll(self):
+        events = super().poll()
+        now = time.perf_counter()
+        for event in events:
+            sent_at = getattr(event, "sent_at", None)
+            if sent_at is None or event.type == pygame.QUIT:  # pylint: disable=no-member
+                continue
+            self.queue_wait.record_ms((now - sent_at) * 1000)
+            self._sent.append(sent_at)
+            if event.type == pygame.TEXTINPUT:  # pylint: disable=no-member
+                self.chars += len(event.text)
+        return events
+
+    def mark_presented(self):
+        super().mark_presented()
+        now = time.perf_counter()
+        for sent_at in self._sent:
+            self.end_to_end.record_ms((now - sent_at) * 1000)
+        self._sent.clear()
+
+
+class FrameMetrics(GameMetrics):
+    """予算を超えたフレーム（late）と、1フレーム分以上遅れたフレーム（dropped）を数える"""
+
+    def __init__(self, budget_ms):
+        super().__init__()
+        self.frame_time = LatencyHistogram(FRAME_BOUNDS_MS)
+        self.budget_ms = budget_ms
+        self.frames = 0
+        self.late = 0
+        self.dropped = 0
+
+    def record_frame(self, dt_ms, fps):
+        super().record_frame(dt_ms, fps)
+        self.frames += 1
+        if dt_ms > self.budget_ms + BUDGET_TOLERANCE_MS:
+            self.late += 1
+        if dt_ms >= self.budget_ms * 2:
+            self.dropped += 1
+
+
+def _instrument(game):
+    """ゲームの入力・メトリクスを計測用に差し替え、段階ごとの計測結果を返す"""
+    game.input = TimedInputPipeline()
+    game.metrics = FrameMetrics(1000.0 / (game.config.FPS or 60))  # 上限なしは 60Hz を基準にする
+    stages = {
+        'handle_events': LatencyHistogram(FRAME_BOUNDS_MS),
+        'render': LatencyHistogram(FRAME_BOUNDS_MS),
+    }
+    game.handle_events = _timed(game.handle_events, stages['handle_events'])
+    game.render = _timed(game.render, stages['render'])
+    return stages
+
+
+def _report(args, game, generator, stages, elapsed):
+    """結果を表示"""
+    typist = generator.sources[0]
+    clicks = sum(s.posted for s in generator.sources if isinstance(s, ClickStorm))
+    purchases = sum(s.posted for s in generator.sources if isinstance(s, PurchaseSpam))
+    metrics = game.metrics
+    pipeline = game.input
+    print(f"load: {args.wpm:.0f} WPM (error {args.error_rate:.0%}, burstiness {args.burstiness}), "
+          f"clicks {args.click_rate:.0f}/s, purchases {args.purchase_rate:.0f}/s, "
+          f"preset {game.config.PRESET}, {elapsed:.1f} s")
+    print(f"keystrokes: posted {typist.posted / elapsed:8.1f}/s, "
+          f"processed {pipeline.chars / elapsed:8.1f}/s "
+          f"(correct {metrics.keystrokes}, errors {typist.errors}, "
+          f"backlog {typist.posted - pipeline.chars}, sentence waits {typist.waits})")
+    print(f"clicks: posted {clicks}, purchases posted {purchases}, "
+          f"upgrade levels {game.upgrades.levels}, rejected events {generator.rejected}")
+    frames = max(metrics.frames, 1)
+    print(f"frames: {metrics.frames} ({metrics.frames / elapsed:.1f} fps), "
+          f"late {metrics.late} ({metrics.late / frames:.1%}), "
+          f"dropped {metrics.dropped} ({metrics.dropped / frames:.1%})")
+    print(f"  frame time     {metrics.frame_time.format_summary()}")
+    for name, histogram in stages.items():
+        print(f"  {name:<14} {histogram.format_summary()}")
+    print(f"  post->dequeue  {pipeline.queue_wait.format_summary()}")
+    print(f"  post->present  {pipeline.end_to_end.format_summary()}")
+
+
+def parse_args(argv=None):
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=10.0, help="実行時間（秒）")
+    parser.add_argument("--wpm", type=float, default=120.0, help="タイピストの WPM（5文字=1語）")
+    parser.add_argument("--error-rate", type=float, default=0.03, help="ミス入力の割合")
+    parser.add_argument("--burstiness", type=float, default=1.0,
+                        help="打鍵間隔の変動係数（0=等間隔、1=ランダム、>1=連打と間）")
+    parser.add_argument("--click-rate", type=float, default=0.0,
+                        help="連打中のクリック数/秒（0で無効）")
+    parser.add_argument("--storm-on", type=float, default=2.0, help="連打する秒数")
+    parser.add_argument("--storm-off", type=float, default=3.0, help="連打の間の休みの秒数")
+    parser.add_argument("--purchase-rate", type=float, default=0.0,
+                        help="購入ボタンのクリック数/秒（0で無効）")
+    parser.add_argument("--grant", type=int, default=10 ** 9,
+                        help="開始時の English Power（購入の連打用）")
+    parser.add_argument("--preset", default=None, help="性能プリセット")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    if args.wpm <= 0 or args.duration <= 0:
+        parser.error("--wpm and --duration must be positive")
+    return args
+
+
+def _build_game(args, save_path):
+    """計測用の設定でゲームを作る（セーブは一時ファイル、記録の書き込みはしない）"""
+    config = Config.load()
+    if args.preset:
+        config.apply_preset(args.preset)
+    config.LEADERBOARD_ENABLED = False
+    config.HOT_RELOAD = False
+    config.validate()
+    game = Game(config=config, save_path=save_path)
+    game.state.english_power = args.grant
+    return game
+
+
+def main(argv=None):
+    """エントリーポイント"""
+    args = parse_args(argv)
+    # 画面・音声のないマシンでも動くようにする（pygame.init より前に設定）
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        game = _build_game(args, os.path.join(tmp, "save.json"))
+        stages = _instrument(game)
+        sources = [Typist(args.wpm, args.error_rate, args.burstiness, random.Random(rng.random()))]
+        if args.click_rate > 0:
+            sources.append(ClickStorm(args.click_rate, args.storm_on, args.storm_off,
+                                      random.Random(rng.random())))
+        if args.purchase_rate > 0:
+            sources.append(PurchaseSpam(args.purchase_rate, random.Random(rng.random())))
+        generator = LoadGenerator(game, sources, args.duration)
+        generator.start()
+        try:
+            game.run()
+        except SystemExit:
+            pass
+        elapsed = time.perf_counter() - generator.started_at
+        _report(args, game, generator, stages, elapsed)
+
+
+if __name__ == "__main__":
+    main()
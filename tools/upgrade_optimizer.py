@@ -0,0 +1,329 @@
+"""アップグレード購入順の最適化ツール
+
+ゲーム本体と同じ UpgradeRegistry / GameLogic の計算式を使い、
+目標レベルへ最速で到達する購入順を複数の戦略で探索する。
+
+時間は1秒ずつ進めず、「次の購入が可能になる時刻」や「XPがレベル境界を
+越える時刻」へ直接ジャンプして計算する。Auto Typing の毎秒加算は連続値として扱う。
+
+    python -m tools.upgrade_optimizer --target-level 25 --cps 5 --out curves.csv
+"""
+
+import argparse
+import csv
+import math
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from game_logic import GameLogic
+from upgrades import EFFECT_PER_CLICK, EFFECT_PER_SECOND, UpgradeRegistry
+
+DEFAULT_UPGRADES_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "upgrades.json"
+)
+MAX_PURCHASES = 100000
+
+
+class Simulation:
+    """1つの購入順を時間ジャンプで進めるシミュレーション"""
+
+    __slots__ = (
+        'registry', 'typing_cps', 'clicks_per_sec', 'target_level', 'target_xp',
+        'time', 'power', 'xp', 'level', 'next_xp', 'purchases', 'curve', 'done',
+    )
+
+    def __init__(self, registry, typing_cps, clicks_per_sec, target_level):
+        """
+        Args:
+            registry (UpgradeRegistry): レベル0のレジストリ（複製して使う）
+            typing_cps (float): 1秒あたりの正しい入力文字数
+            clicks_per_sec (float): 1秒あたりのキーボード画像クリック数
+            target_level (int): 目標レベル
+        """
+        self.registry = registry.clone()
+        self.typing_cps = typing_cps
+        self.clicks_per_sec = clicks_per_sec
+        self.target_level = target_level
+        self.target_xp = GameLogic.xp_required(target_level)
+        self.time = 0.0
+        self.power = 0.0
+        self.xp = 0.0
+        self.level = 1
+        self.next_xp = GameLogic.xp_required(2)
+        self.purchases = []
+        self.curve = []  # (到達レベル, 時刻)
+        self.done = target_level <= 1
+
+    def clone(self):
+        """途中状態を複製（ビームサーチ用）"""
+        other = Simulation.__new__(Simulation)
+        for name in Simulation.__slots__:
+            setattr(other, name, getattr(self, name))
+        other.registry = self.registry.clone()
+        other.purchases = list(self.purchases)
+        other.curve = list(self.curve)
+        return other
+
+    def rate(self, registry=None):
+        """1秒あたりの獲得量（タイピングは1文字1、クリックはクリック当たりパワー）"""
+        registry = registry or self.registry
+        return (
+            self.typing_cps
+            + self.clicks_per_sec * registry.power_per_click
+            + registry.power_per_second
+        )
+
+    def rate_after(self, idx):
+        """指定アップグレードを1つ購入した後の獲得レート"""
+        registry = self.registry
+        upgrade = registry.defs[idx]
+        power_per_click = registry.power_per_click
+        power_per_second = registry.power_per_second
+        if upgrade.effect == EFFECT_PER_CLICK:
+            power_per_click = GameLogic.current_power_per_click(
+                registry.power_per_click_base + upgrade.amount, registry.multiplier
+            )
+        elif upgrade.effect == EFFECT_PER_SECOND:
+            power_per_second = GameLogic.current_power_per_second(
+                registry.power_per_second_base + upgrade.amount, registry.multiplier
+            )
+        else:
+            level = registry.levels[idx]
+            multiplier = (
+                registry.multiplier
+                / GameLogic.current_multiplier(level, upgrade.amount)
+                * GameLogic.current_multiplier(level + 1, upgrade.amount)
+            )
+            power_per_click = GameLogic.current_power_per_click(
+                registry.power_per_click_base, multiplier
+            )
+            power_per_second = GameLogic.current_power_per_second(
+                registry.power_per_second_base, multiplier
+            )
+        return self.typing_cps + self.clicks_per_sec * power_per_click + power_per_second
+
+    def wait_time(self, idx):
+        """指定アップグレードを購入できるまでの待ち時間"""
+        shortfall = self.registry.costs[idx] - self.power
+        return max(0.0, shortfall / self.rate())
+
+    def eta(self):
+        """これ以上購入しない場合の目標到達時刻"""
+        if self.done:
+            return self.time
+        return self.time + max(0.0, self.target_xp - self.xp) / self.rate()
+
+    def advance(self, seconds):
+        """指定秒数だけ進める（途中で目標に到達したらそこで止める）"""
+        rate = self.rate()
+        xp_end = self.xp + rate * seconds
+        level_before = self.level
+        while self.next_xp <= xp_end:
+            hit_time = self.time + (self.next_xp - self.xp) / rate
+            self.level += 1
+            self.curve.append((self.level, hit_time))
+            self.next_xp = GameLogic.xp_required(self.level + 1)
+            if self.level >= self.target_level:
+                self.power += rate * (hit_time - self.time)
+                self.xp = GameLogic.xp_required(self.level)
+                self.time = hit_time
+                self.done = True
+                return
+        self.time += seconds
+        self.power += rate * seconds
+        self.xp = xp_end
+        if self.level != level_before:
+            self.registry.refresh_unlocks(self.level)
+
+    def buy(self, idx):
+        """購入できるまで待ってから購入（待機中に目標到達したら購入しない）"""
+        self.advance(self.wait_time(idx))
+        if self.done:
+            return
+        self.power -= self.registry.costs[idx]
+        self.registry.purchase(idx)
+        self.registry.refresh_unlocks(self.level)
+        self.purchases.append(idx)
+
+    def finish(self):
+        """購入をやめて目標到達まで進める"""
+        if not self.done:
+            self.advance(max(0.0, self.target_xp - self.xp) / self.rate() + 1e-9)
+        return self
+
+    def payback_scores(self):
+        """各アップグレードの (待ち時間 + 投資回収時間, 番号) の一覧"""
+        base_rate = self.rate()
+        scores = []
+        for idx in self.registry.unlocked:
+            gain = self.rate_after(idx) - base_rate
+            if gain > 0:
+                score = self.wait_time(idx) + self.registry.costs[idx] / gain
+                scores.append((score, idx))
+        return scores
+
+
+def _continue_greedy(sim):
+    """途中状態から貪欲法で目標到達まで進める"""
+    while not sim.done and len(sim.purchases) < MAX_PURCHASES:
+        scores = sim.payback_scores()
+        if not scores:
+            break
+        sim.buy(min(scores)[1])
+    return sim.finish()
+
+
+def run_greedy(registry, typing_cps, clicks_per_sec, target_level):
+    """投資回収が最も早いアップグレードを順に購入する貪欲法"""
+    return _continue_greedy(Simulation(registry, typing_cps, clicks_per_sec, target_level))
+
+
+def run_beam(registry, typing_cps, clicks_per_sec, target_level, beam_width=32):
+    """途中状態を beam_width 個ずつ残すビームサーチ
+
+    各途中状態は、そこから貪欲法で進めた場合の到達時刻で評価する。
+    """
+    beam = [Simulation(registry, typing_cps, clicks_per_sec, target_level)]
+    best = _continue_greedy(beam[0].clone())
+    for _ in range(MAX_PURCHASES):
+        candidates = []
+        for sim in beam:
+            for _, idx in sim.payback_scores():
+                child = sim.clone()
+                child.buy(idx)
+                rollout = _continue_greedy(child.clone())
+                if rollout.time < best.time:
+                    best = rollout
+                if not child.done:
+                    candidates.append((rollout.time, len(candidates), child))
+        if not candidates:
+            break
+        candidates.sort()
+        beam = [child for _, _, child in candidates[:beam_width]]
+    return best
+
+
+def run_random_restarts(registry, typing_cps, clicks_per_sec, target_level,
+                        seed=0, restarts=50):
+    """投資回収の早さで重み付けしたランダム購入を繰り返し、最良の結果を返す"""
+    rng = random.Random(seed)
+    best = None
+    for _ in range(restarts):
+        sim = Simulation(registry, typing_cps, clicks_per_sec, target_level)
+        while not sim.done and len(sim.purchases) < MAX_PURCHASES:
+            scores = sim.payback_scores()
+            if not scores:
+                break
+            weights = [1.0 / (score + 1e-9) for score, _ in scores]
+            idx = rng.choices([idx for _, idx in scores], weights=weights)[0]
+            sim.buy(idx)
+        sim.finish()
+        if best is None or sim.time < best.time:
+            best = sim
+    return best
+
+
+STRATEGIES = {
+    'greedy': run_greedy,
+    'beam': run_beam,
+    'random': run_random_restarts,
+}
+
+
+def _run_task(task):
+    """ワーカープロセスで1つの探索を実行"""
+    strategy, upgrades_path, typing_cps, clicks_per_sec, target_level, option = task
+    registry = UpgradeRegistry.load(upgrades_path)
+    func = STRATEGIES[strategy]
+    if strategy == 'greedy':
+        sim = func(registry, typing_cps, clicks_per_sec, target_level)
+    elif strategy == 'beam':
+        sim = func(registry, typing_cps, clicks_per_sec, target_level, beam_width=option)
+    else:
+        seed, restarts = option
+        sim = func(registry, typing_cps, clicks_per_sec, target_level,
+                   seed=seed, restarts=restarts)
+    ids = [registry.defs[idx].id for idx in sim.purchases]
+    return strategy, sim.time, sim.curve, ids
+
+
+def build_tasks(args):
+    """コマンドライン引数から探索タスクの一覧を作成"""
+    common = (args.upgrades, args.cps, args.clicks_per_sec, args.target_level)
+    tasks = [('greedy', *common, None), ('beam', *common, args.beam_width)]
+    chunks = max(1, args.workers)
+    per_chunk = math.ceil(args.restarts / chunks)
+    for chunk in range(chunks):
+        tasks.append(('random', *common, (args.seed + chunk, per_chunk)))
+    return tasks
+
+
+def optimize(args):
+    """全戦略を並列に実行し、戦略ごとの最良結果を返す"""
+    best = {}
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for strategy, total_time, curve, ids in executor.map(_run_task, build_tasks(args)):
+            if strategy not in best or total_time < best[strategy][0]:
+                best[strategy] = (total_time, curve, ids)
+    return best
+
+
+def write_curves(best, out):
+    """戦略ごとのレベル到達時刻をCSVで出力"""
+    writer = csv.writer(out)
+    writer.writerow(["strategy", "level", "time_s"])
+    for strategy, (_, curve, _) in sorted(best.items()):
+        writer.writerow([strategy, 1, "0.0"])
+        for level, hit_time in curve:
+            writer.writerow([strategy, level, f"{hit_time:.1f}"])
+
+
+def parse_args(argv=None):
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target-level", type=int, default=20, help="目標レベル")
+    parser.add_argument("--cps", type=float, default=5.0,
+                        help="1秒あたりの正しい入力文字数（60 WPM ≒ 5）")
+    parser.add_argument("--clicks-per-sec", type=float, default=0.0,
+                        help="1秒あたりのキーボード画像クリック数")
+    parser.add_argument("--beam-width", type=int, default=32)
+    parser.add_argument("--restarts", type=int, default=200,
+                        help="ランダム探索の試行回数（全ワーカー合計）")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--upgrades", default=DEFAULT_UPGRADES_PATH,
+                        help="アップグレード定義ファイル")
+    parser.add_argument("--out", help="CSVの出力先（省略時は標準出力）")
+    args = parser.parse_args(argv)
+    if args.cps < 0 or args.clicks_per_sec < 0:
+        parser.error("--cps と --clicks-per-sec は0以上にしてください")
+    if args.cps + args.clicks_per_sec == 0:
+        parser.error("--cps か --clicks-per-sec のどちらかは正の値にしてください")
+    if args.target_level < 2:
+        parser.error("--target-level は2以上にしてください")
+    return args
+
+
+def main(argv=None):
+    """エントリーポイント"""
+    args = parse_args(argv)
+    best = optimize(args)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8", newline="") as f:
+            write_curves(best, f)
+    else:
+        write_curves(best, sys.stdout)
+
+    for strategy, (total_time, _, ids) in sorted(best.items(), key=lambda item: item[1][0]):
+        head = ", ".join(ids[:8]) + (" ..." if len(ids) > 8 else "")
+        print(
+            f"{strategy:>6}: Lv{args.target_level} in {total_time:,.0f}s "
+            f"({len(ids)} purchases: {head})",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
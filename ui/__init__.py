@@ -2,7 +2,31 @@
 
 from .button import Button
 from .counter import Counter
-from .ui_renderer import UIRenderer
+from .effects import EffectsManager
+from .hit_test import HitTester
+from .leaderboard_panel import LeaderboardPanel
+from .paragraph_display import ParagraphDisplay
+from .race_panel import RacePanel
+from .scroll_list import ScrollList
+from .sentence_prefetcher import SentencePrefetcher
+from .surface_cache import SurfaceCache, SurfaceLedger
+from .toast import Toast
 from .typing_display import TypingDisplay
+from .ui_renderer import UIRenderer
 
-__all__ = ['Button', 'Counter', 'UIRenderer', 'TypingDisplay']
+__all__ = [
+    'Button',
+    'Counter',
+    'EffectsManager',
+    'HitTester',
+    'LeaderboardPanel',
+    'ParagraphDisplay',
+    'RacePanel',
+    'ScrollList',
+    'SentencePrefetcher',
+    'SurfaceCache',
+    'SurfaceLedger',
+    'Toast',
+    'TypingDisplay',
+    'UIRenderer',
+]
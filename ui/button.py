@@ -1,8 +1,15 @@
 """ボタンUIコンポーネント"""
 
+import pygame
+
 
 class Button:
-    """ボタンの状態と描画を管理するクラス"""
+    """ボタンの状態と描画を管理するクラス
+
+    表示位置の矩形と、画像の不透明な画素から作った当たり判定マスクは
+    画像か位置が変わったときだけ作り直す。``register`` で HitTester に
+    登録すると、作り直したときに登録内容も更新する。
+    """
 
     def __init__(self, center_pos, button_image):
         """
@@ -12,13 +19,47 @@ class Button:
         """
         self.center = center_pos
         self.image = button_image
+        self.rect = None
+        self.mask = None
+        self._hit_tester = None
+        self._hit_key = None
+        self.set_image(button_image)
+
+    def register(self, hit_tester, key):
+        """クリック判定の領域として登録（画像・位置の変更にも追従する）
+
+        Args:
+            hit_tester (HitTester): 登録先
+            key (Hashable): 領域の識別子
+        """
+        self._hit_tester = hit_tester
+        self._hit_key = key
+        hit_tester.add(key, self.rect, self.mask)
+
+    def set_image(self, button_image):
+        """ボタン画像を変更（当たり判定マスクを作り直す）"""
+        self.image = button_image
+        self.mask = pygame.mask.from_surface(button_image)
+        self._update_rect()
+
+    def set_center(self, center_pos):
+        """ボタンの中央座標を変更"""
+        self.center = center_pos
+        self._update_rect()
+
+    def _update_rect(self):
+        """表示位置の矩形を計算（登録済みなら当たり判定も更新）"""
+        self.rect = self.image.get_rect(center=(int(self.center.x), int(self.center.y)))
+        if self._hit_tester is not None:
+            self._hit_tester.add(self._hit_key, self.rect, self.mask)
 
     def is_clicked(self, mouse_pos):
-        """マウス位置がボタン上かどうかを判定"""
-        rect = self.image.get_rect(center=(int(self.center.x), int(self.center.y)))
-        return rect.collidepoint(mouse_pos)
+        """マウス位置がボタン画像の不透明な部分の上かどうかを判定"""
+        rect = self.rect
+        if not rect.collidepoint(mouse_pos):
+            return False
+        return bool(self.mask.get_at((mouse_pos[0] - rect.x, mouse_pos[1] - rect.y)))
 
     def draw(self, surface):
         """ボタンを描画"""
-        rect = self.image.get_rect(center=(int(self.center.x), int(self.center.y)))
-        surface.blit(self.image, rect)
+        surface.blit(self.image, self.rect)
@@ -1,10 +1,16 @@
 """カウンター表示UIコンポーネント"""
 
+from .surface_cache import SurfaceLedger
+
 
 class Counter:
-    """カウンター表示を管理するクラス"""
+    """カウンター表示を管理するクラス
+
+    値が変わったときだけ数値のサーフェスを作り直す。
+    """
 
-    def __init__(self, font, width, height, offset_x=0, offset_y=0, label_font=None):
+    def __init__(self, font, width, height, offset_x=0, offset_y=0, label_font=None,
+                 ledger=None):
         """
         Args:
             font (pygame.font.Font): カウント表示用フォント
@@ -13,6 +19,7 @@ class Counter:
             offset_x (int): 描画開始位置のXオフセット
             offset_y (int): 描画開始位置のYオフセット
             label_font (pygame.font.Font | None): 見出し用フォント
+            ledger (SurfaceLedger | None): サーフェスの使用量を記録する台帳
         """
         self.font = font
         self.label_font = label_font or font
@@ -21,32 +28,57 @@ class Counter:
         self.offset_x = offset_x
         self.offset_y = offset_y
         self.value = 0
+        self.antialias = True
+        self.ledger = ledger or SurfaceLedger()
+
+        # 描画キャッシュ（色または値が変わったら作り直す）
+        self._color = None
+        self._label_surface = None
+        self._value_surface = None
 
     def increment(self):
         """カウントを1増やす"""
-        self.value += 1
+        self.set_value(self.value + 1)
 
     def reset(self):
         """カウントをリセット"""
-        self.value = 0
+        self.set_value(0)
+
+    def set_antialias(self, antialias):
+        """文字のアンチエイリアスを切り替え（キャッシュを破棄）"""
+        self.antialias = antialias
+        self._color = None
 
     def set_value(self, value):
         """外部状態に合わせて値を更新"""
-        self.value = value
+        if value != self.value:
+            self.value = value
+            self._value_surface = None
 
     def draw(self, surface, text_color):
         """カウンターを描画"""
+        if text_color != self._color:
+            self._color = text_color
+            self._label_surface = self.label_font.render(
+                "English Power", self.antialias, text_color
+            )
+            self._value_surface = None
+        if self._value_surface is None:
+            self._value_surface = self.font.render(
+                str(self.value), self.antialias, text_color
+            )
+            self.ledger.account("text", self, self._label_surface, self._value_surface)
+
         center_x = self.offset_x + self.width // 2
         center_y = self.offset_y + int(self.height * 0.2)
 
         # ラベル
-        label_surface = self.label_font.render("English Power", True, text_color)
+        label_surface = self._label_surface
         label_rect = label_surface.get_rect(
             center=(center_x, center_y - label_surface.get_height() - 20)
         )
         surface.blit(label_surface, label_rect)
 
         # 数値
-        text = self.font.render(str(self.value), True, text_color)
-        rect = text.get_rect(center=(center_x, center_y))
-        surface.blit(text, rect)
+        rect = self._value_surface.get_rect(center=(center_x, center_y))
+        surface.blit(self._value_surface, rect)
@@ -0,0 +1,292 @@
+"""浮遊数値とパーティクルのエフェクトを管理するモジュール
+
+エフェクトは起動時に確保したオブジェクトプールから払い出し、
+フレームごとのオブジェクト生成（とそれに伴うGC）を発生させない。
+"""
+
+import random
+
+import pygame
+
+from .surface_cache import SurfaceLedger
+
+
+class Particle:
+    """キーストローク用パーティクル1個分の状態"""
+
+    __slots__ = ('x', 'y', 'vx', 'vy', 'life', 'max_life', 'color', 'rect')
+
+    def __init__(self):
+        self.x = 0.0
+        self.y = 0.0
+        self.vx = 0.0
+        self.vy = 0.0
+        self.life = 0.0
+        self.max_life = 1.0
+        self.color = (255, 255, 255)
+        self.rect = pygame.Rect(0, 0, 0, 0)
+
+
+class FloatingNumber:
+    """浮遊する「+N」表示1個分の状態"""
+
+    __slots__ = ('x', 'y', 'vy', 'life', 'max_life', 'width', 'glyphs')
+
+    def __init__(self):
+        self.x = 0.0
+        self.y = 0.0
+        self.vy = 0.0
+        self.life = 0.0
+        self.max_life = 1.0
+        self.width = 0
+        self.glyphs = []
+
+
+class EffectPool:
+    """固定長のオブジェクトプール
+
+    先頭 ``count`` 個が稼働中のオブジェクト。解放時は末尾の稼働中オブジェクトと
+    入れ替えるので、払い出し・解放ともにO(1)で新規生成は行わない。
+    """
+
+    def __init__(self, factory, capacity):
+        """
+        Args:
+            factory (Callable[[], object]): プール要素の生成関数
+            capacity (int): プールの最大要素数
+        """
+        self.items = [factory() for _ in range(capacity)]
+        self.capacity = capacity
+        self.count = 0
+
+    def acquire(self):
+        """空き要素を払い出す（満杯ならNone）"""
+        if self.count >= self.capacity:
+            return None
+        item = self.items[self.count]
+        self.count += 1
+        return item
+
+    def release_at(self, index):
+        """指定位置の稼働中要素を解放"""
+        last = self.count - 1
+        items = self.items
+        items[index], items[last] = items[last], items[index]
+        self.count = last
+
+    def clear(self):
+        """全要素を解放"""
+        self.count = 0
+
+
+class NumberAtlas:
+    """「+N」表示用の文字サーフェスキャッシュ
+
+    使用する文字を起動時に1文字ずつレンダリングしておき、
+    描画時はグリフを並べてblitするだけにする。
+    """
+
+    CHARSET = "+-0123456789,.×"
+
+    def __init__(self, font, color):
+        """
+        Args:
+            font (pygame.font.Font): 数値表示用フォント
+            color (tuple[int, int, int]): 文字色
+        """
+        self.glyphs = {
+            char: font.render(char, True, color).convert_alpha()
+            for char in self.CHARSET
+        }
+        self.height = font.get_height()
+
+    def layout(self, text, out):
+        """テキストをグリフ列に変換
+
+        Args:
+            text (str): 表示する文字列（CHARSET外の文字は無視）
+            out (list): グリフを書き込むリスト（再利用される）
+
+        Returns:
+            int: グリフ列の合計幅
+        """
+        out.clear()
+        width = 0
+        glyphs = self.glyphs
+        for char in text:
+            glyph = glyphs.get(char)
+            if glyph is not None:
+                out.append(glyph)
+                width += glyph.get_width()
+        return width
+
+
+class EffectsManager:
+    """エフェクト全体の生成・更新・描画を管理するクラス"""
+
+    GRAVITY = 900.0
+    NUMBER_RISE_SPEED = 90.0
+    NUMBER_LIFETIME = 0.9
+    PARTICLE_LIFETIME = 0.45
+    PARTICLE_SIZE = 5
+    ALPHA_STEPS = 16
+
+    def __init__(self, number_font, color, particle_capacity, number_capacity, ledger=None):
+        """
+        Args:
+            number_font (pygame.font.Font): 浮遊数値用フォント
+            color (tuple[int, int, int]): 浮遊数値の文字色
+            particle_capacity (int): パーティクルの最大同時数
+            number_capacity (int): 浮遊数値の最大同時数
+            ledger (SurfaceLedger | None): サーフェスの使用量を記録する台帳
+        """
+        self.ledger = ledger or SurfaceLedger()
+        self.atlas = None
+        self.set_number_color(number_font, color)
+        self.particles = EffectPool(Particle, particle_capacity)
+        self.numbers = EffectPool(FloatingNumber, number_capacity)
+        self.particle_colors = (
+            (120, 200, 255),
+            (160, 230, 170),
+            (255, 220, 120),
+        )
+        self.enabled = True
+
+    def set_number_color(self, number_font, color):
+        """浮遊数値の文字色を変更（グリフを作り直す）
+
+        Args:
+            number_font (pygame.font.Font): 浮遊数値用フォント
+            color (tuple[int, int, int]): 文字色
+        """
+        self.atlas = NumberAtlas(number_font, color)
+        self.ledger.account("glyphs", self, *self.atlas.glyphs.values())
+
+    def spawn_number(self, pos, amount):
+        """「+N」を指定位置から浮かび上がらせる
+
+        Args:
+            pos (tuple[int, int]): 表示位置（中央）
+            amount (int): 表示する数値
+        """
+        if not self.enabled:
+            return
+        item = self.numbers.acquire()
+        if item is None:
+            return
+        item.width = self.atlas.layout(f"+{amount:,}", item.glyphs)
+        item.x = pos[0] - item.width / 2
+        item.y = pos[1] - self.atlas.height / 2
+        item.vy = -self.NUMBER_RISE_SPEED
+        item.life = self.NUMBER_LIFETIME
+        item.max_life = self.NUMBER_LIFETIME
+
+    def spawn_particles(self, pos, count, speed=220.0):
+        """指定位置からパーティクルを放射
+
+        Args:
+            pos (tuple[int, int]): 発生位置
+            count (int): 発生数
+            speed (float): 初速の最大値 (px/s)
+        """
+        if not self.enabled:
+            return
+        colors = self.particle_colors
+        for _ in range(count):
+            item = self.particles.acquire()
+            if item is None:
+                return
+            item.x = float(pos[0])
+            item.y = float(pos[1])
+            item.vx = random.uniform(-speed, speed)
+            item.vy = random.uniform(-speed * 1.5, -speed * 0.3)
+            item.life = self.PARTICLE_LIFETIME * random.uniform(0.6, 1.0)
+            item.max_life = item.life
+            item.color = colors[random.randrange(len(colors))]
+
+    def update(self, dt_ms):
+        """経過時間に応じてエフェクトを更新
+
+        Args:
+            dt_ms (int): 前フレームからの経過時間 (ms)
+        """
+        dt = dt_ms / 1000
+        self._update_particles(dt)
+        self._update_numbers(dt)
+
+    def _update_particles(self, dt):
+        """パーティクルの位置と寿命を更新"""
+        pool = self.particles
+        items = pool.items
+        gravity = self.GRAVITY * dt
+        i = 0
+        while i < pool.count:
+            item = items[i]
+            item.life -= dt
+            if item.life <= 0:
+                pool.release_at(i)
+                continue
+            item.vy += gravity
+            item.x += item.vx * dt
+            item.y += item.vy * dt
+            i += 1
+
+    def _update_numbers(self, dt):
+        """浮遊数値の位置と寿命を更新"""
+        pool = self.numbers
+        items = pool.items
+        i = 0
+        while i < pool.count:
+            item = items[i]
+            item.life -= dt
+            if item.life <= 0:
+                pool.release_at(i)
+                continue
+            item.y += item.vy * dt
+            i += 1
+
+    def draw(self, surface):
+        """稼働中のエフェクトを描画"""
+        self._draw_particles(surface)
+        self._draw_numbers(surface)
+
+    def _draw_particles(self, surface):
+        """パーティクルを描画（寿命に応じて縮小）"""
+        pool = self.particles
+        items = pool.items
+        max_size = self.PARTICLE_SIZE
+        for i in range(pool.count):
+            item = items[i]
+            size = 1 + int(max_size * item.life / item.max_life)
+            rect = item.rect
+            rect.x = int(item.x)
+            rect.y = int(item.y)
+            rect.width = size
+            rect.height = size
+            surface.fill(item.color, rect)
+
+    def _draw_numbers(self, surface):
+        """浮遊数値を描画（寿命に応じてフェードアウト）"""
+        pool = self.numbers
+        items = pool.items
+        steps = self.ALPHA_STEPS
+        for i in range(pool.count):
+            item = items[i]
+            # 量子化したアルファ値を共有グリフに設定してからblitする
+            alpha = 255 * max(1, int(steps * item.life / item.max_life)) // steps
+            x = int(item.x)
+            y = int(item.y)
+            for glyph in item.glyphs:
+                glyph.set_alpha(alpha)
+                surface.blit(glyph, (x, y))
+                x += glyph.get_width()
+
+    def clear(self):
+        """全エフェクトを消去"""
+        self.particles.clear()
+        self.numbers.clear()
+
+    @property
+    def live_count(self):
+        """稼働中のエフェクト数"""
+        return self.particles.count + self.numbers.count
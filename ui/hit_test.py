@@ -0,0 +1,128 @@
+"""クリック位置の判定（ヒットテスト）を管理するモジュール"""
+
+
+class HitRegion:
+    """クリック可能な領域"""
+
+    __slots__ = ('key', 'rect', 'mask', 'resolve', 'order', 'cells')
+
+    def __init__(self, key, rect, mask, resolve, order):
+        self.key = key
+        self.rect = rect
+        self.mask = mask
+        self.resolve = resolve
+        self.order = order
+        self.cells = ()
+
+    def contains(self, pos):
+        """位置が領域内（マスクがあれば不透明な画素上）かどうか"""
+        if not self.rect.collidepoint(pos):
+            return False
+        if self.mask is None:
+            return True
+        return bool(self.mask.get_at((pos[0] - self.rect.x, pos[1] - self.rect.y)))
+
+
+class HitTester:
+    """クリック可能な領域を一様グリッドで索引し、クリック位置から領域を求めるクラス
+
+    領域は登録時にグリッドの各セルへ振り分けておき、判定時はクリック位置の
+    セルに入っている領域だけを調べる。領域の数が増えても、1回の判定で調べる
+    領域は重なっている数個に限られる。
+    """
+
+    def __init__(self, cell_size=64):
+        """
+        Args:
+            cell_size (int): グリッドの1セルの大きさ（px）
+        """
+        self.cell_size = cell_size
+        self._regions = {}
+        self._grid = {}  # (セルx, セルy) -> 描画順の降順に並べた領域のリスト
+        self._next_order = 0
+
+    def __len__(self):
+        return len(self._regions)
+
+    def add(self, key, rect, mask=None, resolve=None):
+        """領域を登録（同じキーがあれば置き換え、後から登録したものが手前）
+
+        Args:
+            key (Hashable): 領域の識別子（判定結果として返す）
+            rect (pygame.Rect): 画面上の矩形
+            mask (pygame.mask.Mask | None): 画素単位の当たり判定（rect と同じ大きさ）
+            resolve (Callable[[tuple[int, int]], object] | None):
+                領域内の詳細（リストの行など）を求める関数。None を返すと外れ扱い
+        """
+        previous = self._regions.get(key)
+        order = previous.order if previous is not None else self._next_order
+        if previous is None:
+            self._next_order += 1
+        else:
+            self._unindex(previous)
+        region = HitRegion(key, rect.copy(), mask, resolve, order)
+        self._regions[key] = region
+        self._index(region)
+
+    def move(self, key, rect):
+        """登録済みの領域の位置・大きさを変更（レイアウト変更時に呼ぶ）"""
+        region = self._regions[key]
+        self._unindex(region)
+        region.rect = rect.copy()
+        self._index(region)
+
+    def remove(self, key):
+        """領域の登録を解除"""
+        region = self._regions.pop(key, None)
+        if region is not None:
+            self._unindex(region)
+
+    def hit(self, pos):
+        """クリック位置にある最も手前の領域を返す
+
+        Args:
+            pos (tuple[int, int]): クリック位置
+
+        Returns:
+            tuple[Hashable, object] | None: (キー, resolve の結果)。どこにも当たらなければNone
+        """
+        cell_size = self.cell_size
+        candidates = self._grid.get((pos[0] // cell_size, pos[1] // cell_size))
+        if not candidates:
+            return None
+        for region in candidates:
+            if not region.contains(pos):
+                continue
+            if region.resolve is None:
+                return region.key, None
+            detail = region.resolve(pos)
+            if detail is not None:
+                return region.key, detail
+        return None
+
+    def _index(self, region):
+        """領域が重なるセルへ登録"""
+        rect = region.rect
+        if rect.width <= 0 or rect.height <= 0:
+            region.cells = ()
+            return
+        cell_size = self.cell_size
+        cells = [
+            (cx, cy)
+            for cx in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1)
+            for cy in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1)
+        ]
+        for cell in cells:
+            bucket = self._grid.setdefault(cell, [])
+            bucket.append(region)
+            bucket.sort(key=lambda item: -item.order)
+        region.cells = cells
+
+    def _unindex(self, region):
+        """領域をセルから外す"""
+        for cell in region.cells:
+            bucket = self._grid[cell]
+            bucket.remove(region)
+            if not bucket:
+                del self._grid[cell]
+        region.cells = ()
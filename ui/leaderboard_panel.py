@@ -0,0 +1,96 @@
+"""リーダーボードの表示モジュール"""
+
+import pygame
+
+from .surface_cache import SurfaceLedger
+
+METRIC_LABELS = {
+    "level": "Level",
+    "best_wpm": "Best WPM",
+    "english_power": "English Power",
+}
+
+
+class LeaderboardPanel:
+    """リーダーボードの上位と自分の順位を表示するクラス
+
+    表示内容はクライアントのキャッシュから作り、キャッシュが
+    更新されたとき（revision の変化）だけサーフェスを作り直す。
+    """
+
+    PADDING = 8
+
+    def __init__(self, font, topright, text_color, bg_color, border_color, ledger=None):
+        """
+        Args:
+            font (pygame.font.Font): 表示用フォント
+            topright (tuple[int, int]): 表示位置の右上座標
+            text_color (tuple[int, int, int]): 文字色
+            bg_color (tuple[int, int, int]): 背景色
+            border_color (tuple[int, int, int]): 枠線と自分の行の色
+            ledger (SurfaceLedger | None): サーフェスの使用量を記録する台帳
+        """
+        self.font = font
+        self.topright = topright
+        self.text_color = text_color
+        self.bg_color = bg_color
+        self.border_color = border_color
+        self._cache_key = None
+        self._surface = None
+        self.ledger = ledger or SurfaceLedger()
+
+    def draw(self, surface, client, metric):
+        """リーダーボードを描画（データベースは待たない）
+
+        Args:
+            surface (pygame.Surface): 描画先
+            client (LeaderboardClient): リーダーボードのクライアント
+            metric (str): 表示する指標
+        """
+        key = (metric, client.revision, client.error)
+        if key != self._cache_key:
+            self._cache_key = key
+            self._surface = self._render(self._lines(client, metric))
+            self.ledger.account("layers", self, self._surface)
+        surface.blit(self._surface, self._surface.get_rect(topright=self.topright))
+
+    def _lines(self, client, metric):
+        """表示する行を (文字列, 強調するか) の並びで返す"""
+        lines = [(f"Leaderboard: {METRIC_LABELS[metric]}", False)]
+        if client.error is not None:
+            return lines + [(client.error, False)]
+        view = client.view(metric)
+        if view is None:
+            return lines + [("loading...", False)]
+        for place, (profile, value) in enumerate(view.top, start=1):
+            own = profile == client.profile
+            lines.append((f"{place}. {profile}  {_format_value(value)}", own))
+        if view.own is None:
+            lines.append(("You: not ranked yet", False))
+        else:
+            rank, value = view.own
+            lines.append((f"You: #{rank:,}  {_format_value(value)}", True))
+        return lines
+
+    def _render(self, lines):
+        """行を1枚のサーフェスにまとめてレンダリング"""
+        rendered = [
+            self.font.render(text, True, self.border_color if own else self.text_color)
+            for text, own in lines
+        ]
+        line_height = self.font.get_linesize()
+        width = max(item.get_width() for item in rendered) + self.PADDING * 2
+        height = line_height * len(rendered) + self.PADDING * 2
+        panel = pygame.Surface((width, height))
+        panel.fill(self.bg_color)
+        pygame.draw.rect(panel, self.border_color, panel.get_rect(), width=2, border_radius=6)
+        for idx, item in enumerate(rendered):
+            panel.blit(item, (self.PADDING, self.PADDING + idx * line_height))
+        return panel
+
+
+def _format_value(value):
+    """指標の値を表示用の文字列にする"""
+    if isinstance(value, float):
+        return f"{value:,.1f}"
+    return f"{value:,}"
@@ -0,0 +1,224 @@
+"""長文パッセージを複数行で表示するモジュール"""
+
+from collections import deque
+
+from matching import MatchRules
+from passage import iter_words, wrap_words
+
+from .surface_cache import SurfaceLedger
+
+
+class GlyphMetrics:
+    """フォントの文字幅キャッシュ
+
+    文字ごとの送り幅を初回だけフォントに問い合わせ、文字列幅はその合計で求める。
+    """
+
+    def __init__(self, font):
+        """
+        Args:
+            font (pygame.font.Font): 計測に使うフォント
+        """
+        self.font = font
+        self._advances = {}
+
+    def advance(self, char):
+        """1文字の送り幅"""
+        width = self._advances.get(char)
+        if width is None:
+            width = self.font.size(char)[0]
+            self._advances[char] = width
+        return width
+
+    def measure(self, text):
+        """文字列の描画幅（空白は表示用の「_」の幅で計測）"""
+        advance = self.advance
+        return sum(advance('_' if char == ' ' else char) for char in text)
+
+
+class ParagraphDisplay:
+    """長文パッセージのタイピング表示を管理するクラス
+
+    テキストはファイルから逐次読み込んで折り返し、表示中の数行だけを保持する。
+    入力位置が行末に達すると1行スクロールし、次の行を読み込む。
+    """
+
+    LINE_SPACING = 8
+
+    def __init__(
+        self,
+        font,
+        container_width,
+        container_height,
+        offset_x=0,
+        offset_y=0,
+        match_rules=None,
+        ledger=None
+    ):
+        """
+        Args:
+            font (pygame.font.Font): 英文表示用フォント
+            container_width (int): コンテナの幅
+            container_height (int): コンテナの高さ
+            offset_x (int): X方向のオフセット
+            offset_y (int): Y方向のオフセット
+            match_rules (MatchRules | None): 入力文字の照合ルール
+            ledger (SurfaceLedger | None): サーフェスの使用量を記録する台帳
+        """
+        self.ledger = ledger or SurfaceLedger()
+        self.font = font
+        self.metrics = GlyphMetrics(font)
+        self.container_width = container_width
+        self.container_height = container_height
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.line_height = font.get_linesize() + self.LINE_SPACING
+        self.visible_lines = max(1, container_height // self.line_height)
+        self.wrap_width = int(container_width * 0.9)
+
+        self.path = None
+        self.current_position = 0  # パッセージ先頭からの入力済み文字数
+        self.line_position = 0  # 先頭行内の入力位置
+        self.match_rules = match_rules or MatchRules()
+        self._expected = ""  # 照合用に正規化した先頭行
+        self.antialias = True
+        self.revision = 0  # 表示内容が変わるたびに増える
+        self.caret_pos = (offset_x + container_width // 2, offset_y + container_height // 2)
+
+        self._lines = deque()  # 表示中の行（先頭が入力中の行）
+        self._line_surfaces = deque()  # 2行目以降のレンダリング済みサーフェス
+        self._line_iter = iter(())
+        self._exhausted = True
+        self._current_cache = None  # (入力位置, 色, 入力済み, 未入力)
+
+    def open(self, path):
+        """パッセージファイルを開いて先頭から表示
+
+        Args:
+            path (str): テキストファイルのパス（UTF-8）
+        """
+        self.path = path
+        self.restart()
+
+    def restart(self):
+        """パッセージを先頭から読み直す"""
+        words = iter_words(self.path)
+        self._line_iter = wrap_words(
+            words, self.metrics.measure, self.wrap_width, self.metrics.advance('_')
+        )
+        self._exhausted = False
+        self._lines.clear()
+        self._line_surfaces.clear()
+        self._current_cache = None
+        self.current_position = 0
+        self.line_position = 0
+        self.revision += 1
+        self._fill_window()
+        self._compile_current_line()
+
+    def set_match_rules(self, match_rules):
+        """照合ルールを変更"""
+        self.match_rules = match_rules
+        self._compile_current_line()
+
+    def _compile_current_line(self):
+        """入力中の行を照合用に正規化"""
+        self._expected = self.match_rules.normalize(self._lines[0]) if self._lines else ""
+
+    def set_antialias(self, antialias):
+        """文字のアンチエイリアスを切り替え（キャッシュを破棄）"""
+        self.antialias = antialias
+        self._current_cache = None
+        for idx in range(len(self._line_surfaces)):
+            self._line_surfaces[idx] = None
+
+    def _fill_window(self):
+        """表示行数に達するまで次の行を読み込む"""
+        while not self._exhausted and len(self._lines) < self.visible_lines:
+            line = next(self._line_iter, None)
+            if line is None:
+                self._exhausted = True
+                break
+            self._lines.append(line)
+            self._line_surfaces.append(None)
+
+    def _advance_line(self):
+        """入力済みの先頭行を捨てて1行スクロール"""
+        self._lines.popleft()
+        self._line_surfaces.popleft()
+        self.line_position = 0
+        self._current_cache = None
+        self._fill_window()
+        self._compile_current_line()
+
+    def check_input(self, char):
+        """入力文字をチェック
+
+        Args:
+            char (str): 入力された文字
+
+        Returns:
+            bool: 正しい入力の場合True
+        """
+        if not self._lines:
+            return False
+        expected = self._expected
+        target = expected[self.line_position]
+        if char != target and self.match_rules.classes.get(char) != target:
+            return False
+
+        self.line_position += 1
+        self.current_position += 1
+        self.revision += 1
+        if self.line_position >= len(expected):
+            self._advance_line()
+        return True
+
+    def is_complete(self):
+        """パッセージを最後まで入力したかチェック"""
+        return self._exhausted and not self._lines
+
+    def draw(self, surface, color):
+        """表示中の行を描画（先頭行は入力済み部分をグレーで表示）"""
+        if not self._lines:
+            return
+        total_height = len(self._lines) * self.line_height - self.LINE_SPACING
+        top = self.offset_y + (self.container_height - total_height) // 2
+        left = self.offset_x + (self.container_width - self.wrap_width) // 2
+
+        previous_cache = self._current_cache
+        typed_surface, remaining_surface = self._current_line_surfaces(color)
+        rendered = self._current_cache is not previous_cache
+        surface.blit(typed_surface, (left, top))
+        caret_x = left + typed_surface.get_width()
+        surface.blit(remaining_surface, (caret_x, top))
+        self.caret_pos = (caret_x, top + typed_surface.get_height() // 2)
+
+        for idx in range(1, len(self._lines)):
+            line_surface = self._line_surfaces[idx]
+            if line_surface is None:
+                line_surface = self.font.render(
+                    self._lines[idx].replace(' ', '_'), self.antialias, color
+                )
+                self._line_surfaces[idx] = line_surface
+                rendered = True
+            surface.blit(line_surface, (left, top + idx * self.line_height))
+        if rendered:
+            self.ledger.account(
+                "sentences", self, self._current_cache[2:], *self._line_surfaces
+            )
+
+    def _current_line_surfaces(self, color):
+        """入力中の行のサーフェス（入力位置が変わったときだけ再レンダリング）"""
+        cache = self._current_cache
+        if cache is not None and cache[0] == self.line_position and cache[1] == color:
+            return cache[2], cache[3]
+        display_text = self._lines[0].replace(' ', '_')
+        typed_surface = self.font.render(
+            display_text[:self.line_position], self.antialias, (128, 128, 128)
+        )
+        remaining_surface = self.font.render(
+            display_text[self.line_position:], self.antialias, color
+        )
+        self._current_cache = (self.line_position, color, typed_surface, remaining_surface)
+        return typed_surface, remaining_surface
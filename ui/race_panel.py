@@ -0,0 +1,86 @@
+"""タイピングレースの順位表示モジュール"""
+
+import pygame
+
+from .surface_cache import SurfaceLedger
+
+
+class RacePanel:
+    """レースの順位を左上に表示するクラス
+
+    順位表はクライアントの revision が変わったときだけ作り直し、
+    それ以外のフレームはキャッシュしたサーフェスを転送するだけにする。
+    """
+
+    PADDING = 8
+    MAX_ROWS = 5
+
+    def __init__(self, font, topleft, text_color, bg_color, border_color, ledger=None):
+        """
+        Args:
+            font (pygame.font.Font): 順位表のフォント
+            topleft (tuple[int, int]): 表示位置の左上座標
+            text_color (tuple[int, int, int]): 文字色
+            bg_color (tuple[int, int, int]): 背景色
+            border_color (tuple[int, int, int]): 枠線と自分の行の色
+            ledger (SurfaceLedger | None): サーフェスの使用量を記録する台帳
+        """
+        self.font = font
+        self.topleft = topleft
+        self.text_color = text_color
+        self.bg_color = bg_color
+        self.border_color = border_color
+        self._cache_key = None
+        self._surface = None
+        self.ledger = ledger or SurfaceLedger()
+
+    def draw(self, surface, client):
+        """順位表を描画
+
+        Args:
+            surface (pygame.Surface): 描画先
+            client (RaceClient): レースのクライアント
+        """
+        key = (client.revision, client.error, client.entries is None)
+        if key != self._cache_key:
+            self._cache_key = key
+            self._surface = self._render(self._lines(client))
+            self.ledger.account("layers", self, self._surface)
+        surface.blit(self._surface, self.topleft)
+
+    def _lines(self, client):
+        """表示する行を (文字列, 自分の行か) の並びで返す"""
+        if client.error is not None:
+            return [(f"Race: {client.error}", False)]
+        if client.entries is None:
+            return [("Race: connecting...", False)]
+        total = max(client.total, 1)
+        lines = [(f"Race ({len(client.standings)} players)", False)]
+        own = None
+        for place, row in enumerate(client.standings, start=1):
+            progress, errors, rank, player_id, name = row
+            percent = "DONE" if rank else f"{progress * 100 // total}%"
+            text = (f"{place}. {name}  {percent}  miss {errors}", player_id == client.player_id)
+            if place <= self.MAX_ROWS:
+                lines.append(text)
+            elif text[1]:
+                own = text
+        if own is not None:
+            lines.append(own)  # 圏外でも自分の順位は表示する
+        return lines
+
+    def _render(self, lines):
+        """行を1枚のサーフェスにまとめてレンダリング"""
+        rendered = [
+            self.font.render(text, True, self.border_color if own else self.text_color)
+            for text, own in lines
+        ]
+        line_height = self.font.get_linesize()
+        width = max(item.get_width() for item in rendered) + self.PADDING * 2
+        height = line_height * len(rendered) + self.PADDING * 2
+        panel = pygame.Surface((width, height))
+        panel.fill(self.bg_color)
+        pygame.draw.rect(panel, self.border_color, panel.get_rect(), width=2, border_radius=6)
+        for idx, item in enumerate(rendered):
+            panel.blit(item, (self.PADDING, self.PADDING + idx * line_height))
+        return panel
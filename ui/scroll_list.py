@@ -0,0 +1,180 @@
+"""仮想化スクロールリストのUIコンポーネント"""
+
+import pygame
+
+from .surface_cache import SurfaceLedger
+
+
+class ScrollList:
+    """固定行高のスクロールリストを管理するクラス
+
+    表示範囲に入っている行だけをレイアウト・描画する。行の内容は
+    行サーフェスにキャッシュし、スクロールで画面外に出た行のサーフェスは
+    新しく表示される行に使い回す。クリック判定は行高の計算で求める。
+    """
+
+    SCROLLBAR_WIDTH = 6
+
+    def __init__(self, viewport, row_width, row_height, row_gap, padding_x=0, ledger=None):
+        """
+        Args:
+            viewport (pygame.Rect): リストの表示領域（画面座標）
+            row_width (int): 行の幅
+            row_height (int): 行の高さ
+            row_gap (int): 行間（先頭・末尾の余白にも使う）
+            padding_x (int): 表示領域左端から行までの余白
+            ledger (SurfaceLedger | None): サーフェスの使用量を記録する台帳
+        """
+        self.viewport = pygame.Rect(viewport)
+        self.row_width = int(row_width)
+        self.row_height = int(row_height)
+        self.row_gap = int(row_gap)
+        self.row_pitch = self.row_height + self.row_gap
+        self.padding_x = padding_x
+        self.item_count = 0
+        self.scroll_offset = 0
+
+        self._rows = {}  # アイテム番号 → [サーフェス, 内容キー]
+        self._free_surfaces = []
+        self.ledger = ledger or SurfaceLedger()
+
+    @property
+    def max_offset(self):
+        """スクロール量の上限"""
+        content_height = self.item_count * self.row_pitch + self.row_gap
+        return max(0, content_height - self.viewport.height)
+
+    def set_item_count(self, count):
+        """アイテム数を設定（スクロール量は範囲内に収める）"""
+        self.item_count = count
+        self.scroll_to(self.scroll_offset)
+
+    def scroll_to(self, offset):
+        """スクロール量を設定"""
+        self.scroll_offset = max(0, min(int(offset), self.max_offset))
+
+    def scroll_by(self, delta):
+        """スクロール量を相対的に変更"""
+        self.scroll_to(self.scroll_offset + delta)
+
+    def scroll_rows(self, rows):
+        """行単位でスクロール"""
+        self.scroll_by(rows * self.row_pitch)
+
+    def scroll_pages(self, pages):
+        """ページ単位でスクロール"""
+        page_rows = max(1, self.viewport.height // self.row_pitch)
+        self.scroll_rows(pages * page_rows)
+
+    def visible_range(self):
+        """表示範囲に入っているアイテム番号の範囲 [first, last)"""
+        top = self.scroll_offset - self.row_gap
+        first = max(0, top // self.row_pitch)
+        last = min(
+            self.item_count,
+            (top + self.viewport.height) // self.row_pitch + 1,
+        )
+        return first, last
+
+    def row_top(self, index):
+        """アイテムの行の上端（画面座標）"""
+        return (
+            self.viewport.top + self.row_gap
+            + index * self.row_pitch - self.scroll_offset
+        )
+
+    def hit_test(self, pos):
+        """画面座標からアイテム番号と行内座標を求める
+
+        Args:
+            pos (tuple[int, int]): 画面座標
+
+        Returns:
+            tuple[int, tuple[int, int]] | None: (アイテム番号, 行内座標)。行外ならNone
+        """
+        if not self.viewport.collidepoint(pos):
+            return None
+        local_x = pos[0] - self.viewport.left - self.padding_x
+        content_y = pos[1] - self.viewport.top + self.scroll_offset - self.row_gap
+        if content_y < 0 or not 0 <= local_x < self.row_width:
+            return None
+        index, local_y = divmod(content_y, self.row_pitch)
+        if index >= self.item_count or local_y >= self.row_height:
+            return None
+        return int(index), (int(local_x), int(local_y))
+
+    def draw(self, surface, render_row, row_key):
+        """表示範囲の行を描画
+
+        Args:
+            surface (pygame.Surface): 描画先
+            render_row (Callable[[pygame.Surface, int], None]):
+                行サーフェスにアイテムを描画する関数
+            row_key (Callable[[int], object]):
+                アイテムの表示内容を表すキー。変化したときだけ再描画する
+        """
+        first, last = self.visible_range()
+        self._recycle_hidden_rows(first, last)
+
+        previous_clip = surface.get_clip()
+        surface.set_clip(self.viewport)
+        left = self.viewport.left + self.padding_x
+        for index in range(first, last):
+            row_surface = self._row_surface(index, render_row, row_key)
+            surface.blit(row_surface, (left, self.row_top(index)))
+        self._draw_scrollbar(surface)
+        surface.set_clip(previous_clip)
+
+    def invalidate(self):
+        """全行のキャッシュを破棄（レイアウト変更時など）"""
+        for row_surface, _ in self._rows.values():
+            self._free_surfaces.append(row_surface)
+        self._rows.clear()
+
+    def _recycle_hidden_rows(self, first, last):
+        """画面外に出た行のサーフェスを回収"""
+        for index in [i for i in self._rows if not first <= i < last]:
+            self._free_surfaces.append(self._rows.pop(index)[0])
+
+    def _row_surface(self, index, render_row, row_key):
+        """行サーフェスを取得（内容が変わっていれば再描画）"""
+        key = row_key(index)
+        entry = self._rows.get(index)
+        if entry is None:
+            if self._free_surfaces:
+                row_surface = self._free_surfaces.pop()
+            else:
+                row_surface = pygame.Surface(
+                    (self.row_width, self.row_height), pygame.SRCALPHA
+                )
+                self._account(row_surface)
+            entry = [row_surface, None]
+            self._rows[index] = entry
+        if entry[1] != key:
+            entry[0].fill((0, 0, 0, 0))
+            render_row(entry[0], index)
+            entry[1] = key
+        return entry[0]
+
+    def _account(self, new_surface):
+        """確保済みの行サーフェス（使用中と回収済み）を台帳に記録"""
+        rows = [entry[0] for entry in self._rows.values()]
+        self.ledger.account("layers", self, new_surface, *rows, *self._free_surfaces)
+
+    def _draw_scrollbar(self, surface):
+        """スクロール可能な場合にスクロールバーを描画"""
+        max_offset = self.max_offset
+        if max_offset <= 0:
+            return
+        track_height = self.viewport.height - self.row_gap * 2
+        content_height = self.viewport.height + max_offset
+        thumb_height = max(24, track_height * self.viewport.height // content_height)
+        thumb_top = (
+            self.viewport.top + self.row_gap
+            + (track_height - thumb_height) * self.scroll_offset // max_offset
+        )
+        thumb = pygame.Rect(
+            self.viewport.right - self.SCROLLBAR_WIDTH - 4, thumb_top,
+            self.SCROLLBAR_WIDTH, thumb_height,
+        )
+        pygame.draw.rect(surface, (150, 150, 170), thumb, border_radius=3)
@@ -0,0 +1,76 @@
+"""次に出題する文章を先読みするモジュール"""
+
+from collections import deque
+
+
+class SentencePrefetcher:
+    """出題する文章を数件先に選び、表示準備を済ませておくクラス
+
+    準備（照合用の変換と文字のレンダリング）はフレームの空き時間に
+    ``fill`` で少しずつ行い、文章の完了時は ``advance`` で準備済みの
+    文章へ差し替えるだけにする。
+    """
+
+    def __init__(self, display, choose, color, depth=3):
+        """
+        Args:
+            display (TypingDisplay): 文章を表示する TypingDisplay
+            choose (Callable[[], tuple[str, str]]): 次の (英文, 日本語訳) を返す関数
+            color (tuple[int, int, int]): 描画色
+            depth (int): 先読みする件数
+        """
+        self.display = display
+        self.choose = choose
+        self.color = color
+        self.depth = depth
+        self.misses = 0  # 準備が間に合わず切り替え時にレンダリングした回数
+        self._queue = deque()
+
+    @property
+    def ready(self):
+        """準備済みの件数"""
+        return len(self._queue)
+
+    def fill(self, max_count=1):
+        """先読みが不足していれば準備する（1フレームで行う件数を制限）
+
+        Args:
+            max_count (int): このフレームで準備する最大件数
+        """
+        queue = self._queue
+        for _ in range(max_count):
+            if len(queue) >= self.depth:
+                return
+            english, japanese = self.choose()
+            queue.append(self.display.prepare_sentence(english, japanese, self.color))
+            self._account()
+
+    def advance(self):
+        """次の文章を表示（準備済みがなければその場で準備）"""
+        if not self._queue:
+            self.misses += 1
+            self.fill()
+        self.display.set_prepared(self._queue.popleft())
+        self._account()
+
+    def retain(self, keep):
+        """条件を満たす準備済みの文章だけを残す（出題元の文章が変わったときに呼ぶ）
+
+        Args:
+            keep (Callable[[PreparedSentence], bool]): 残す場合にTrueを返す関数
+        """
+        kept = [prepared for prepared in self._queue if keep(prepared)]
+        self._queue.clear()
+        self._queue.extend(kept)
+        self._account()
+
+    def invalidate(self):
+        """準備済みの文章を破棄（文字の描画設定が変わったときに呼ぶ）"""
+        self._queue.clear()
+        self._account()
+
+    def _account(self):
+        """準備済みの文章が保持するサーフェスを台帳に記録"""
+        self.display.ledger.account(
+            "sentences", self, *(prepared.surfaces for prepared in self._queue)
+        )
@@ -0,0 +1,213 @@
+"""サーフェスのメモリ使用量の記録と、予算つきキャッシュのモジュール"""
+
+from collections import OrderedDict
+
+
+def surface_bytes(surface):
+    """サーフェスが保持するピクセルデータのバイト数"""
+    return surface.get_pitch() * surface.get_height()
+
+
+def _value_bytes(value):
+    """キャッシュの値（サーフェス、またはサーフェスを含むタプル）のバイト数"""
+    if isinstance(value, (tuple, list)):
+        return sum(_value_bytes(item) for item in value)
+    if hasattr(value, 'get_pitch'):
+        return surface_bytes(value)
+    return 0
+
+
+class OwnerStats:
+    """所有者1つ分の集計"""
+
+    __slots__ = ('bytes', 'peak_bytes', 'entries', 'hits', 'misses', 'evictions')
+
+    def __init__(self):
+        self.bytes = 0
+        self.peak_bytes = 0
+        self.entries = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class SurfaceLedger:
+    """所有者ごとのサーフェスのメモリ使用量を記録し、全体の予算を守るクラス
+
+    所有者は "images" "text" "glyphs" "layers" "sentences" などの分類名。
+    SurfaceCache の項目は全キャッシュ共通の LRU に並び、合計が予算を超えると
+    最も長く使われていない項目から追い出す。``account`` で記録した
+    サーフェス（表示中の文章など、追い出せないもの）も合計には含める。
+    """
+
+    def __init__(self, budget_bytes=0):
+        """
+        Args:
+            budget_bytes (int): 予算（バイト、0 で無制限）
+        """
+        self.budget_bytes = budget_bytes
+        self.total_bytes = 0
+        self.peak_bytes = 0
+        self.owners = {}
+        self._held = {}  # (所有者, 枠) -> バイト数
+        self._lru = OrderedDict()  # (キャッシュ, キー) -> None（古い順）
+
+    def stats(self, owner):
+        """所有者の集計を返す（なければ作る）"""
+        stats = self.owners.get(owner)
+        if stats is None:
+            stats = self.owners[owner] = OwnerStats()
+        return stats
+
+    def cache(self, owner, loader=None):
+        """この台帳の予算に従うキャッシュを作る
+
+        Args:
+            owner (str): 所有者の分類名
+            loader (Callable[[object], object] | None): 未キャッシュのキーの値を作る関数
+
+        Returns:
+            SurfaceCache: キャッシュ
+        """
+        return SurfaceCache(self, owner, loader)
+
+    def account(self, owner, slot, *surfaces):
+        """追い出せないサーフェスを記録（同じ枠の前回分と置き換え、空なら解放）
+
+        Args:
+            owner (str): 所有者の分類名
+            slot (object): 保持している場所を表すキー（描画コンポーネント自身など）
+            *surfaces (pygame.Surface | None): 保持しているサーフェス
+        """
+        nbytes = sum(_value_bytes(surface) for surface in surfaces if surface is not None)
+        key = (owner, slot)
+        previous = self._held.pop(key, 0)
+        if nbytes:
+            self._held[key] = nbytes
+        if nbytes == previous:
+            return
+        stats = self.stats(owner)
+        stats.entries += bool(nbytes) - bool(previous)
+        self.change(stats, nbytes - previous)
+
+    @property
+    def cached_entries(self):
+        """追い出せるキャッシュ項目の数"""
+        return len(self._lru)
+
+    def set_budget(self, budget_bytes):
+        """予算を変更（減らした場合はすぐに追い出す）"""
+        self.budget_bytes = budget_bytes
+        self._enforce()
+
+    def change(self, stats, delta):
+        """使用量の増減を反映（増えた場合は予算を確認）"""
+        stats.bytes += delta
+        stats.peak_bytes = max(stats.peak_bytes, stats.bytes)
+        self.total_bytes += delta
+        if delta > 0:
+            self.peak_bytes = max(self.peak_bytes, self.total_bytes)
+            self._enforce()
+
+    def track(self, cache, key):
+        """キャッシュ項目を LRU の末尾（最新）に置く"""
+        self._lru[(cache, key)] = None
+        self._lru.move_to_end((cache, key))
+
+    def untrack(self, cache, key):
+        """キャッシュ項目を LRU から外す"""
+        self._lru.pop((cache, key), None)
+
+    def _enforce(self):
+        """予算を超えていれば古いキャッシュ項目から追い出す"""
+        budget = self.budget_bytes
+        if budget <= 0:
+            return
+        lru = self._lru
+        while self.total_bytes > budget and lru:
+            cache, key = next(iter(lru))
+            cache.evict(key)
+
+    def report(self):
+        """所有者ごとの使用量を複数行の文字列で返す"""
+        mib = 1024 * 1024
+        budget = f"{self.budget_bytes / mib:.1f} MiB" if self.budget_bytes else "unlimited"
+        lines = [
+            f"surfaces: {self.total_bytes / mib:.2f} MiB "
+            f"(peak {self.peak_bytes / mib:.2f} MiB, budget {budget})"
+        ]
+        for owner, stats in sorted(self.owners.items()):
+            lines.append(
+                f"  {owner:<10} {stats.bytes / 1024:10.1f} KiB  entries {stats.entries:5d}  "
+                f"hits {stats.hits:8d}  misses {stats.misses:6d}  evictions {stats.evictions:6d}"
+            )
+        return "\n".join(lines)
+
+
+class SurfaceCache:
+    """SurfaceLedger の予算に従う LRU キャッシュ
+
+    値はサーフェスか、サーフェスを含むタプル。loader を指定すると、
+    追い出された項目は次に使われたときに作り直す。
+    """
+
+    def __init__(self, ledger, owner, loader=None):
+        """
+        Args:
+            ledger (SurfaceLedger): 使用量を記録する台帳
+            owner (str): 所有者の分類名
+            loader (Callable[[object], object] | None): 未キャッシュのキーの値を作る関数
+        """
+        self.ledger = ledger
+        self.owner = owner
+        self.loader = loader
+        self.stats = ledger.stats(owner)
+        self._entries = {}  # キー -> (値, バイト数)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """値を返す（なければ loader で作る。loader もなければ default）"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.stats.hits += 1
+            self.ledger.track(self, key)
+            return entry[0]
+        self.stats.misses += 1
+        if self.loader is None:
+            return default
+        value = self.loader(key)
+        self.put(key, value)
+        return value
+
+    def put(self, key, value):
+        """値を登録（同じキーの前回分と置き換え）"""
+        self.discard(key)
+        nbytes = _value_bytes(value)
+        self._entries[key] = (value, nbytes)
+        self.stats.entries += 1
+        self.ledger.track(self, key)
+        self.ledger.change(self.stats, nbytes)
+
+    def discard(self, key):
+        """値を破棄"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.ledger.untrack(self, key)
+        self.stats.entries -= 1
+        self.ledger.change(self.stats, -entry[1])
+
+    def evict(self, key):
+        """予算超過のため値を破棄（台帳から呼ばれる）"""
+        self.discard(key)
+        self.stats.evictions += 1
+
+    def clear(self):
+        """すべての値を破棄"""
+        for key in list(self._entries):
+            self.discard(key)
@@ -0,0 +1,63 @@
+"""一定時間だけ表示する通知メッセージのモジュール"""
+
+from collections import deque
+
+import pygame
+
+
+class Toast:
+    """通知メッセージ（実績の解除など）を順番に一定時間表示するクラス"""
+
+    DURATION_MS = 2500
+    PADDING = 10
+
+    def __init__(self, font, center_x, top, text_color, bg_color, border_color):
+        """
+        Args:
+            font (pygame.font.Font): メッセージ用フォント
+            center_x (int): 表示位置の中央X座標
+            top (int): 表示位置の上端Y座標
+            text_color (tuple[int, int, int]): 文字色
+            bg_color (tuple[int, int, int]): 背景色
+            border_color (tuple[int, int, int]): 枠線の色
+        """
+        self.font = font
+        self.center_x = center_x
+        self.top = top
+        self.text_color = text_color
+        self.bg_color = bg_color
+        self.border_color = border_color
+        self._pending = deque()
+        self._surface = None  # 表示中のメッセージ（レンダリング済み）
+        self._remaining_ms = 0
+
+    @property
+    def active(self):
+        """表示中または表示待ちのメッセージがあるか"""
+        return self._surface is not None or bool(self._pending)
+
+    def show(self, text):
+        """メッセージを表示待ちに追加"""
+        self._pending.append(text)
+
+    def update(self, dt_ms):
+        """表示時間を進め、時間切れなら次のメッセージへ"""
+        if self._surface is not None:
+            self._remaining_ms -= dt_ms
+            if self._remaining_ms > 0:
+                return
+            self._surface = None
+        if self._pending:
+            self._surface = self.font.render(self._pending.popleft(), True, self.text_color)
+            self._remaining_ms = self.DURATION_MS
+
+    def draw(self, surface):
+        """表示中のメッセージを描画"""
+        text_surface = self._surface
+        if text_surface is None:
+            return
+        rect = text_surface.get_rect(midtop=(self.center_x, self.top + self.PADDING))
+        box = rect.inflate(self.PADDING * 2, self.PADDING * 2)
+        pygame.draw.rect(surface, self.bg_color, box, border_radius=8)
+        pygame.draw.rect(surface, self.border_color, box, width=2, border_radius=8)
+        surface.blit(text_surface, rect)
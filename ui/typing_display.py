@@ -1,5 +1,26 @@
 """タイピング用の英文を表示するモジュール"""
 
+from matching import MatchRules
+
+from .surface_cache import SurfaceLedger
+
+TYPED_COLOR = (128, 128, 128)
+
+
+class PreparedSentence:
+    """表示準備済みの文章（照合用の変換とレンダリングを済ませたもの）"""
+
+    __slots__ = ('english', 'japanese', 'expected', 'match_rules', 'antialias', 'color', 'surfaces')
+
+    def __init__(self, english, japanese, expected, match_rules, antialias, color, surfaces):
+        self.english = english
+        self.japanese = japanese
+        self.expected = expected
+        self.match_rules = match_rules
+        self.antialias = antialias
+        self.color = color
+        self.surfaces = surfaces  # (日本語, 入力済み, 未入力)
+
 
 class TypingDisplay:
     """タイピング練習用の英文を表示するクラス"""
@@ -11,7 +32,9 @@ class TypingDisplay:
         container_width,
         container_height,
         offset_x=0,
-        offset_y=0
+        offset_y=0,
+        match_rules=None,
+        ledger=None
     ):
         """
         Args:
@@ -21,7 +44,10 @@ class TypingDisplay:
             container_height (int): コンテナの高さ
             offset_x (int): X方向のオフセット
             offset_y (int): Y方向のオフセット
+            match_rules (MatchRules | None): 入力文字の照合ルール
+            ledger (SurfaceLedger | None): サーフェスの使用量を記録する台帳
         """
+        self.ledger = ledger or SurfaceLedger()
         self.english_font = english_font
         self.japanese_font = japanese_font
         self.container_width = container_width
@@ -30,7 +56,15 @@ class TypingDisplay:
         self.offset_y = offset_y
         self.english_text = ""
         self.japanese_text = ""
+        self.display_text = ""  # 空白を「_」に置き換えた表示用の英文
         self.current_position = 0  # 現在の入力位置
+        self.match_rules = match_rules or MatchRules()
+        self._char_classes = self.match_rules.classes
+        self._expected = ""  # 照合用に正規化した英文
+        self.antialias = True
+        self.revision = 0  # 表示内容が変わるたびに増える
+        self._surface_cache = None  # (入力位置, 色, サーフェス3つ)
+        self.caret_pos = (offset_x + container_width // 2, offset_y + container_height // 2)
 
     def set_sentence(self, english, japanese):
         """表示する文章を設定
@@ -39,9 +73,75 @@ class TypingDisplay:
             english (str): 英文
             japanese (str): 日本語訳
         """
+        self._show(english, japanese, self.match_rules.normalize(english))
+        self._set_surface_cache(None)
+
+    def prepare_sentence(self, english, japanese, color):
+        """文章の表示準備を先に済ませる（文章の切り替え時に描画処理を発生させないため）
+
+        Args:
+            english (str): 英文
+            japanese (str): 日本語訳
+            color (tuple[int, int, int]): 描画色
+
+        Returns:
+            PreparedSentence: set_prepared に渡す準備済みの文章
+        """
+        surfaces = (
+            self.japanese_font.render(japanese, self.antialias, color),
+            self.english_font.render("", self.antialias, TYPED_COLOR),
+            self.english_font.render(english.replace(' ', '_'), self.antialias, color),
+        )
+        return PreparedSentence(
+            english, japanese, self.match_rules.normalize(english),
+            self.match_rules, self.antialias, color, surfaces,
+        )
+
+    def set_prepared(self, prepared):
+        """準備済みの文章を表示（設定が変わっていれば描画時に作り直す）
+
+        Args:
+            prepared (PreparedSentence): prepare_sentence の戻り値
+        """
+        expected = prepared.expected
+        if prepared.match_rules is not self.match_rules:
+            expected = self.match_rules.normalize(prepared.english)
+        self._show(prepared.english, prepared.japanese, expected)
+        if prepared.antialias == self.antialias:
+            self._set_surface_cache((0, prepared.color, prepared.surfaces))
+        else:
+            self._set_surface_cache(None)
+
+    def _show(self, english, japanese, expected):
+        """表示中の文章を切り替え"""
         self.english_text = english
         self.japanese_text = japanese
+        self.display_text = english.replace(' ', '_')
+        self._expected = expected
         self.current_position = 0
+        self.revision += 1
+
+    def set_fonts(self, english_font, japanese_font):
+        """フォントを差し替え（コーパスパックの切り替え時。描画キャッシュは破棄）
+
+        Args:
+            english_font (pygame.font.Font): 入力する文のフォント
+            japanese_font (pygame.font.Font): 訳のフォント
+        """
+        self.english_font = english_font
+        self.japanese_font = japanese_font
+        self._set_surface_cache(None)
+
+    def set_match_rules(self, match_rules):
+        """照合ルールを変更（表示中の英文も照合し直せるよう再変換）"""
+        self.match_rules = match_rules
+        self._char_classes = match_rules.classes
+        self._expected = match_rules.normalize(self.english_text)
+
+    def set_antialias(self, antialias):
+        """文字のアンチエイリアスを切り替え（キャッシュを破棄）"""
+        self.antialias = antialias
+        self._set_surface_cache(None)
 
     def check_input(self, char):
         """入力文字をチェック
@@ -52,17 +152,17 @@ class TypingDisplay:
         Returns:
             bool: 正しい入力の場合True
         """
+        position = self.current_position
+        expected = self._expected
         # 全て入力済みの場合
-        if self.current_position >= len(self.english_text):
+        if position >= len(expected):
             return False
 
-        # 期待される文字（大文字小文字を区別する）
-        expected_char = self.english_text[self.current_position]
-        input_char = char
-
-        # 正しい入力の場合
-        if expected_char == input_char:
-            self.current_position += 1
+        # 期待文字は代表文字に変換済み。一致しなければ入力文字も代表文字にして比較
+        target = expected[position]
+        if char == target or self._char_classes.get(char) == target:
+            self.current_position = position + 1
+            self.revision += 1
             return True
 
         return False
@@ -90,17 +190,31 @@ class TypingDisplay:
         )
 
     def _render_text_surfaces(self, color):
-        """テキストサーフェスをレンダリング"""
-        gray_color = (128, 128, 128)
-        display_text = self.english_text.replace(' ', '_')
-        typed_part = display_text[:self.current_position]
-        remaining_part = display_text[self.current_position:]
-
-        japanese_surface = self.japanese_font.render(self.japanese_text, True, color)
-        typed_surface = self.english_font.render(typed_part, True, gray_color)
-        remaining_surface = self.english_font.render(remaining_part, True, color)
-
-        return japanese_surface, typed_surface, remaining_surface
+        """テキストサーフェスをレンダリング（入力位置が変わったときだけ）"""
+        cache = self._surface_cache
+        if cache is not None and cache[0] == self.current_position and cache[1] == color:
+            return cache[2]
+
+        typed_part = self.display_text[:self.current_position]
+        remaining_part = self.display_text[self.current_position:]
+
+        if cache is not None and cache[1] == color:
+            japanese_surface = cache[2][0]
+        else:
+            japanese_surface = self.japanese_font.render(
+                self.japanese_text, self.antialias, color
+            )
+        typed_surface = self.english_font.render(typed_part, self.antialias, TYPED_COLOR)
+        remaining_surface = self.english_font.render(remaining_part, self.antialias, color)
+
+        surfaces = (japanese_surface, typed_surface, remaining_surface)
+        self._set_surface_cache((self.current_position, color, surfaces))
+        return surfaces
+
+    def _set_surface_cache(self, cache):
+        """描画キャッシュを差し替え、保持しているサーフェスを台帳に記録"""
+        self._surface_cache = cache
+        self.ledger.account("sentences", self, cache and cache[2])
 
     def _calculate_text_positions(self, japanese_surface, typed_surface, remaining_surface):
         """テキストの描画位置を計算"""
@@ -126,7 +240,7 @@ class TypingDisplay:
         """テキストサーフェスを描画"""
         surface.blit(japanese_surface, positions['japanese_pos'])
         surface.blit(typed_surface, (positions['english_start_x'], positions['english_y']))
-        surface.blit(
-            remaining_surface,
-            (positions['english_start_x'] + typed_surface.get_width(), positions['english_y'])
-        )
+        caret_x = positions['english_start_x'] + typed_surface.get_width()
+        surface.blit(remaining_surface, (caret_x, positions['english_y']))
+        # エフェクトの発生位置として次の入力位置を記録
+        self.caret_pos = (caret_x, positions['english_y'] + typed_surface.get_height() // 2)
@@ -2,11 +2,16 @@
 
 import pygame
 
+from upgrades import EFFECT_PER_CLICK, EFFECT_PER_SECOND
+
+from .scroll_list import ScrollList
+from .surface_cache import SurfaceLedger
+
 
 class UIRenderer:
     """UI描画を管理するクラス"""
 
-    def __init__(self, config, fonts, left_width, right_width, screen_height):
+    def __init__(self, config, fonts, left_width, right_width, screen_height, ledger=None):
         """
         Args:
             config (Config): ゲーム設定
@@ -14,7 +19,9 @@ class UIRenderer:
             left_width (int): 左側領域の幅
             right_width (int): 右側領域の幅
             screen_height (int): 画面高さ
+            ledger (SurfaceLedger | None): サーフェスの使用量を記録する台帳
         """
+        ledger = ledger or SurfaceLedger()
         self.config = config
         self.label_font = fonts['label']
         self.right_label_font = fonts['right_label']
@@ -22,92 +29,154 @@ class UIRenderer:
         self.left_width = left_width
         self.right_width = right_width
         self.screen_height = screen_height
-        self.right_button_rects = []
+        self.visible_rows = config.PANEL_VISIBLE_ROWS
+
+        margin = 24
+        rect_height = (screen_height - margin * 4) / self.visible_rows
+        self.upgrade_list = ScrollList(
+            pygame.Rect(left_width, 0, right_width, screen_height),
+            right_width - margin * 2,
+            rect_height,
+            margin,
+            padding_x=margin,
+            ledger=ledger,
+        )
+        self._layout_params = None
+        self._panel_upgrades = None
+        self._panel_images = {}
 
-    def draw_right_panel(self, surface, game_state, right_images, right_image_max_width):
-        """右パネルのUI（長方形3つ）を描画"""
-        self.right_button_rects = []
-        layout_params = self._calculate_layout_params(right_image_max_width)
-        labels_data = self._prepare_labels_data(game_state)
+        self.level_bar_rect = self._create_level_bar_rect()
+        self._text_cache = ledger.cache("text")  # 描画位置の名前 → (文字列, サーフェス)
 
-        for i in range(3):
-            self._draw_panel_item(
-                surface, i, layout_params, right_images, labels_data
-            )
+    def invalidate(self):
+        """描画キャッシュを破棄（設定変更時など）"""
+        self._text_cache.clear()
+        self.upgrade_list.invalidate()
+
+    def draw_right_panel(self, surface, upgrades, right_images, right_image_max_width):
+        """右パネルのUI（解放済みアップグレードのスクロールリスト）を描画
+
+        Args:
+            surface (pygame.Surface): 描画先
+            upgrades (UpgradeRegistry): アップグレード一覧
+            right_images (SurfaceCache | dict[str, pygame.Surface]): アイコン名 → 画像
+            right_image_max_width (int): アイコン画像の最大幅
+        """
+        self._ensure_layout_params(right_image_max_width)
+        self._panel_upgrades = upgrades
+        self._panel_images = right_images
+        self.upgrade_list.set_item_count(len(upgrades.unlocked))
+        self.upgrade_list.draw(surface, self._render_upgrade_row, self._upgrade_row_key)
+
+    def upgrade_at(self, pos):
+        """クリック位置にある購入ボタンのアップグレード番号を返す
+
+        Args:
+            pos (tuple[int, int]): クリック位置
+
+        Returns:
+            int | None: アップグレード番号。ボタン外ならNone
+        """
+        if self._panel_upgrades is None:
+            return None
+        hit = self.upgrade_list.hit_test(pos)
+        if hit is None:
+            return None
+        row, local_pos = hit
+        unlocked = self._panel_upgrades.unlocked
+        if row >= len(unlocked) or not self._layout_params['button_rect'].collidepoint(local_pos):
+            return None
+        return unlocked[row]
+
+    def purchase_button_center(self, row):
+        """表示中の行の購入ボタン中央（画面座標）を返す（upgrade_at の逆）
+
+        Args:
+            row (int): 解放済みアップグレードの中での行番号
+
+        Returns:
+            tuple[int, int] | None: 画面座標。未描画または表示範囲外ならNone
+        """
+        if self._layout_params is None:
+            return None
+        first, last = self.upgrade_list.visible_range()
+        if not first <= row < last:
+            return None
+        button_rect = self._layout_params['button_rect']
+        return (
+            self.upgrade_list.viewport.left + self.upgrade_list.padding_x + button_rect.centerx,
+            self.upgrade_list.row_top(row) + button_rect.centery,
+        )
+
+    def _ensure_layout_params(self, right_image_max_width):
+        """行内レイアウトを計算（画像幅が変わったときだけ）"""
+        params = self._layout_params
+        if params is not None and params['image_max_width'] == right_image_max_width:
+            return
+        self._layout_params = self._calculate_layout_params(right_image_max_width)
+        self.upgrade_list.invalidate()
 
     def _calculate_layout_params(self, right_image_max_width):
-        """レイアウトパラメータの計算"""
-        margin = 24
-        rect_width = self.right_width - margin * 2
-        available_height = self.screen_height - margin * 4
-        rect_height = available_height / 3
+        """レイアウトパラメータの計算（行内のローカル座標）"""
+        rect_width = self.upgrade_list.row_width
+        rect_height = self.upgrade_list.row_height
         image_padding = 16
-        button_width = int(rect_width * 0.55)
-        button_height = int(rect_height * 0.28)
-
-        return {
-            'margin': margin,
-            'rect_width': rect_width,
-            'rect_height': rect_height,
+        layout_params = {
+            'image_max_width': right_image_max_width,
+            'row_rect': pygame.Rect(0, 0, rect_width, rect_height),
             'image_padding': image_padding,
-            'button_width': button_width,
-            'button_height': button_height,
+            'button_width': int(rect_width * 0.55),
+            'button_height': int(rect_height * 0.28),
             'button_padding_x': 16,
             'button_padding_y': 12,
-            'label_base_left': (
-                self.left_width + margin + image_padding
-                + right_image_max_width + image_padding
-            ),
+            'label_base_left': image_padding + right_image_max_width + image_padding,
         }
-
-    def _prepare_labels_data(self, game_state):
-        """ラベルデータの準備"""
-        return {
-            'labels': ["Typing Skill", "Auto Typing", "CPU"],
-            'sublabels': self._build_sublabels(game_state),
-            'level_labels': self._build_level_labels(game_state),
-            'costs': game_state['costs'],
-        }
-
-    def _build_sublabels(self, game_state):
-        """サブラベル文字列の構築"""
-        return [
-            f"+ {game_state['power_per_click']:,} Per Click",
-            f"+ {game_state['power_per_second']:,} Per Second",
-            f"× {game_state['multiplier']:.2f} All",
-        ]
-
-    def _build_level_labels(self, game_state):
-        """レベルラベル文字列の構築"""
-        return [
-            f"Level {game_state['practice_level']}",
-            f"Level {game_state['auto_level']}",
-            f"Level {game_state['multiplier_level']}",
-        ]
-
-    def _draw_panel_item(self, surface, idx, layout_params, right_images, labels_data):
-        """パネルアイテムの描画"""
-        rect = self._create_panel_rect(idx, layout_params)
-        self._draw_rect_background(surface, rect)
-        self._draw_rect_image(
-            surface, rect, right_images[idx], layout_params['image_padding']
+        layout_params['button_rect'] = self._create_button_rect(
+            layout_params['row_rect'], layout_params
         )
-
-        btn_rect = self._create_button_rect(rect, layout_params)
-        self._draw_panel_labels(
-            surface, rect, btn_rect, labels_data, idx
+        return layout_params
+
+    @staticmethod
+    def _build_sublabel(upgrades, upgrade):
+        """効果の種類に応じたサブラベル文字列の構築"""
+        if upgrade.effect == EFFECT_PER_CLICK:
+            return f"+ {upgrades.power_per_click:,} Per Click"
+        if upgrade.effect == EFFECT_PER_SECOND:
+            return f"+ {upgrades.power_per_second:,} Per Second"
+        return f"× {upgrades.multiplier:.2f} All"
+
+    def _upgrade_row_key(self, row):
+        """行の表示内容を表すキー（変化したときだけ行を再描画する）"""
+        upgrades = self._panel_upgrades
+        idx = upgrades.unlocked[row]
+        return (
+            idx, upgrades.levels[idx], upgrades.costs[idx],
+            self._build_sublabel(upgrades, upgrades.defs[idx]),
         )
-        self._draw_button(surface, btn_rect, labels_data['costs'][idx])
-        self.right_button_rects.append(btn_rect)
-
-    def _create_panel_rect(self, idx, layout_params):
-        """パネル矩形の作成"""
-        margin = layout_params['margin']
-        top = margin + idx * (layout_params['rect_height'] + margin)
-        rect_x = self.left_width + margin
-        return pygame.Rect(
-            rect_x, top, layout_params['rect_width'], layout_params['rect_height']
+
+    def _render_upgrade_row(self, row_surface, row):
+        """行サーフェスにアップグレード1件を描画"""
+        upgrades = self._panel_upgrades
+        idx = upgrades.unlocked[row]
+        upgrade = upgrades.defs[idx]
+        layout_params = self._layout_params
+        rect = layout_params['row_rect']
+
+        self._draw_rect_background(row_surface, rect)
+        image = self._panel_images.get(upgrade.icon) if upgrade.icon else None
+        if image is not None:
+            self._draw_rect_image(
+                row_surface, rect, image, layout_params['image_padding']
+            )
+
+        btn_rect = layout_params['button_rect']
+        labels = (
+            upgrade.name,
+            self._build_sublabel(upgrades, upgrade),
+            f"Level {upgrades.levels[idx]}",
         )
+        self._draw_panel_labels(row_surface, rect, btn_rect, labels)
+        self._draw_button(row_surface, btn_rect, upgrades.costs[idx])
 
     def _create_button_rect(self, rect, layout_params):
         """ボタン矩形の作成"""
@@ -141,22 +210,21 @@ class UIRenderer:
         img_rect.centery = rect.centery
         surface.blit(img, img_rect)
 
-    def _draw_panel_labels(self, surface, rect, btn_rect, labels_data, idx):
-        """パネルラベルの描画"""
-        self._draw_main_label(
-            surface, rect, labels_data['labels'][idx], btn_rect.left
-        )
-        self._draw_sublabel(
-            surface, rect, labels_data['sublabels'][idx], btn_rect.left
-        )
-        self._draw_level_label(
-            surface, btn_rect, labels_data['level_labels'][idx]
-        )
+    def _draw_panel_labels(self, surface, rect, btn_rect, labels):
+        """パネルラベルの描画
+
+        Args:
+            labels (tuple[str, str, str]): (名前, サブラベル, レベル表示)
+        """
+        label, sublabel, level_label = labels
+        self._draw_main_label(surface, rect, label, btn_rect.left)
+        self._draw_sublabel(surface, rect, sublabel, btn_rect.left)
+        self._draw_level_label(surface, btn_rect, level_label)
 
     def _draw_main_label(self, surface, rect, label, left):
         """メインラベルを描画"""
         label_surface = self.right_label_font.render(
-            label, True, self.config.TEXT_COLOR
+            label, self.config.ANTIALIAS, self.config.TEXT_COLOR
         )
         label_rect = label_surface.get_rect()
         label_rect.left = left
@@ -166,7 +234,7 @@ class UIRenderer:
     def _draw_sublabel(self, surface, rect, sublabel, left):
         """サブラベルを描画"""
         sub_surface = self.right_sublabel_font.render(
-            sublabel, True, self.config.TEXT_COLOR
+            sublabel, self.config.ANTIALIAS, self.config.TEXT_COLOR
         )
         sub_rect = sub_surface.get_rect()
         sub_rect.left = left
@@ -176,7 +244,7 @@ class UIRenderer:
     def _draw_level_label(self, surface, btn_rect, level_label):
         """レベルラベルを描画"""
         level_surface = self.label_font.render(
-            level_label, True, self.config.TEXT_COLOR
+            level_label, self.config.ANTIALIAS, self.config.TEXT_COLOR
         )
         level_rect = level_surface.get_rect()
         level_rect.centerx = btn_rect.centerx
@@ -195,17 +263,40 @@ class UIRenderer:
 
         cost_text = f"Cost: {cost:,}"
         cost_surface = self.right_sublabel_font.render(
-            cost_text, True, self.config.TEXT_COLOR
+            cost_text, self.config.ANTIALIAS, self.config.TEXT_COLOR
         )
         cost_rect = cost_surface.get_rect(center=btn_rect.center)
         surface.blit(cost_surface, cost_rect)
 
-    def draw_level_bar(self, surface, level_state):
-        """左下にレベル進捗バーを描画"""
-        bar_rect = self._create_level_bar_rect()
+    def _render_text_cached(self, slot, font, text):
+        """文字列が前回と同じならキャッシュ済みのサーフェスを返す
+
+        Args:
+            slot (str): 描画位置の名前（位置ごとに1枚だけ保持）
+            font (pygame.font.Font): フォント
+            text (str): 描画する文字列
+
+        Returns:
+            pygame.Surface: 文字列のサーフェス
+        """
+        cached = self._text_cache.get(slot)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        text_surface = font.render(text, self.config.ANTIALIAS, self.config.TEXT_COLOR)
+        self._text_cache.put(slot, (text, text_surface))
+        return text_surface
+
+    def draw_level_bar(self, surface, game_state):
+        """左下にレベル進捗バーを描画
+
+        Args:
+            surface (pygame.Surface): 描画先
+            game_state (GameState): ゲーム状態（派生値はキャッシュ済みのものを使う）
+        """
+        bar_rect = self.level_bar_rect
         self._draw_level_bar_background(surface, bar_rect)
-        self._draw_level_bar_progress(surface, bar_rect, level_state['progress'])
-        self._draw_level_bar_labels(surface, bar_rect, level_state)
+        self._draw_level_bar_progress(surface, bar_rect, game_state.level_progress)
+        self._draw_level_bar_labels(surface, bar_rect, game_state)
 
     def _create_level_bar_rect(self):
         """レベルバーの矩形を作成"""
@@ -237,22 +328,22 @@ class UIRenderer:
             )
 
         percent_text = f"{progress * 100:5.1f}%"
-        percent_surface = self.right_sublabel_font.render(
-            percent_text, True, self.config.TEXT_COLOR
+        percent_surface = self._render_text_cached(
+            'level_percent', self.right_sublabel_font, percent_text
         )
         percent_rect = percent_surface.get_rect(center=bar_rect.center)
         surface.blit(percent_surface, percent_rect)
 
-    def _draw_level_bar_labels(self, surface, bar_rect, level_state):
+    def _draw_level_bar_labels(self, surface, bar_rect, game_state):
         """レベルバーのラベルを描画"""
-        level_text = f"Lv {level_state['level']}"
-        next_text = f"Next: {level_state['next_xp']:,} XP"
+        level_text = f"Lv {game_state.level}"
+        next_text = f"Next: {game_state.next_level_xp:,} XP"
 
-        level_surface = self.right_sublabel_font.render(
-            level_text, True, self.config.TEXT_COLOR
+        level_surface = self._render_text_cached(
+            'level', self.right_sublabel_font, level_text
         )
-        next_surface = self.right_sublabel_font.render(
-            next_text, True, self.config.TEXT_COLOR
+        next_surface = self._render_text_cached(
+            'level_next', self.right_sublabel_font, next_text
         )
 
         level_rect = level_surface.get_rect()
@@ -0,0 +1,215 @@
+"""アップグレード定義の読み込みと派生値を管理するモジュール"""
+
+import copy
+import json
+
+from game_logic import GameLogic
+
+EFFECT_PER_CLICK = "per_click"
+EFFECT_PER_SECOND = "per_second"
+EFFECT_MULTIPLIER = "multiplier"
+EFFECT_TYPES = (EFFECT_PER_CLICK, EFFECT_PER_SECOND, EFFECT_MULTIPLIER)
+
+
+class UpgradeDef:
+    """アップグレード1種類分の定義"""
+
+    __slots__ = (
+        'id', 'name', 'base_cost', 'growth', 'effect', 'amount', 'icon',
+        'unlock_level', 'unlock_requires', 'unlock_requires_level',
+    )
+
+    def __init__(self, data):
+        """
+        Args:
+            data (dict): upgrades.json の1エントリ
+        """
+        self.id = str(data['id'])
+        self.name = str(data.get('name', self.id))
+        self.base_cost = int(data['base_cost'])
+        self.growth = float(data['growth'])
+        self.effect = data['effect']
+        self.amount = data['amount']
+        self.icon = data.get('icon')
+
+        unlock = data.get('unlock') or {}
+        self.unlock_level = int(unlock.get('player_level', 0))
+        self.unlock_requires = unlock.get('requires')
+        self.unlock_requires_level = int(unlock.get('requires_level', 1))
+
+        if self.effect not in EFFECT_TYPES:
+            raise ValueError(f"upgrade '{self.id}': unknown effect '{self.effect}'")
+        if self.base_cost <= 0 or self.growth <= 1.0:
+            raise ValueError(f"upgrade '{self.id}': base_cost/growth out of range")
+
+
+class UpgradeRegistry:
+    """アップグレード一覧と、その派生値を管理するクラス
+
+    各アップグレードの次回コストと、クリック・毎秒・倍率の合計値は
+    レベルが変化したときだけ差分更新する。描画側はキャッシュを読むだけ。
+    """
+
+    def __init__(self, defs, base_per_click=1, base_per_second=0):
+        """
+        Args:
+            defs (list[UpgradeDef]): アップグレード定義の一覧（表示順）
+            base_per_click (int): アップグレードなしのクリック当たりパワー
+            base_per_second (int): アップグレードなしの毎秒パワー
+        """
+        self.defs = defs
+        self.index_by_id = {}
+        for idx, upgrade in enumerate(defs):
+            if upgrade.id in self.index_by_id:
+                raise ValueError(f"duplicate upgrade id '{upgrade.id}'")
+            self.index_by_id[upgrade.id] = idx
+        for upgrade in defs:
+            if upgrade.unlock_requires and upgrade.unlock_requires not in self.index_by_id:
+                raise ValueError(
+                    f"upgrade '{upgrade.id}': unknown requirement '{upgrade.unlock_requires}'"
+                )
+
+        self.base_per_click = base_per_click
+        self.base_per_second = base_per_second
+        self._multiplier_indices = [
+            idx for idx, upgrade in enumerate(defs) if upgrade.effect == EFFECT_MULTIPLIER
+        ]
+
+        self.levels = [0] * len(defs)
+        self.costs = [0] * len(defs)
+        self.unlocked = []
+        self.power_per_click_base = base_per_click
+        self.power_per_second_base = base_per_second
+        self.multiplier = 1.0
+        self.power_per_click = base_per_click
+        self.power_per_second = base_per_second
+        self.revision = 0  # レベル・解放状態が変わるたびに増える
+        self.set_levels({})
+
+    @classmethod
+    def load(cls, path):
+        """JSONファイルからレジストリを構築
+
+        Args:
+            path (str): upgrades.json のパス
+
+        Returns:
+            UpgradeRegistry: 構築したレジストリ
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        base = data.get('base', {})
+        defs = [UpgradeDef(entry) for entry in data['upgrades']]
+        return cls(
+            defs,
+            base_per_click=int(base.get('power_per_click', 1)),
+            base_per_second=int(base.get('power_per_second', 0)),
+        )
+
+    def __len__(self):
+        return len(self.defs)
+
+    def clone(self):
+        """レベルと派生値を複製したレジストリを返す（定義は共有）"""
+        other = copy.copy(self)
+        other.levels = list(self.levels)
+        other.costs = list(self.costs)
+        other.unlocked = list(self.unlocked)
+        return other
+
+    def set_levels(self, levels_by_id, player_level=1):
+        """保存データなどからレベルを一括設定し、キャッシュを再構築
+
+        Args:
+            levels_by_id (dict[str, int]): アップグレードID → レベル
+            player_level (int): プレイヤーレベル（解放判定用）
+        """
+        self.levels = [
+            max(0, int(levels_by_id.get(upgrade.id, 0))) for upgrade in self.defs
+        ]
+        self.costs = [
+            GameLogic.upgrade_cost(upgrade.base_cost, upgrade.growth, level)
+            for upgrade, level in zip(self.defs, self.levels)
+        ]
+        self.power_per_click_base = self.base_per_click
+        self.power_per_second_base = self.base_per_second
+        for upgrade, level in zip(self.defs, self.levels):
+            if upgrade.effect == EFFECT_PER_CLICK:
+                self.power_per_click_base += upgrade.amount * level
+            elif upgrade.effect == EFFECT_PER_SECOND:
+                self.power_per_second_base += upgrade.amount * level
+        self._recalc_multiplier()
+        self.refresh_unlocks(player_level)
+
+    def levels_by_id(self):
+        """保存用にID → レベルの辞書を返す"""
+        return {
+            upgrade.id: level for upgrade, level in zip(self.defs, self.levels) if level
+        }
+
+    def level_of(self, upgrade_id):
+        """指定IDのアップグレードのレベル"""
+        return self.levels[self.index_by_id[upgrade_id]]
+
+    def purchase(self, idx):
+        """アップグレードのレベルを1上げ、影響するキャッシュだけ更新
+
+        Args:
+            idx (int): アップグレードのインデックス
+        """
+        upgrade = self.defs[idx]
+        level = self.levels[idx] + 1
+        self.levels[idx] = level
+        self.revision += 1
+        self.costs[idx] = GameLogic.upgrade_cost(upgrade.base_cost, upgrade.growth, level)
+
+        if upgrade.effect == EFFECT_PER_CLICK:
+            self.power_per_click_base += upgrade.amount
+            self._recalc_totals()
+        elif upgrade.effect == EFFECT_PER_SECOND:
+            self.power_per_second_base += upgrade.amount
+            self._recalc_totals()
+        else:
+            self._recalc_multiplier()
+
+    def refresh_unlocks(self, player_level):
+        """解放済みアップグレードの一覧を更新
+
+        レベルアップ・購入時にだけ呼ぶ（毎フレームは呼ばない）。
+
+        Args:
+            player_level (int): プレイヤーレベル
+        """
+        self.unlocked = [
+            idx for idx, upgrade in enumerate(self.defs)
+            if self._is_unlocked(upgrade, player_level)
+        ]
+        self.revision += 1
+
+    def _is_unlocked(self, upgrade, player_level):
+        """解放条件を満たしているか判定"""
+        if player_level < upgrade.unlock_level:
+            return False
+        if upgrade.unlock_requires:
+            required = self.levels[self.index_by_id[upgrade.unlock_requires]]
+            return required >= upgrade.unlock_requires_level
+        return True
+
+    def _recalc_multiplier(self):
+        """倍率系アップグレードの積を再計算"""
+        multiplier = 1.0
+        for idx in self._multiplier_indices:
+            multiplier *= GameLogic.current_multiplier(
+                self.levels[idx], self.defs[idx].amount
+            )
+        self.multiplier = multiplier
+        self._recalc_totals()
+
+    def _recalc_totals(self):
+        """倍率適用後のクリック・毎秒パワーを更新"""
+        self.power_per_click = GameLogic.current_power_per_click(
+            self.power_per_click_base, self.multiplier
+        )
+        self.power_per_second = GameLogic.current_power_per_second(
+            self.power_per_second_base, self.multiplier
+        )